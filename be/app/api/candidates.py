@@ -0,0 +1,62 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional, Literal
+from app.core.replica import get_read_db
+from app.core.candidates import candidate_index, candidate_summary, normalize
+from app.models.job import CandidateSearchPage
+from app.api.session_auth import get_current_user_from_session as get_current_user
+
+router = APIRouter()
+
+# Skills accepted in one query; each adds a posting list to the scan
+MAX_SEARCH_SKILLS = 20
+
+@router.get("/search", response_model=CandidateSearchPage)
+async def search_candidates(
+    skills: Optional[str] = Query(None, description="Comma-separated skills"),
+    match: Literal["any", "all"] = "any",
+    state: Optional[str] = None,
+    city: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
+    """Search job seekers by skills (any or all of them), state and city.
+
+    Candidates with the most matching skills come first. Served from the
+    in-memory candidate index; profiles are then loaded for one page. Hits
+    carry no contact details: employers see those only for their applicants.
+    """
+    try:
+        if current_user["profile"].role != "employer":
+            raise HTTPException(status_code=403, detail="Only employers can search candidates")
+
+        terms = [skill for skill in (skills or "").split(",") if skill.strip()]
+        if len(terms) > MAX_SEARCH_SKILLS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_SEARCH_SKILLS} skills per search")
+        if not terms and not (state and state.strip()) and not (city and city.strip()):
+            raise HTTPException(status_code=400, detail="Provide skills, state or city")
+
+        total, matches = await candidate_index.search(terms, match == "all", state, city, limit, offset)
+        if not matches:
+            return {"total": total, "items": []}
+
+        profiles = await db.userprofile.find_many(
+            where={"id": {"in": [profile_id for profile_id, _ in matches]}}
+        )
+        profiles_by_id = {profile.id: profile for profile in profiles}
+        wanted = {normalize(term) for term in terms}
+        items = []
+        for profile_id, _ in matches:
+            profile = profiles_by_id.get(profile_id)
+            if profile is None:
+                continue
+            items.append({
+                "matchedSkills": [skill for skill in profile.skills or [] if normalize(skill) in wanted],
+                "candidate": candidate_summary(profile),
+            })
+        return {"total": total, "items": items}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
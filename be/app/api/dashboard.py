@@ -0,0 +1,80 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Query
+from app.core.replica import get_read_db
+from app.models.user import UserProfile
+from app.api.session_auth import get_current_user_from_session as get_current_user
+from app.core.job_queries import (
+    build_job_filters, fetch_job_postings, fetch_application_history,
+    fetch_applied_job_ids, fetch_employer_job_postings, fetch_employer_applications
+)
+
+router = APIRouter()
+
+async def _location_state_name(user_profile, db):
+    if not user_profile.locationState:
+        return None
+    state = await db.usstate.find_unique(where={"id": user_profile.locationState})
+    return state.name if state else None
+
+def _profile_response(user_profile, location_state_name):
+    profile_dict = user_profile.model_dump(by_alias=True)
+    profile_dict["locationStateName"] = location_state_name
+    return UserProfile(**profile_dict)
+
+# The session check already loads the profile, so each dashboard reuses it
+# and runs the remaining independent queries concurrently.
+
+@router.get("/seeker")
+async def get_seeker_dashboard(
+    limit: int = Query(20, le=100),
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
+    """Profile, applications, applied job ids and the first page of jobs in one response"""
+    try:
+        user_profile = current_user["profile"]
+        if user_profile.role != "job_seeker":
+            raise HTTPException(status_code=403, detail="Only job seekers can view the seeker dashboard")
+
+        location_state_name, applications, applied_job_ids, job_postings = await asyncio.gather(
+            _location_state_name(user_profile, db),
+            fetch_application_history(user_profile, limit, db=db),
+            fetch_applied_job_ids(user_profile),
+            fetch_job_postings(build_job_filters(), limit, 0, db),
+        )
+        return {
+            "profile": _profile_response(user_profile, location_state_name),
+            "applications": applications,
+            "appliedJobIds": applied_job_ids,
+            "jobPostings": job_postings,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.get("/employer")
+async def get_employer_dashboard(
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
+    """Profile, job postings with application counts and received applications in one response"""
+    try:
+        user_profile = current_user["profile"]
+        if user_profile.role != "employer":
+            raise HTTPException(status_code=403, detail="Only employers can view the employer dashboard")
+
+        location_state_name, job_postings, applications = await asyncio.gather(
+            _location_state_name(user_profile, db),
+            fetch_employer_job_postings(user_profile, db),
+            fetch_employer_applications(user_profile, db),
+        )
+        return {
+            "profile": _profile_response(user_profile, location_state_name),
+            "jobPostings": job_postings,
+            "applications": applications,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from app.core.events import event_hub, format_sse
+from app.api.session_auth import get_current_user_from_session
+
+router = APIRouter()
+
+# Comment frames keep idle connections open through proxies
+HEARTBEAT_SECONDS = 15
+
+@router.get("/stream")
+async def stream_events(request: Request, current_user = Depends(get_current_user_from_session)):
+    """Server-sent event stream of application changes for the current user.
+
+    Employers receive `application.created` when someone applies to one of
+    their postings; seekers receive `application.status_changed`. A
+    `resync` event means events were dropped and the client should refetch.
+    The stream ends when the worker drains for shutdown and the browser's
+    EventSource reconnects after the `retry` delay.
+    """
+    subscription = event_hub.subscribe(current_user["id"])
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            # A closed subscription means this worker is draining; the client reconnects elsewhere
+            while not subscription.closed and not await request.is_disconnected():
+                event = await subscription.get(HEARTBEAT_SECONDS)
+                if subscription.closed:
+                    break
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            event_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, Query
 from datetime import datetime, timedelta
-import jwt
 from app.core.config import settings
 from app.api.session_auth import get_current_user_from_session
 
+# jwt and the signaling hub are imported inside the handlers: few requests
+# reach this router, so they stay out of the process's cold start
+
 router = APIRouter()
 
 @router.post("/token")
@@ -15,6 +17,7 @@ async def mint_interview_token(
     """Mint a short-lived JWT for interview rooms (RTC/WebSocket).
     Claims include room, user, role, and a short expiration.
     """
+    import jwt
     try:
         if role not in ["participant", "interviewer", "observer"]:
             raise HTTPException(status_code=400, detail="Invalid role")
@@ -34,3 +37,45 @@ async def mint_interview_token(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.websocket("/ws/{room_id}")
+async def interview_signaling(websocket: WebSocket, room_id: str, token: str = Query(...)):
+    """Signaling channel for an interview room.
+
+    Connect with a token from `/token`. Clients send `offer`, `answer` and
+    `ice` messages with an optional `to` peer id and receive `room.state`,
+    `peer.joined`, `peer.left` and relayed messages.
+    """
+    import jwt
+    from app.core.signaling import signaling_hub, SignalingError, CLOSE_WRONG_SHARD
+    try:
+        claims = jwt.decode(token, settings.interview_token_secret, algorithms=["HS256"])
+    except jwt.InvalidTokenError:
+        await websocket.close(code=4401)
+        return
+    if claims.get("room") != room_id:
+        await websocket.close(code=4403)
+        return
+    if not signaling_hub.owns_room(room_id):
+        await websocket.close(code=CLOSE_WRONG_SHARD)
+        return
+
+    await websocket.accept()
+    try:
+        peer = signaling_hub.join(
+            room_id, claims["sub"], claims.get("role", "participant"),
+            websocket.send_json, lambda code: websocket.close(code=code),
+        )
+    except SignalingError:
+        await websocket.close(code=4400)
+        return
+    try:
+        while not peer.closed:
+            message = await websocket.receive_json()
+            try:
+                signaling_hub.relay(room_id, peer, message)
+            except SignalingError as e:
+                peer.enqueue({"type": "error", "detail": str(e)})
+    except (WebSocketDisconnect, ValueError, RuntimeError):
+        pass
+    finally:
+        signaling_hub.leave(room_id, peer)
@@ -1,37 +1,103 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Optional, List
+import csv
+import io
+import json
+import tempfile
+import uuid
+from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from typing import Optional, List, Literal
+from datetime import datetime, timedelta, timezone
 from app.models.job import (
     JobPosting, JobPostingCreate, JobPostingUpdate,
     JobApplication, JobApplicationCreate, JobApplicationUpdate,
-    JobCategory, USState
+    JobCategory, USState, JobFacets, FacetCount, Suggestion,
+    JobRecommendation, CandidateMatch, SavedSearch, SavedSearchCreate, JobAlert,
+    ApplicationStatus, ApplicationHistoryPage, ApplicationBulkStatusUpdate, ApplicationBulkStatusResult, SkippedApplication
 )
-from app.core.database import prisma
+from app.core.config import settings
+from app.core.database import prisma, prisma_read
+from app.core.replica import get_read_db
 from app.api.session_auth import get_current_user_from_session as get_current_user
 from app.core.csrf import csrf_protect
+from app.core.search import SALARY_BANDS, UNSPECIFIED_SALARY_BAND, salary_band_sql
+from app.core.suggest import job_suggest
+from app.core.recommend import job_recommender
+from app.core.candidates import candidate_summary
+from app.core.alerts import job_alerts
+from app.core.events import event_hub
+from app.core.applied_cache import applied_jobs_cache
+from app.core.cache import job_detail_cache, job_listing_cache
+from app.core.compression import CachedBody
+from app.core.bulk_import import BulkImportError, iter_csv_rows, iter_ndjson_rows
+from app.core.dedupe import duplicate_index, posting_text, release_duplicates
+from app.core.geo import (
+    DEFAULT_RADIUS_MILES, MAX_RADIUS_MILES,
+    parse_near, grid_cell, geocode_location
+)
+from app.core.job_queries import (
+    build_job_filters, job_filter_sql, fetch_job_postings, fetch_nearby_job_postings,
+    fetch_employer_job_postings, fetch_archived_job_postings, fetch_employer_applications,
+    fetch_archived_applications, fetch_application_history, fetch_applied_job_ids, timestamp_param
+)
 
 router = APIRouter()
 
+_JOB_POSTING_LIST = TypeAdapter(List[JobPosting])
+
 
 # Job Categories
 @router.get("/categories", response_model=List[JobCategory])
-async def get_job_categories():
+async def get_job_categories(db = Depends(get_read_db)):
     """Get all job categories"""
     try:
-        categories = await prisma.jobcategory.find_many()
+        categories = await db.jobcategory.find_many()
         return categories
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 # US States
 @router.get("/states", response_model=List[USState])
-async def get_us_states():
+async def get_us_states(db = Depends(get_read_db)):
     """Get all US states"""
     try:
-        states = await prisma.usstate.find_many()
+        states = await db.usstate.find_many()
         return states
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+VALID_APPLICATION_STEPS = ["personal_info", "technical_assessment", "review_submit"]
+
+def _application_step_error(steps: Optional[List[str]]) -> Optional[str]:
+    for step in steps or []:
+        if step not in VALID_APPLICATION_STEPS:
+            return f"Invalid application step: {step}. Valid steps are: {', '.join(VALID_APPLICATION_STEPS)}"
+    return None
+
+def _index_job_posting(job_posting, signature=None):
+    """Reflect a created or updated posting in the in-memory indexes"""
+    job_suggest.add_job(job_posting)
+    job_recommender.add_job(job_posting)
+    duplicate_index.index(job_posting, signature)
+    job_listing_cache.bump(job_posting.categoryId, job_posting.locationState)
+
+def _unindex_job_posting(job_posting):
+    """Drop a posting's previous state from the in-memory indexes"""
+    job_suggest.remove_job(job_posting)
+    job_recommender.remove_job(job_posting)
+    duplicate_index.unindex(job_posting.id)
+    job_detail_cache.invalidate(job_posting.id)
+    job_listing_cache.bump(job_posting.categoryId, job_posting.locationState)
+
+async def _job_location_data(state_id: Optional[str], city: Optional[str]) -> dict:
+    """Coordinates and grid cell for a posting's location"""
+    location = await geocode_location(state_id, city)
+    location["geoCell"] = (
+        grid_cell(location["latitude"], location["longitude"])
+        if location["latitude"] is not None else None
+    )
+    return location
+
 # Job Postings
 @router.get("/", response_model=List[JobPosting])
 async def get_job_postings(
@@ -41,47 +107,141 @@ async def get_job_postings(
     salary_min: Optional[int] = Query(None),
     salary_max: Optional[int] = Query(None),
     search: Optional[str] = Query(None),
+    near: Optional[str] = Query(None, description='City to search around, e.g. "Austin, TX"'),
+    radius: float = Query(DEFAULT_RADIUS_MILES, gt=0, le=MAX_RADIUS_MILES),
+    include_duplicates: bool = Query(False, description="Also list postings flagged as near-duplicates"),
     limit: int = Query(20, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    db = Depends(get_read_db),
 ):
-    """Get job postings with filters"""
+    """Get job postings with filters.
+
+    Near-duplicates of another active posting are collapsed into it unless
+    include_duplicates is set. Pages are served pre-serialized from the
+    listing cache, keyed by the normalized filters and page.
+    """
     try:
-        # Build where clause
-        where_clause = {"isActive": True}
-        
-        if category_id:
-            where_clause["categoryId"] = category_id
-        if state_id:
-            where_clause["locationState"] = state_id
-        if city:
-            where_clause["locationCity"] = {"contains": city, "mode": "insensitive"}
-        if salary_min:
-            where_clause["salaryMin"] = {"gte": salary_min}
-        if salary_max:
-            where_clause["salaryMax"] = {"lte": salary_max}
-        if search:
-            where_clause["OR"] = [
-                {"title": {"contains": search, "mode": "insensitive"}},
-                {"description": {"contains": search, "mode": "insensitive"}}
-            ]
-        
-        job_postings = await prisma.jobposting.find_many(
-            where=where_clause,
-            include={
-                "employer": True,
-                "category": True,
-                "locationStateRef": True
-            }
+        city = (city or "").strip().lower() or None
+        search = (search or "").strip().lower() or None
+        near = (near or "").strip() or None
+        origin = None
+        if near:
+            origin = parse_near(near)
+            if not origin:
+                raise HTTPException(status_code=400, detail=f"Unknown location: {near}. Use the form \"City, ST\".")
+
+        async def load() -> bytes:
+            where_clause = build_job_filters(
+                category_id, state_id, city, salary_min, salary_max, search, include_duplicates
+            )
+            if not origin:
+                job_postings = await fetch_job_postings(where_clause, limit, offset, db)
+            else:
+                job_postings = await fetch_nearby_job_postings(where_clause, origin, radius, limit, offset, db)
+            return CachedBody(_JOB_POSTING_LIST.dump_json(
+                _JOB_POSTING_LIST.validate_python(job_postings, from_attributes=True), by_alias=True
+            ))
+
+        # A client reading its own recent write is on the primary; don't answer it from the cache
+        if db is not prisma_read:
+            return Response(content=await load(), media_type="application/json")
+        key = (
+            category_id, state_id, city, salary_min or None, salary_max or None, search,
+            origin, radius if origin else None, include_duplicates, limit, offset,
         )
-        # Manual pagination since take/skip might not be supported
-        job_postings = job_postings[offset:offset + limit]
-        return job_postings
+        payload = await job_listing_cache.get_or_load(key, job_listing_cache.scope_for(category_id, state_id), load)
+        return Response(content=payload, media_type="application/json")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/facets", response_model=JobFacets)
+async def get_job_facets(
+    category_id: Optional[str] = Query(None),
+    state_id: Optional[str] = Query(None),
+    city: Optional[str] = Query(None),
+    salary_min: Optional[int] = Query(None),
+    salary_max: Optional[int] = Query(None),
+    search: Optional[str] = Query(None),
+    near: Optional[str] = Query(None, description='City to search around, e.g. "Austin, TX"'),
+    radius: float = Query(DEFAULT_RADIUS_MILES, gt=0, le=MAX_RADIUS_MILES),
+    include_duplicates: bool = Query(False),
+    db = Depends(get_read_db),
+):
+    """Get category, state and salary band counts for the same filters as the listing"""
+    try:
+        near = (near or "").strip() or None
+        origin = None
+        if near:
+            origin = parse_near(near)
+            if not origin:
+                raise HTTPException(status_code=400, detail=f"Unknown location: {near}. Use the form \"City, ST\".")
+
+        conditions, params = job_filter_sql(
+            category_id, state_id, city, salary_min, salary_max, search, include_duplicates,
+            origin, radius if origin else None,
+        )
+        # One grouped query over the salary band rather than the raw salary, so the
+        # number of groups is bounded by categories x states x bands
+        groups = await db.query_raw(
+            f"""
+            SELECT category_id, location_state, {salary_band_sql("salary_min")} AS salary_band,
+                   count(*)::int AS count
+            FROM job_postings
+            WHERE {conditions}
+            GROUP BY 1, 2, 3
+            """,
+            *params,
+        )
+
+        total = 0
+        category_counts: dict = {}
+        state_counts: dict = {}
+        band_counts: dict = {}
+        for group in groups:
+            count = group["count"]
+            total += count
+            category_counts[group["category_id"]] = category_counts.get(group["category_id"], 0) + count
+            state_counts[group["location_state"]] = state_counts.get(group["location_state"], 0) + count
+            band_counts[group["salary_band"]] = band_counts.get(group["salary_band"], 0) + count
+
+        def to_facet(counts: dict) -> List[FacetCount]:
+            facets = [FacetCount(value=value, count=count) for value, count in counts.items()]
+            facets.sort(key=lambda facet: facet.count, reverse=True)
+            return facets
+
+        return JobFacets(
+            total=total,
+            categories=to_facet(category_counts),
+            states=to_facet(state_counts),
+            salaryBands=[
+                FacetCount(value=key, count=band_counts.get(key, 0))
+                for key in [key for key, _, _ in SALARY_BANDS] + [UNSPECIFIED_SALARY_BAND]
+            ],
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/suggest", response_model=List[Suggestion])
+async def suggest_job_values(
+    field: Literal["city", "title"] = Query(...),
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+):
+    """Typeahead suggestions for cities and titles of active job postings"""
+    try:
+        suggestions = await job_suggest.suggest(field, q, limit)
+        return [Suggestion(value=value, count=count) for value, count in suggestions]
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/", response_model=JobPosting)
 async def create_job_posting(
     job_data: JobPostingCreate,
+    background_tasks: BackgroundTasks,
     current_user = Depends(get_current_user),
     # _csrf = Depends(csrf_protect),  # Temporarily disabled for debugging
 ):
@@ -99,11 +259,13 @@ async def create_job_posting(
             raise HTTPException(status_code=403, detail="Please create an employer profile first to post jobs.")
 
         # Validate application steps
-        valid_steps = ["personal_info", "technical_assessment", "review_submit"]
-        if job_data.application_steps:
-            for step in job_data.application_steps:
-                if step not in valid_steps:
-                    raise HTTPException(status_code=400, detail=f"Invalid application step: {step}. Valid steps are: {', '.join(valid_steps)}")
+        step_error = _application_step_error(job_data.application_steps)
+        if step_error:
+            raise HTTPException(status_code=400, detail=step_error)
+
+        signature, duplicate_of = await duplicate_index.check(
+            posting_text(job_data.title, job_data.description, job_data.requirements), user_profile.id
+        )
 
         job_posting = await prisma.jobposting.create(
             data={
@@ -117,6 +279,9 @@ async def create_job_posting(
                 "salaryMax": job_data.salary_max,
                 "categoryId": job_data.category_id,
                 "applicationSteps": job_data.application_steps,
+                "expiresAt": job_data.expires_at,
+                "duplicateOf": duplicate_of,
+                **await _job_location_data(job_data.location_state, job_data.location_city),
             },
             include={
                 "employer": True,
@@ -124,14 +289,163 @@ async def create_job_posting(
                 "locationStateRef": True
             }
         )
+        _index_job_posting(job_posting, signature)
+        # A repost of an existing job doesn't alert anyone again
+        if not duplicate_of:
+            background_tasks.add_task(job_alerts.notify_new_posting, job_posting)
         return job_posting
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+# Rows inserted per create_many call during a bulk import
+BULK_IMPORT_BATCH_SIZE = 500
+
+# Report lines are spooled to disk past this size so large imports stay flat in memory
+BULK_REPORT_SPOOL_BYTES = 1024 * 1024
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    ]
+
+async def _bulk_row_data(record: dict, user_profile, category_ids: set, state_ids: set) -> dict:
+    """Validate one imported row and build its insert data; raises ValueError listing the problems"""
+    try:
+        job_data = JobPostingCreate.model_validate(record)
+    except ValidationError as e:
+        raise ValueError(*_validation_messages(e))
+
+    errors = []
+    step_error = _application_step_error(job_data.application_steps)
+    if step_error:
+        errors.append(step_error)
+    if job_data.category_id and job_data.category_id not in category_ids:
+        errors.append(f"Unknown category: {job_data.category_id}")
+    if job_data.location_state and job_data.location_state not in state_ids:
+        errors.append(f"Unknown state: {job_data.location_state}")
+    if errors:
+        raise ValueError(*errors)
+
+    return {
+        "id": str(uuid.uuid4()),
+        "employerId": user_profile.id,
+        "title": job_data.title,
+        "description": job_data.description,
+        "requirements": job_data.requirements,
+        "locationState": job_data.location_state,
+        "locationCity": job_data.location_city,
+        "salaryMin": job_data.salary_min,
+        "salaryMax": job_data.salary_max,
+        "categoryId": job_data.category_id,
+        "applicationSteps": job_data.application_steps,
+        "expiresAt": job_data.expires_at,
+        **await _job_location_data(job_data.location_state, job_data.location_city),
+    }
+
+def _iter_report(report):
+    try:
+        yield from report
+    finally:
+        report.close()
+
+@router.post("/bulk")
+async def bulk_create_job_postings(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(None),
+    current_user = Depends(get_current_user),
+    _csrf = Depends(csrf_protect),
+):
+    """Create job postings from a streamed CSV or NDJSON upload.
+
+    Rows are validated as they arrive and inserted in batches. The response
+    is an NDJSON report with one line per row and a final summary line.
+    """
+    try:
+        user_profile = current_user["profile"]
+        if not user_profile or user_profile.role != "employer":
+            raise HTTPException(status_code=403, detail="Please create an employer profile first to post jobs.")
+
+        if format is None:
+            format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+        rows = iter_csv_rows(request.stream()) if format == "csv" else iter_ndjson_rows(request.stream())
+
+        category_ids = {category.id for category in await prisma.jobcategory.find_many()}
+        state_ids = {state.id for state in await prisma.usstate.find_many()}
+
+        report = tempfile.SpooledTemporaryFile(max_size=BULK_REPORT_SPOOL_BYTES, mode="w+")
+        summary = {"created": 0, "failed": 0}
+        batch: List[tuple] = []
+
+        def write(entry: dict):
+            report.write(json.dumps(entry) + "\n")
+
+        async def flush():
+            if not batch:
+                return
+            # Rows are added to the duplicate index as they're checked, so
+            # repeats within the same upload are caught too
+            signatures = {}
+            for _, data in batch:
+                signature, data["duplicateOf"] = await duplicate_index.check(
+                    posting_text(data["title"], data["description"], data["requirements"]), user_profile.id
+                )
+                duplicate_index.add(data["id"], signature, user_profile.id, data["duplicateOf"])
+                signatures[data["id"]] = signature
+            try:
+                await prisma.jobposting.create_many(data=[data for _, data in batch])
+            except Exception as e:
+                for row_number, data in batch:
+                    duplicate_index.unindex(data["id"])
+                    write({"row": row_number, "status": "error", "errors": [str(e)]})
+                summary["failed"] += len(batch)
+            else:
+                created = await prisma.jobposting.find_many(
+                    where={"id": {"in": [data["id"] for _, data in batch]}}
+                )
+                for job_posting in created:
+                    _index_job_posting(job_posting, signatures.get(job_posting.id))
+                await job_alerts.notify_new_postings([job for job in created if not job.duplicateOf])
+                for row_number, data in batch:
+                    entry = {"row": row_number, "status": "created", "id": data["id"]}
+                    if data["duplicateOf"]:
+                        entry["duplicateOf"] = data["duplicateOf"]
+                    write(entry)
+                summary["created"] += len(batch)
+            batch.clear()
+
+        try:
+            async for row_number, record, parse_error in rows:
+                try:
+                    if parse_error:
+                        raise ValueError(parse_error)
+                    batch.append((row_number, await _bulk_row_data(record, user_profile, category_ids, state_ids)))
+                except ValueError as e:
+                    write({"row": row_number, "status": "error", "errors": list(e.args)})
+                    summary["failed"] += 1
+                if len(batch) >= BULK_IMPORT_BATCH_SIZE:
+                    await flush()
+            await flush()
+        except BulkImportError as e:
+            # Rows already inserted stay; the report says where parsing stopped
+            await flush()
+            summary["error"] = str(e)
+
+        write({"summary": summary})
+        report.seek(0)
+        return StreamingResponse(_iter_report(report), media_type="application/x-ndjson")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @router.get("/employer", response_model=List[JobPosting])
-async def get_employer_job_postings(current_user = Depends(get_current_user)):
+async def get_employer_job_postings(
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
     """Get job postings created by the current employer"""
     try:
         if not current_user:
@@ -155,64 +469,221 @@ async def get_employer_job_postings(current_user = Depends(get_current_user)):
             # Return empty array instead of error - user might not have employer role yet
             return []
         
+        return await fetch_employer_job_postings(user_profile, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.get("/employer/archived", response_model=List[JobPosting])
+async def get_archived_job_postings(
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
+    """Get the current employer's archived job postings"""
+    try:
+        user_profile = current_user["profile"]
+        if not user_profile or user_profile.role != "employer":
+            raise HTTPException(status_code=403, detail="Only employers can view archived job postings")
+        return await fetch_archived_job_postings(user_profile, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+# Job Applications - moved before /{job_id} to prevent route conflicts
+@router.get("/applications", response_model=ApplicationHistoryPage)
+async def get_user_applications(
+    cursor: Optional[str] = Query(None),
+    status: Optional[List[ApplicationStatus]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
+    """Get a page of the current user's job applications, newest first"""
+    try:
+        user_profile = current_user["profile"]
+        if user_profile.role != "job_seeker":
+            raise HTTPException(status_code=403, detail="Only job seekers have application history")
+        return await fetch_application_history(user_profile, limit, cursor, status, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.get("/applied-jobs")
+async def get_applied_job_ids(current_user = Depends(get_current_user)):
+    """Get list of job IDs that the current user has applied to"""
+    try:
+        user_profile = current_user["profile"]
+        if user_profile.role != "job_seeker":
+            return []
+        return await fetch_applied_job_ids(user_profile)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+MAX_APPLIED_CHECK_IDS = 100
+
+@router.get("/applied")
+async def check_applied_jobs(
+    ids: str = Query(..., description="Comma-separated job posting ids"),
+    current_user = Depends(get_current_user),
+):
+    """Check which of the given job postings the current user has applied to"""
+    try:
+        job_ids = [job_id.strip() for job_id in ids.split(",") if job_id.strip()]
+        if len(job_ids) > MAX_APPLIED_CHECK_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_APPLIED_CHECK_IDS} ids can be checked at once")
+
+        user_profile = current_user["profile"]
+        if user_profile.role != "job_seeker":
+            return {job_id: False for job_id in job_ids}
+        return await applied_jobs_cache.contains(user_profile.id, job_ids)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/recommendations", response_model=List[JobRecommendation])
+async def get_job_recommendations(
+    limit: int = Query(20, ge=1, le=50),
+    current_user = Depends(get_current_user),
+):
+    """Get active job postings ranked by how well they match the seeker's skills"""
+    try:
+        user_profile = await prisma.userprofile.find_unique(
+            where={"userId": current_user["id"]}
+        )
+        if not user_profile or user_profile.role != "job_seeker":
+            raise HTTPException(status_code=403, detail="Only job seekers can get job recommendations")
+
+        matches = await job_recommender.recommend_jobs(
+            user_profile, limit, exclude=await fetch_applied_job_ids(user_profile)
+        )
+        if not matches:
+            return []
+
         job_postings = await prisma.jobposting.find_many(
-            where={"employerId": user_profile.id},
+            where={"id": {"in": [job_id for job_id, _ in matches]}, "isActive": True},
             include={
                 "employer": True,
                 "category": True,
                 "locationStateRef": True
             }
         )
-        # Sort results manually since orderBy is not supported in this Prisma version
-        job_postings.sort(key=lambda x: x.createdAt, reverse=True)
-        
-        # Manually get application counts for each job posting since _count is not supported
-        # Convert to dict to allow adding custom fields
-        job_postings_dict = []
-        for job_posting in job_postings:
-            application_count = await prisma.jobapplication.count(
-                where={"jobPostingId": job_posting.id}
-            )
-            # Convert to dict and add custom fields
-            job_dict = job_posting.__dict__
-            job_dict["applicationCount"] = application_count
-            job_dict["_count"] = {"jobApplications": application_count}
-            job_postings_dict.append(job_dict)
+        postings_by_id = {job.id: job for job in job_postings}
+        return [
+            {"score": score, "jobPosting": postings_by_id[job_id]}
+            for job_id, score in matches if job_id in postings_by_id
+        ]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        return job_postings_dict
+# Saved searches and alerts
+MAX_SAVED_SEARCHES = 25
+
+async def _get_job_seeker_profile(current_user, action: str):
+    user_profile = await prisma.userprofile.find_unique(
+        where={"userId": current_user["id"]}
+    )
+    if not user_profile or user_profile.role != "job_seeker":
+        raise HTTPException(status_code=403, detail=f"Only job seekers can {action}")
+    return user_profile
+
+@router.get("/saved-searches", response_model=List[SavedSearch])
+async def get_saved_searches(current_user = Depends(get_current_user)):
+    """Get the current job seeker's saved searches"""
+    try:
+        user_profile = await _get_job_seeker_profile(current_user, "view saved searches")
+        saved_searches = await prisma.savedsearch.find_many(
+            where={"jobSeekerId": user_profile.id},
+            order={"createdAt": "desc"},
+        )
+        return saved_searches
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
 
-# Job Applications - moved before /{job_id} to prevent route conflicts
-@router.get("/applications")
-async def get_user_applications(current_user = Depends(get_current_user)):
-    """Get current user's job applications"""
+@router.post("/saved-searches", response_model=SavedSearch)
+async def create_saved_search(
+    search_data: SavedSearchCreate,
+    current_user = Depends(get_current_user),
+    _csrf = Depends(csrf_protect),
+):
+    """Save a job search filter set to be alerted about new matches"""
+    # Imported here: the prisma package loads the whole generated client, which startup defers
+    from prisma import Json
     try:
-        # Ensure current_user has the right structure
-        user_id = current_user.get("id") if isinstance(current_user, dict) else getattr(current_user, "id", None)
-        print(f"Applications - user_id: {user_id}")
-        if not user_id:
-            return []
+        user_profile = await _get_job_seeker_profile(current_user, "save searches")
 
-        # Get current user profile
-        user_profile = await prisma.userprofile.find_unique(
-            where={"userId": user_id}
+        existing_count = await prisma.savedsearch.count(
+            where={"jobSeekerId": user_profile.id}
         )
-        print(f"Applications - user_profile: {user_profile}")
+        if existing_count >= MAX_SAVED_SEARCHES:
+            raise HTTPException(status_code=400, detail=f"You can save at most {MAX_SAVED_SEARCHES} searches")
 
-        if not user_profile:
-            return []
+        filters = search_data.filters.model_dump(exclude_none=True)
+        if filters.get("near") and not parse_near(filters["near"]):
+            raise HTTPException(status_code=400, detail=f"Unknown location: {filters['near']}. Use the form \"City, ST\".")
 
-        if user_profile.role != "job_seeker":
-            print(f"Applications - user role is {user_profile.role}, not job_seeker")
-            return []
+        await job_alerts.ensure_loaded()
+        saved_search = await prisma.savedsearch.create(
+            data={
+                "jobSeekerId": user_profile.id,
+                "name": search_data.name,
+                "filters": Json(filters),
+            }
+        )
+        job_alerts.add_search(saved_search)
+        return saved_search
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-        print(f"Applications - querying with jobSeekerId: {user_profile.id}")
-        applications = await prisma.jobapplication.find_many(
-            where={"jobSeekerId": user_profile.id},
+@router.delete("/saved-searches/{search_id}")
+async def delete_saved_search(
+    search_id: str,
+    current_user = Depends(get_current_user),
+    _csrf = Depends(csrf_protect),
+):
+    """Delete one of the current job seeker's saved searches"""
+    try:
+        user_profile = await _get_job_seeker_profile(current_user, "delete saved searches")
+        saved_search = await prisma.savedsearch.find_unique(where={"id": search_id})
+        if not saved_search or saved_search.jobSeekerId != user_profile.id:
+            raise HTTPException(status_code=404, detail="Saved search not found")
+
+        await prisma.savedsearch.delete(where={"id": search_id})
+        job_alerts.remove_search(search_id)
+        return {"message": "Saved search deleted successfully"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/alerts", response_model=List[JobAlert])
+async def get_job_alerts(
+    unread_only: bool = Query(False),
+    limit: int = Query(50, ge=1, le=100),
+    current_user = Depends(get_current_user),
+):
+    """Get new job postings matching the current job seeker's saved searches"""
+    try:
+        user_profile = await _get_job_seeker_profile(current_user, "view job alerts")
+        where_clause = {"jobSeekerId": user_profile.id}
+        if unread_only:
+            where_clause["readAt"] = None
+
+        alerts = await prisma.jobalert.find_many(
+            where=where_clause,
+            order={"createdAt": "desc"},
+            take=limit,
             include={
+                "savedSearch": True,
                 "jobPosting": {
                     "include": {
                         "employer": True,
@@ -222,82 +693,56 @@ async def get_user_applications(current_user = Depends(get_current_user)):
                 }
             }
         )
-        print(f"Applications - query result count: {len(applications)}")
-        if applications:
-            print(f"Applications - first application jobSeekerId: {applications[0].jobSeekerId}")
-
-        return applications
-    except HTTPException as e:
-        # Don't re-raise, return empty array instead for this endpoint
-        return []
+        return alerts
+    except HTTPException:
+        raise
     except Exception as e:
-        return []
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/applied-jobs")
-async def get_applied_job_ids(current_user = Depends(get_current_user)):
-    """Get list of job IDs that the current user has applied to"""
+@router.post("/alerts/read")
+async def mark_job_alerts_read(
+    current_user = Depends(get_current_user),
+    _csrf = Depends(csrf_protect),
+):
+    """Mark all of the current job seeker's alerts as read"""
     try:
-        print(f"🚨 APPLIED-JOBS ENDPOINT CALLED")
-        # Ensure current_user has the right structure
-        user_id = current_user.get("id") if isinstance(current_user, dict) else getattr(current_user, "id", None)
-        print(f"🚨 Applied jobs - user_id: {user_id}")
-        if not user_id:
-            print("🚨 Applied jobs - no user_id found")
-            return []
-
-        # Get current user profile
-        user_profile = await prisma.userprofile.find_unique(
-            where={"userId": user_id}
+        user_profile = await _get_job_seeker_profile(current_user, "update job alerts")
+        updated = await prisma.jobalert.update_many(
+            where={"jobSeekerId": user_profile.id, "readAt": None},
+            data={"readAt": datetime.now(timezone.utc)},
         )
-        print(f"🚨 Applied jobs - user_profile: {user_profile}")
-
-        if not user_profile:
-            print("🚨 Applied jobs - no user profile found")
-            return []
-
-        if user_profile.role != "job_seeker":
-            print(f"🚨 Applied jobs - user role is {user_profile.role}, not job_seeker")
-            return []
-
-        print(f"🚨 Applied jobs - querying with jobSeekerId: {user_profile.id}")
-        try:
-            applications = await prisma.jobapplication.find_many(
-                where={"jobSeekerId": user_profile.id}
-            )
-            print(f"🚨 Applied jobs - query executed, found {len(applications)} applications")
-            for app in applications:
-                print(f"🚨 Applied jobs - application: id={app.id}, jobPostingId={app.jobPostingId}")
-
-            applied_job_ids = [app.jobPostingId for app in applications]
-            print(f"🚨 Applied jobs - returning job IDs: {applied_job_ids}")
-
-            return applied_job_ids
-        except Exception as query_error:
-            print(f"🚨 Applied jobs - query error: {query_error}")
-            return []
-    except HTTPException as e:
-        # Don't re-raise, return empty array instead for this endpoint
-        print(f"🚨 Applied jobs - HTTP exception: {e}")
-        return []
+        return {"updated": updated}
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"🚨 Applied jobs - general exception: {e}")
-        return []
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{job_id}", response_model=JobPosting)
-async def get_job_posting(job_id: str):
-    """Get a specific job posting"""
+async def get_job_posting(job_id: str, db = Depends(get_read_db)):
+    """Get a specific job posting.
+
+    Concurrent requests for the same posting share one query and one
+    serialized payload, which is then kept briefly in a microcache.
+    """
     try:
-        job_posting = await prisma.jobposting.find_unique(
-            where={"id": job_id},
-            include={
-                "employer": True,
-                "category": True,
-                "locationStateRef": True
-            }
-        )
-        if not job_posting:
+        async def load() -> Optional[bytes]:
+            job_posting = await db.jobposting.find_unique(
+                where={"id": job_id},
+                include={
+                    "employer": True,
+                    "category": True,
+                    "locationStateRef": True
+                }
+            )
+            if not job_posting:
+                return None
+            return CachedBody(JobPosting.model_validate(job_posting).model_dump_json(by_alias=True).encode())
+
+        # A client reading its own recent write is on the primary; don't answer it from the cache
+        payload = await job_detail_cache.get_or_load(job_id, load) if db is prisma_read else await load()
+        if payload is None:
             raise HTTPException(status_code=404, detail="Job posting not found")
-        return job_posting
+        return Response(content=payload, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -327,28 +772,54 @@ async def update_job_posting(
             raise HTTPException(status_code=404, detail="Job posting not found")
         
         # Validate application steps
-        valid_steps = ["personal_info", "technical_assessment", "review_submit"]
-        if job_data.application_steps:
-            for step in job_data.application_steps:
-                if step not in valid_steps:
-                    raise HTTPException(status_code=400, detail=f"Invalid application step: {step}. Valid steps are: {', '.join(valid_steps)}")
+        step_error = _application_step_error(job_data.application_steps)
+        if step_error:
+            raise HTTPException(status_code=400, detail=step_error)
+
+        title = job_data.title or job_posting.title
+        description = job_data.description or job_posting.description
+        requirements = job_data.requirements or job_posting.requirements
+        signature, duplicate_of = await duplicate_index.check(
+            posting_text(title, description, requirements), user_profile.id, exclude=job_id
+        )
+
+        is_active = job_data.is_active if job_data.is_active is not None else job_posting.isActive
+        expires_at = job_data.expires_at if "expires_at" in job_data.model_fields_set else job_posting.expiresAt
+        now = datetime.now(timezone.utc)
+        if is_active and not job_posting.isActive and "expires_at" not in job_data.model_fields_set:
+            # A reactivated posting starts a fresh lifetime; otherwise its age or past
+            # deadline would get it deactivated again on the next expiry run
+            if expires_at is None or expires_at <= now:
+                expires_at = now + timedelta(days=settings.job_expiry_days)
 
         # Update job posting
         updated_job = await prisma.jobposting.update(
             where={"id": job_id},
             data={
-                "title": job_data.title or job_posting.title,
-                "description": job_data.description or job_posting.description,
-                "requirements": job_data.requirements or job_posting.requirements,
+                "title": title,
+                "description": description,
+                "requirements": requirements,
                 "locationState": job_data.location_state,
                 "locationCity": job_data.location_city,
                 "salaryMin": job_data.salary_min,
                 "salaryMax": job_data.salary_max,
                 "categoryId": job_data.category_id,
                 "applicationSteps": job_data.application_steps or job_posting.applicationSteps,
-                "isActive": job_data.is_active if job_data.is_active is not None else job_posting.isActive,
+                "isActive": is_active,
+                "expiresAt": expires_at,
+                "duplicateOf": duplicate_of,
+                **await _job_location_data(job_data.location_state, job_data.location_city),
             }
         )
+        _unindex_job_posting(job_posting)
+        _index_job_posting(updated_job, signature)
+        text_changed = (title, description, requirements) != (
+            job_posting.title, job_posting.description, job_posting.requirements
+        )
+        if not updated_job.isActive or text_changed or duplicate_of != job_posting.duplicateOf:
+            # Its duplicates may no longer resemble it, or it no longer shows in listings;
+            # the ones that still match keep pointing at it
+            await release_duplicates([job_id])
         return updated_job
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -377,10 +848,49 @@ async def delete_job_posting(
         
         # Delete job posting
         await prisma.jobposting.delete(where={"id": job_id})
+        _unindex_job_posting(job_posting)
+        await release_duplicates([job_id])
         return {"message": "Job posting deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/{job_id}/candidates", response_model=List[CandidateMatch])
+async def get_top_candidates(
+    job_id: str,
+    limit: int = Query(20, ge=1, le=50),
+    current_user = Depends(get_current_user),
+):
+    """Get job seekers whose skills best match one of the employer's postings"""
+    try:
+        user_profile = await prisma.userprofile.find_unique(
+            where={"userId": current_user["id"]}
+        )
+        if not user_profile or user_profile.role != "employer":
+            raise HTTPException(status_code=403, detail="Only employers can view top candidates")
+
+        job_posting = await prisma.jobposting.find_unique(
+            where={"id": job_id}
+        )
+        if not job_posting or job_posting.employerId != user_profile.id:
+            raise HTTPException(status_code=404, detail="Job posting not found")
+
+        matches = await job_recommender.top_candidates(job_posting, limit)
+        if not matches:
+            return []
+
+        profiles = await prisma.userprofile.find_many(
+            where={"id": {"in": [profile_id for profile_id, _ in matches]}}
+        )
+        profiles_by_id = {profile.id: profile for profile in profiles}
+        return [
+            {"score": score, "candidate": candidate_summary(profiles_by_id[profile_id])}
+            for profile_id, score in matches if profile_id in profiles_by_id
+        ]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 # Job Applications
 @router.post("/{job_id}/apply", response_model=JobApplication)
 async def apply_to_job(
@@ -401,7 +911,8 @@ async def apply_to_job(
 
         # Check if job posting exists
         job_posting = await prisma.jobposting.find_unique(
-            where={"id": job_id}
+            where={"id": job_id},
+            include={"employer": True}
         )
 
         if not job_posting:
@@ -429,6 +940,14 @@ async def apply_to_job(
             create_data["applicationData"] = application_data.application_data
 
         application = await prisma.jobapplication.create(data=create_data)
+        applied_jobs_cache.add(user_profile.id, job_id)
+
+        await event_hub.publish(job_posting.employer.userId, "application.created", {
+            "applicationId": application.id,
+            "jobPostingId": job_id,
+            "jobTitle": job_posting.title,
+            "jobSeekerName": user_profile.name,
+        })
         return application
 
     except HTTPException:
@@ -438,7 +957,11 @@ async def apply_to_job(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @router.get("/applications/employer", response_model=List[JobApplication])
-async def get_employer_applications(current_user = Depends(get_current_user)):
+async def get_employer_applications(
+    include_archived: bool = Query(False),
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
     """Get applications for employer's job postings"""
     try:
         # Get current user profile
@@ -448,29 +971,212 @@ async def get_employer_applications(current_user = Depends(get_current_user)):
         if not user_profile or user_profile.role != "employer":
             raise HTTPException(status_code=403, detail="Only employers can view their applications")
         
-        # Get all job postings by this employer  
-        job_postings = await prisma.jobposting.find_many(
-            where={"employerId": user_profile.id}
-        )
-        job_posting_ids = [job.id for job in job_postings]
-        
-        # Get applications for these job postings
-        applications = await prisma.jobapplication.find_many(
-            where={"jobPostingId": {"in": job_posting_ids}},
-            include={
-                "jobSeeker": True,
-                "jobPosting": {
-                    "include": {
-                        "category": True,
-                        "locationStateRef": True
-                    }
-                }
-            },
-        )
+        applications = await fetch_employer_applications(user_profile, db)
+        if include_archived:
+            applications = [*applications, *await fetch_archived_applications(user_profile, db)]
         return applications
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+# Applications fetched per query while streaming an export
+EXPORT_PAGE_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    "id", "jobPostingId", "jobTitle", "status", "appliedAt", "updatedAt",
+    "candidateName", "candidateEmail", "candidatePhone", "candidateSkills",
+    "resumeUrl", "coverLetter", "applicationData",
+]
+
+async def _iter_employer_applications(db, job_posting_ids: List[str], applied_since: datetime):
+    """Pages of export rows, walking the (job_posting_id, job_seeker_id) index"""
+    after = ("", "")
+    while True:
+        rows = await db.query_raw(
+            """
+            SELECT a.id, a.job_posting_id, a.job_seeker_id, p.title, a.status::text AS status,
+                   a.applied_at, a.updated_at, s.name, s.email, s.phone, s.skills, s.resume_url,
+                   a.cover_letter, a.application_data::text AS application_data
+            FROM job_applications a
+            JOIN job_postings p ON p.id = a.job_posting_id
+            JOIN user_profiles s ON s.id = a.job_seeker_id
+            WHERE a.job_posting_id = ANY($1) AND (a.job_posting_id, a.job_seeker_id) > ($2, $3)
+              AND a.applied_at >= $5::timestamp
+            ORDER BY a.job_posting_id, a.job_seeker_id
+            LIMIT $4
+            """,
+            job_posting_ids, after[0], after[1], EXPORT_PAGE_SIZE, timestamp_param(applied_since),
+        )
+        if not rows:
+            return
+        yield [
+            {
+                "id": row["id"],
+                "jobPostingId": row["job_posting_id"],
+                "jobTitle": row["title"],
+                "status": row["status"],
+                "appliedAt": str(row["applied_at"]),
+                "updatedAt": str(row["updated_at"]),
+                "candidateName": row["name"],
+                "candidateEmail": row["email"],
+                "candidatePhone": row["phone"],
+                "candidateSkills": row["skills"] or [],
+                "resumeUrl": row["resume_url"],
+                "coverLetter": row["cover_letter"],
+                "applicationData": json.loads(row["application_data"]) if row["application_data"] else None,
+            }
+            for row in rows
+        ]
+        if len(rows) < EXPORT_PAGE_SIZE:
+            return
+        after = (rows[-1]["job_posting_id"], rows[-1]["job_seeker_id"])
+
+def _csv_export_values(row: dict) -> list:
+    values = dict(row)
+    values["candidateSkills"] = ";".join(row["candidateSkills"])
+    if row["applicationData"] is not None:
+        values["applicationData"] = json.dumps(row["applicationData"])
+    return [values[column] for column in EXPORT_COLUMNS]
+
+def _csv_export_line(values: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+async def _stream_export(db, job_posting_ids: List[str], applied_since: datetime, format: str):
+    if format == "csv":
+        yield _csv_export_line(EXPORT_COLUMNS)
+    try:
+        async for page in _iter_employer_applications(db, job_posting_ids, applied_since):
+            if format == "csv":
+                yield "".join(_csv_export_line(_csv_export_values(row)) for row in page)
+            else:
+                yield "".join(json.dumps(row) + "\n" for row in page)
+    except Exception as e:
+        print(f"Application export failed: {e}")
+        if format == "ndjson":
+            yield json.dumps({"error": "Export failed before all applications were written"}) + "\n"
+        # Headers are already sent; re-raising aborts the connection so the
+        # client sees a failed download rather than a complete-looking file
+        raise
+
+@router.get("/applications/employer/export")
+async def export_employer_applications(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    job_id: Optional[str] = Query(None),
+    current_user = Depends(get_current_user),
+    db = Depends(get_read_db),
+):
+    """Stream the employer's applications as NDJSON or CSV, one page of rows at a time.
+
+    A failure partway through aborts the connection instead of ending the
+    body cleanly; NDJSON output gets a final {"error": ...} line first.
+    """
+    try:
+        user_profile = current_user["profile"]
+        if not user_profile or user_profile.role != "employer":
+            raise HTTPException(status_code=403, detail="Only employers can export their applications")
+
+        where = {"employerId": user_profile.id}
+        if job_id:
+            where["id"] = job_id
+        job_posting_ids = sorted(job.id for job in await db.jobposting.find_many(where=where))
+        if job_id and not job_posting_ids:
+            raise HTTPException(status_code=404, detail="Job posting not found")
+
+        media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+        return StreamingResponse(
+            _stream_export(db, job_posting_ids, user_profile.createdAt, format),
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename=applications.{format}"},
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/applications/bulk-status", response_model=ApplicationBulkStatusResult)
+async def bulk_update_application_status(
+    update: ApplicationBulkStatusUpdate,
+    current_user = Depends(get_current_user),
+    _csrf = Depends(csrf_protect),
+):
+    """Move many applications to one status (employers only).
+
+    Takes either explicit application ids or a filter over the employer's
+    applications. Ownership is checked and the rows are locked in one query,
+    then changed with a single update inside the same transaction. Ids that
+    aren't the employer's, or that already have the target status, are
+    reported as skipped.
+    """
+    try:
+        user_profile = current_user["profile"]
+        if not user_profile or user_profile.role != "employer":
+            raise HTTPException(status_code=403, detail="Only employers can update application status")
+        if (update.application_ids is None) == (update.filter is None):
+            raise HTTPException(status_code=400, detail="Provide either applicationIds or filter")
+
+        conditions = ["p.employer_id = $1", "a.applied_at >= $2::timestamp"]
+        params: list = [user_profile.id, timestamp_param(user_profile.createdAt)]
+        if update.application_ids is not None:
+            requested_ids = list(dict.fromkeys(update.application_ids))
+            params.append(requested_ids)
+            conditions.append(f"a.id = ANY(${len(params)})")
+        else:
+            requested_ids = []
+            if update.filter.job_posting_id:
+                params.append(update.filter.job_posting_id)
+                conditions.append(f"a.job_posting_id = ${len(params)}")
+            if update.filter.status:
+                params.append(update.filter.status.value)
+                conditions.append(f"a.status::text = ${len(params)}")
+
+        target = update.status.value
+        async with prisma.tx() as tx:
+            rows = await tx.query_raw(
+                f"""
+                SELECT a.id, a.job_posting_id, a.status::text AS status, p.title, s.user_id
+                FROM job_applications a
+                JOIN job_postings p ON p.id = a.job_posting_id
+                JOIN user_profiles s ON s.id = a.job_seeker_id
+                WHERE {" AND ".join(conditions)}
+                FOR UPDATE OF a
+                """,
+                *params,
+            )
+            changed = [row for row in rows if row["status"] != target]
+            if changed:
+                await tx.jobapplication.update_many(
+                    where={"id": {"in": [row["id"] for row in changed]}},
+                    data={"status": target},
+                )
+
+        for row in changed:
+            await event_hub.publish(row["user_id"], "application.status_changed", {
+                "applicationId": row["id"],
+                "jobPostingId": row["job_posting_id"],
+                "jobTitle": row["title"],
+                "status": target,
+            })
+
+        found = {row["id"] for row in rows}
+        skipped = [
+            SkippedApplication(id=application_id, reason="not_found")
+            for application_id in requested_ids if application_id not in found
+        ]
+        skipped += [
+            SkippedApplication(id=row["id"], reason="unchanged")
+            for row in rows if row["status"] == target
+        ]
+        return ApplicationBulkStatusResult(
+            updated=len(changed),
+            updatedIds=[row["id"] for row in changed],
+            skipped=skipped,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @router.put("/applications/{application_id}", response_model=JobApplication)
 async def update_application_status(
     application_id: str,
@@ -488,21 +1194,30 @@ async def update_application_status(
             raise HTTPException(status_code=403, detail="Only employers can update application status")
         
         # Check if application exists and belongs to user's job posting
-        application = await prisma.jobapplication.find_unique(
+        application = await prisma.jobapplication.find_first(
             where={"id": application_id},
-            include={"jobPosting": True}
+            include={"jobPosting": True, "jobSeeker": True}
         )
         if not application or application.jobPosting.employerId != user_profile.id:
             raise HTTPException(status_code=404, detail="Application not found")
         
         # Update application
+        # The primary key includes the partition column
         updated_application = await prisma.jobapplication.update(
-            where={"id": application_id},
+            where={"id_appliedAt": {"id": application_id, "appliedAt": application.appliedAt}},
             data={
                 "status": application_data.status.value if application_data.status else application.status,
                 "coverLetter": application_data.cover_letter if application_data.cover_letter else application.coverLetter,
             }
         )
+
+        if updated_application.status != application.status:
+            await event_hub.publish(application.jobSeeker.userId, "application.status_changed", {
+                "applicationId": application_id,
+                "jobPostingId": application.jobPostingId,
+                "jobTitle": application.jobPosting.title,
+                "status": updated_application.status,
+            })
         return updated_application
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
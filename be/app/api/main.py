@@ -2,6 +2,9 @@ from fastapi import APIRouter
 from .session_auth import router as auth_router
 from .jobs import router as jobs_router
 from .interviews import router as interviews_router
+from .events import router as events_router
+from .dashboard import router as dashboard_router
+from .candidates import router as candidates_router
 
 api_router = APIRouter()
 
@@ -9,3 +12,6 @@ api_router = APIRouter()
 api_router.include_router(auth_router, prefix="/auth", tags=["authentication"])
 api_router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 api_router.include_router(interviews_router, prefix="/interviews", tags=["interviews"])
+api_router.include_router(events_router, prefix="/events", tags=["events"])
+api_router.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(candidates_router, prefix="/candidates", tags=["candidates"])
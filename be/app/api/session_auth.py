@@ -3,6 +3,10 @@ from app.core.clerk_auth import clerk_auth
 from app.core.session_auth import session_auth, get_current_user_from_session, get_session_user
 from app.core.csrf import csrf_protect
 from app.core.database import prisma
+from app.core.geo import geocode_location
+from app.core.recommend import job_recommender
+from app.core.candidates import candidate_index
+from app.core.storage import StorageError, StorageLimitError, receive_multipart_file, resume_storage
 from app.models.user import UserProfileCreate, UserProfile, UserProfileUpdate
 from pydantic import BaseModel
 from typing import Optional
@@ -96,6 +100,7 @@ async def create_user_profile(
                     "phone": profile_data.phone,
                     "locationState": profile_dict.get("locationState"),
                     "locationCity": profile_dict.get("locationCity"),
+                    **await geocode_location(profile_dict.get("locationState"), profile_dict.get("locationCity")),
                     "skills": profile_data.skills or [],
                     "resumeUrl": profile_dict.get("resumeUrl"),
                     "companyName": profile_dict.get("companyName"),
@@ -109,6 +114,9 @@ async def create_user_profile(
             if user_profile.locationStateRef:
                 profile_dict['locationStateName'] = user_profile.locationStateRef.name
 
+            job_recommender.update_seeker(user_profile)
+            candidate_index.update(user_profile)
+
             # Update session with new profile
             await session_auth.create_session(current_user["id"], user_profile)
 
@@ -125,6 +133,7 @@ async def create_user_profile(
                 "phone": profile_data.phone,
                 "locationState": profile_dict.get("locationState"),
                 "locationCity": profile_dict.get("locationCity"),
+                **await geocode_location(profile_dict.get("locationState"), profile_dict.get("locationCity")),
                 "skills": profile_data.skills or [],
                 "resumeUrl": profile_dict.get("resumeUrl"),
                 "companyName": profile_dict.get("companyName"),
@@ -138,6 +147,9 @@ async def create_user_profile(
         if user_profile.locationStateRef:
             profile_dict['locationStateName'] = user_profile.locationStateRef.name
         
+        job_recommender.update_seeker(user_profile)
+        candidate_index.update(user_profile)
+
         # Update session with new profile
         await session_auth.create_session(current_user["id"], user_profile)
         
@@ -183,6 +195,18 @@ async def update_user_profile(
         profile_dict = profile_data.model_dump(by_alias=True, exclude_unset=True)
         update_data = {k: v for k, v in profile_dict.items() if v is not None}
 
+        # Re-geocode when either half of the location changes
+        if "locationState" in update_data or "locationCity" in update_data:
+            existing_profile = await prisma.userprofile.find_unique(
+                where={"userId": current_user["id"]}
+            )
+            if not existing_profile:
+                raise HTTPException(status_code=404, detail="User profile not found")
+            update_data.update(await geocode_location(
+                update_data.get("locationState", existing_profile.locationState),
+                update_data.get("locationCity", existing_profile.locationCity),
+            ))
+
         user_profile = await prisma.userprofile.update(
             where={"userId": current_user["id"]},
             data=update_data,
@@ -197,6 +221,9 @@ async def update_user_profile(
         if user_profile.locationStateRef:
             profile_dict['locationStateName'] = user_profile.locationStateRef.name
 
+        job_recommender.update_seeker(user_profile)
+        candidate_index.update(user_profile)
+
         # Update session with new profile
         await session_auth.create_session(current_user["id"], user_profile)
 
@@ -206,6 +233,128 @@ async def update_user_profile(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+RESUME_CONTENT_TYPES = {
+    "application/pdf",
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.oasis.opendocument.text",
+    "application/rtf",
+    "text/plain",
+}
+
+# Room for multipart boundaries and part headers when checking Content-Length up front
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+def _profile_response(user_profile) -> UserProfile:
+    profile_dict = user_profile.model_dump(by_alias=True)
+    if user_profile.locationStateRef:
+        profile_dict['locationStateName'] = user_profile.locationStateRef.name
+    return UserProfile(**profile_dict)
+
+@router.put("/profile/resume", response_model=UserProfile)
+async def upload_resume(
+    request: Request,
+    current_user = Depends(get_current_user_from_session),
+    _csrf = Depends(csrf_protect),
+):
+    """Upload the job seeker's resume as multipart/form-data in the `file` field.
+
+    The body is streamed to storage and hashed as it arrives, so identical
+    files are stored once; an upload over RESUME_MAX_BYTES is cut off with 413.
+    """
+    try:
+        profile = current_user["profile"]
+        if profile.role != "job_seeker":
+            raise HTTPException(status_code=403, detail="Only job seekers can upload a resume")
+
+        max_bytes = settings.resume_max_bytes
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+            raise HTTPException(status_code=413, detail=f"File exceeds {max_bytes} bytes")
+
+        try:
+            stored, filename, content_type = await receive_multipart_file(
+                request.stream(),
+                request.headers.get("content-type", ""),
+                resume_storage.writer(max_bytes),
+                allowed_types=RESUME_CONTENT_TYPES,
+            )
+        except StorageLimitError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except StorageError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # The previous file stays until the orphan sweep finds nothing pointing at it
+        user_profile = await prisma.userprofile.update(
+            where={"id": profile.id},
+            data={
+                "resumeKey": stored.key,
+                "resumeName": filename[:255] or "resume",
+                "resumeContentType": content_type,
+                "resumeSize": stored.size,
+                "resumeUrl": str(request.url_for("download_resume", profile_id=profile.id)),
+            },
+            include={"locationStateRef": True}
+        )
+        return _profile_response(user_profile)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.delete("/profile/resume", response_model=UserProfile)
+async def delete_resume(
+    current_user = Depends(get_current_user_from_session),
+    _csrf = Depends(csrf_protect),
+):
+    """Remove the uploaded resume from the profile"""
+    try:
+        user_profile = await prisma.userprofile.update(
+            where={"id": current_user["profile"].id},
+            data={
+                "resumeKey": None,
+                "resumeName": None,
+                "resumeContentType": None,
+                "resumeSize": None,
+                "resumeUrl": None,
+            },
+            include={"locationStateRef": True}
+        )
+        return _profile_response(user_profile)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.get("/profiles/{profile_id}/resume", name="download_resume")
+async def download_resume(profile_id: str, current_user = Depends(get_current_user_from_session)):
+    """Download a seeker's uploaded resume; Range requests are supported.
+
+    Available to the seeker and to employers the seeker has applied to.
+    """
+    try:
+        viewer = current_user["profile"]
+        if viewer.id != profile_id:
+            application = await prisma.jobapplication.find_first(
+                where={"jobSeekerId": profile_id, "jobPosting": {"employerId": viewer.id}}
+            )
+            if not application:
+                raise HTTPException(status_code=403, detail="Not authorized to view this resume")
+
+        profile = await prisma.userprofile.find_unique(where={"id": profile_id})
+        if not profile or not profile.resumeKey or not await resume_storage.exists(profile.resumeKey):
+            raise HTTPException(status_code=404, detail="Resume not found")
+
+        return resume_storage.response(
+            profile.resumeKey,
+            profile.resumeName or "resume",
+            profile.resumeContentType or "application/octet-stream",
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @router.post("/logout")
 async def logout(request: Request, response: Response, current_user = Depends(get_current_user_from_session)):
     """Logout and invalidate session"""
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from http.cookies import SimpleCookie
+from typing import Dict, Optional
+from .config import Lazy, settings
+
+API_PREFIX = "/api/v1"
+
+# Long-lived connections hold no database connection while open; they bypass admission
+EXEMPT_PATHS = ("/api/v1/events/stream",)
+
+# GET endpoints that run the heavy listing and matching queries
+SEARCH_PATHS = (
+    "/api/v1/jobs/",
+    "/api/v1/jobs/facets",
+    "/api/v1/jobs/suggest",
+    "/api/v1/jobs/recommendations",
+    "/api/v1/dashboard/seeker",
+    "/api/v1/dashboard/employer",
+    "/api/v1/candidates/search",
+)
+
+# Distinct clients tracked by the rate limiter; the least recently seen are evicted
+MAX_TRACKED_CLIENTS = 100_000
+
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """Admission class of a request, or None when it isn't subject to admission"""
+    if not path.startswith(API_PREFIX) or path in EXEMPT_PATHS or method == "OPTIONS":
+        return None
+    if method not in ("GET", "HEAD"):
+        return "write"
+    if path in SEARCH_PATHS or path.endswith("/candidates"):
+        return "search"
+    return "read"
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, capacity: float):
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, rate: float, capacity: float) -> float:
+        """Take one token; returns 0 on success or the seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+
+class RateLimiter:
+    """Per-client token buckets, keyed by session when there is one and by IP otherwise"""
+
+    def __init__(self, rate: float, burst: int, max_clients: int = MAX_TRACKED_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def check(self, key: str) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.burst)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(self.rate, self.burst)
+
+
+class ConcurrencyLimiter:
+    """Caps concurrent requests of one route class; waiters give up after a budget"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+
+    async def acquire(self, timeout: float) -> bool:
+        if self.waiting or self._semaphore.locked():
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+class AdmissionController:
+    def __init__(self):
+        self.rate_limiter = RateLimiter(settings.rate_limit_per_second, settings.rate_limit_burst)
+        self.limiters: Dict[str, ConcurrencyLimiter] = {
+            "search": ConcurrencyLimiter(settings.admission_search_concurrency),
+            "read": ConcurrencyLimiter(settings.admission_read_concurrency),
+            "write": ConcurrencyLimiter(settings.admission_write_concurrency),
+        }
+        self.counters: Dict[str, Dict[str, int]] = {
+            name: {"admitted": 0, "rateLimited": 0, "shed": 0} for name in self.limiters
+        }
+
+    @staticmethod
+    def client_key(scope) -> str:
+        for name, value in scope.get("headers", []):
+            if name == b"cookie":
+                session = SimpleCookie(value.decode("latin-1")).get("session")
+                if session and session.value:
+                    return "session:" + hashlib.sha256(session.value.encode()).hexdigest()[:32]
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                **self.counters[name],
+                "inFlight": limiter.in_flight,
+                "waiting": limiter.waiting,
+                "limit": limiter.limit,
+            }
+            for name, limiter in self.limiters.items()
+        }
+
+
+async def _reject(send, status: int, detail: str, retry_after: float):
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionControlMiddleware:
+    """Rate limiting and load shedding in front of the API routers.
+
+    Each client gets a token bucket (rate_limit_per_second, rate_limit_burst)
+    and is answered 429 when it runs dry. Requests then take a slot from
+    the concurrency limit of their route class; one that waits longer than
+    admission_queue_budget_ms for a slot is shed with 503, so a spike turns
+    into fast rejections instead of a pile-up on the database pool. The slot
+    is released once the response headers go out, so long-lived streams
+    don't keep their route class full.
+    """
+
+    def __init__(self, app, controller: AdmissionController = None):
+        self.app = app
+        self.controller = controller or admission_controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = route_class(scope["method"], scope["path"])
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+
+        counters = self.controller.counters[name]
+        retry_after = self.controller.rate_limiter.check(self.controller.client_key(scope))
+        if retry_after:
+            counters["rateLimited"] += 1
+            await _reject(send, 429, "Too many requests", retry_after)
+            return
+
+        limiter = self.controller.limiters[name]
+        budget = settings.admission_queue_budget_ms / 1000
+        if not await limiter.acquire(budget):
+            counters["shed"] += 1
+            await _reject(send, 503, "Server busy, please retry", 1)
+            return
+        counters["admitted"] += 1
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                limiter.release()
+
+        async def send_and_release(message):
+            # The slot guards the handler's work; a streamed body (event stream,
+            # export) would otherwise hold it for as long as the client reads
+            if message["type"] == "http.response.start":
+                release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            release()
+
+# Global admission controller
+admission_controller = Lazy(AdmissionController)
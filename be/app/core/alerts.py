@@ -0,0 +1,253 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from .config import settings
+from .database import prisma, find_many_in_pages
+from .geo import parse_near, haversine_miles, DEFAULT_RADIUS_MILES
+from .search import SALARY_BANDS, salary_band
+
+# Saved search terms are indexed by their first trigram, so search
+# strings shorter than this fall back to the match-all bucket
+TRIGRAM_LENGTH = 3
+
+_BAND_ORDER = [key for key, _, _ in SALARY_BANDS]
+
+IndexKey = Tuple[str, ...]
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+def matches_filters(filters: dict, job_posting) -> bool:
+    """Whether a posting satisfies a saved filter set, mirroring the listing filters"""
+    if not job_posting.isActive:
+        return False
+    if filters.get("category_id") and job_posting.categoryId != filters["category_id"]:
+        return False
+    if filters.get("state_id") and job_posting.locationState != filters["state_id"]:
+        return False
+    if filters.get("city") and filters["city"].lower() not in (job_posting.locationCity or "").lower():
+        return False
+    if filters.get("salary_min") and (job_posting.salaryMin is None or job_posting.salaryMin < filters["salary_min"]):
+        return False
+    if filters.get("salary_max") and (job_posting.salaryMax is None or job_posting.salaryMax > filters["salary_max"]):
+        return False
+    if filters.get("search"):
+        search = filters["search"].lower()
+        if search not in job_posting.title.lower() and search not in job_posting.description.lower():
+            return False
+    if filters.get("near"):
+        origin = parse_near(filters["near"])
+        if not origin or job_posting.latitude is None or job_posting.longitude is None:
+            return False
+        radius = filters.get("radius") or DEFAULT_RADIUS_MILES
+        if haversine_miles(origin[0], origin[1], job_posting.latitude, job_posting.longitude) > radius:
+            return False
+    return True
+
+
+class SavedSearchIndex:
+    """Reverse index from posting attributes to the saved searches they could match.
+
+    Each saved search is filed under a single key taken from its most
+    selective filter: category, then state, then salary band, then the first
+    trigram of its search text. A new posting only looks up the keys it
+    could satisfy, and each candidate is verified with the full filter
+    predicate, so matching cost follows the number of plausible searches
+    rather than the total number saved.
+    """
+
+    def __init__(self):
+        self._searches: Dict[str, Tuple[str, dict]] = {}
+        self._keys: Dict[str, IndexKey] = {}
+        self._buckets: Dict[IndexKey, Set[str]] = {}
+
+    def __len__(self):
+        return len(self._searches)
+
+    @staticmethod
+    def index_key(filters: dict) -> IndexKey:
+        if filters.get("category_id"):
+            return ("category", filters["category_id"])
+        if filters.get("state_id"):
+            return ("state", filters["state_id"])
+        if filters.get("salary_min"):
+            return ("band", salary_band(filters["salary_min"]))
+        search = (filters.get("search") or "").lower()
+        if len(search) >= TRIGRAM_LENGTH:
+            return ("trigram", search[:TRIGRAM_LENGTH])
+        return ("all",)
+
+    @staticmethod
+    def posting_keys(job_posting) -> List[IndexKey]:
+        keys: List[IndexKey] = [("all",)]
+        if job_posting.categoryId:
+            keys.append(("category", job_posting.categoryId))
+        if job_posting.locationState:
+            keys.append(("state", job_posting.locationState))
+        if job_posting.salaryMin is not None:
+            # A salary_min filter in band b can only be met by postings in band b or above
+            posting_band = _BAND_ORDER.index(salary_band(job_posting.salaryMin))
+            keys.extend(("band", band) for band in _BAND_ORDER[:posting_band + 1])
+        text = f"{job_posting.title}\n{job_posting.description}".lower()
+        keys.extend(("trigram", trigram) for trigram in _trigrams(text))
+        return keys
+
+    def add(self, search_id: str, job_seeker_id: str, filters: dict):
+        self.remove(search_id)
+        key = self.index_key(filters)
+        self._searches[search_id] = (job_seeker_id, filters)
+        self._keys[search_id] = key
+        self._buckets.setdefault(key, set()).add(search_id)
+
+    def remove(self, search_id: str):
+        key = self._keys.pop(search_id, None)
+        if key is None:
+            return
+        del self._searches[search_id]
+        bucket = self._buckets[key]
+        bucket.discard(search_id)
+        if not bucket:
+            del self._buckets[key]
+
+    def match(self, job_posting) -> List[Tuple[str, str]]:
+        """(saved search id, job seeker id) pairs whose filters the posting satisfies"""
+        matched = []
+        for key in self.posting_keys(job_posting):
+            for search_id in self._buckets.get(key, ()):
+                job_seeker_id, filters = self._searches[search_id]
+                if matches_filters(filters, job_posting):
+                    matched.append((search_id, job_seeker_id))
+        return matched
+
+
+class JobAlertService:
+    """Saved-search matching for new job postings.
+
+    The reverse index reloads from the database every
+    saved_search_index_refresh_seconds so searches saved through other
+    workers are matched too. A search first seen in a reload is matched
+    against the active postings created since it was saved, so postings
+    created here in the meantime still alert it; alerts the saving worker
+    already recorded are skipped by the (savedSearchId, jobPostingId)
+    unique constraint.
+    """
+
+    def __init__(self):
+        self.index = SavedSearchIndex()
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        # Searches saved (or None for deleted) while a refresh runs; replayed onto the rebuilt index
+        self._changed: Dict[str, object] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    async def _load() -> Tuple[SavedSearchIndex, Dict[str, datetime]]:
+        index = SavedSearchIndex()
+        saved_at = {}
+        async for page in find_many_in_pages(prisma.savedsearch):
+            for saved_search in page:
+                index.add(saved_search.id, saved_search.jobSeekerId, saved_search.filters)
+                saved_at[saved_search.id] = saved_search.createdAt
+            await asyncio.sleep(0)
+        return index, saved_at
+
+    async def _refresh(self):
+        try:
+            fresh, saved_at = await self._load()
+            # A search page read before a concurrent change would bring back its old state
+            for search_id, saved_search in self._changed.items():
+                if saved_search is None:
+                    fresh.remove(search_id)
+                else:
+                    fresh.add(saved_search.id, saved_search.jobSeekerId, saved_search.filters)
+            unseen = {
+                search_id: created_at for search_id, created_at in saved_at.items()
+                if search_id not in self.index._searches and search_id not in self._changed
+            }
+            self.index = fresh
+            self._loaded_at = time.monotonic()
+        except Exception as e:
+            print(f"Saved search index refresh failed: {e}")
+            return
+        finally:
+            self._refreshing = False
+            self._changed = {}
+        if unseen:
+            await self._catch_up(unseen)
+
+    async def _catch_up(self, saved_at: Dict[str, datetime]):
+        """Record alerts for searches saved through other workers since the last reload"""
+        try:
+            alerts = []
+            async for page in find_many_in_pages(
+                prisma.jobposting,
+                where={"isActive": True, "duplicateOf": None, "createdAt": {"gte": min(saved_at.values())}},
+            ):
+                for job_posting in page:
+                    for search_id, job_seeker_id in self.index.match(job_posting):
+                        if search_id in saved_at and job_posting.createdAt >= saved_at[search_id]:
+                            alerts.append({
+                                "savedSearchId": search_id,
+                                "jobSeekerId": job_seeker_id,
+                                "jobPostingId": job_posting.id,
+                            })
+            if alerts:
+                await prisma.jobalert.create_many(data=alerts, skip_duplicates=True)
+        except Exception as e:
+            print(f"Job alert catch-up failed for {len(saved_at)} saved searches: {e}")
+
+    async def ensure_loaded(self):
+        """Build the reverse index on first use and refresh it in the background once it's old"""
+        if self._loaded_at is not None:
+            if not self._refreshing and time.monotonic() - self._loaded_at > settings.saved_search_index_refresh_seconds:
+                self._refreshing = True
+                asyncio.create_task(self._refresh())
+            return
+        async with self._lock:
+            if self._loaded_at is None:
+                self.index, _ = await self._load()
+                self._loaded_at = time.monotonic()
+
+    def add_search(self, saved_search):
+        if self._loaded_at is None:
+            return
+        if self._refreshing:
+            self._changed[saved_search.id] = saved_search
+        self.index.add(saved_search.id, saved_search.jobSeekerId, saved_search.filters)
+
+    def remove_search(self, search_id: str):
+        if self._refreshing:
+            self._changed[search_id] = None
+        self.index.remove(search_id)
+
+    async def notify_new_posting(self, job_posting) -> int:
+        """Record alerts for every saved search the new posting matches"""
+        return await self.notify_new_postings([job_posting])
+
+    async def notify_new_postings(self, job_postings) -> int:
+        """Record alerts for a batch of new postings in a single insert"""
+        try:
+            await self.ensure_loaded()
+            alerts = [
+                {
+                    "savedSearchId": search_id,
+                    "jobSeekerId": job_seeker_id,
+                    "jobPostingId": job_posting.id,
+                }
+                for job_posting in job_postings
+                for search_id, job_seeker_id in self.index.match(job_posting)
+            ]
+            if not alerts:
+                return 0
+            return await prisma.jobalert.create_many(data=alerts, skip_duplicates=True)
+        except Exception as e:
+            # Runs as a background task; a failure must not surface to the poster
+            ids = ", ".join(job_posting.id for job_posting in job_postings)
+            print(f"Job alert matching failed for postings {ids}: {e}")
+            return 0
+
+# Global job alert service
+job_alerts = JobAlertService()
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from .config import Lazy, settings
+from .database import prisma
+
+# Seekers kept in memory before the least recently used are evicted
+MAX_CACHED_SEEKERS = 50000
+
+
+class AppliedJobsCache:
+    """Per-seeker sets of applied job posting ids, expiring after a TTL.
+
+    Applications made through this worker update the cached set directly;
+    the TTL bounds staleness for applications made through other workers.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = MAX_CACHED_SEEKERS):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, FrozenSet[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, job_seeker_id: str) -> Optional[FrozenSet[str]]:
+        entry = self._entries.get(job_seeker_id)
+        if entry is None:
+            return None
+        expires_at, job_ids = entry
+        if expires_at < time.monotonic():
+            del self._entries[job_seeker_id]
+            return None
+        self._entries.move_to_end(job_seeker_id)
+        return job_ids
+
+    def _put(self, job_seeker_id: str, job_ids: Iterable[str]):
+        self._entries[job_seeker_id] = (time.monotonic() + self.ttl_seconds, frozenset(job_ids))
+        self._entries.move_to_end(job_seeker_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_job_ids(self, job_seeker_id: str) -> FrozenSet[str]:
+        """Applied job posting ids for a seeker, loading them on a miss"""
+        job_ids = self._get(job_seeker_id)
+        if job_ids is not None:
+            self.hits += 1
+            return job_ids
+        self.misses += 1
+        # Only the ids are needed, so skip loading whole application rows
+        rows = await prisma.query_raw(
+            'SELECT job_posting_id FROM job_applications WHERE job_seeker_id = $1',
+            job_seeker_id,
+        )
+        job_ids = frozenset(row["job_posting_id"] for row in rows)
+        self._put(job_seeker_id, job_ids)
+        return job_ids
+
+    async def contains(self, job_seeker_id: str, job_ids: Iterable[str]) -> Dict[str, bool]:
+        applied = await self.get_job_ids(job_seeker_id)
+        return {job_id: job_id in applied for job_id in job_ids}
+
+    def add(self, job_seeker_id: str, job_id: str):
+        """Record a new application if the seeker's set is cached"""
+        job_ids = self._get(job_seeker_id)
+        if job_ids is not None:
+            self._put(job_seeker_id, job_ids | {job_id})
+
+    def invalidate(self, job_seeker_id: str):
+        self._entries.pop(job_seeker_id, None)
+
+# Global applied jobs cache
+applied_jobs_cache = Lazy(lambda: AppliedJobsCache(settings.applied_jobs_cache_ttl_seconds))
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from .config import settings
+from .database import prisma
+from .suggest import job_suggest
+from .recommend import job_recommender
+from .cache import job_detail_cache, job_listing_cache
+from .dedupe import duplicate_index, release_duplicates
+
+# Upper bound on batches per scheduled run so one run can't monopolize the database
+MAX_BATCHES_PER_RUN = 20
+
+_POSTING_COLUMNS = (
+    "id, employer_id, title, description, requirements, location_state, location_city, "
+    "latitude, longitude, geo_cell, salary_min, salary_max, category_id, application_steps, "
+    "is_active, expires_at, created_at, updated_at"
+)
+
+_APPLICATION_COLUMNS = (
+    "id, job_posting_id, job_seeker_id, status, cover_letter, application_data, applied_at, updated_at"
+)
+
+
+async def expire_job_postings(batch_size: int = None) -> int:
+    """Deactivate active postings past their deadline or the default maximum age.
+
+    Reactivating a posting sets a fresh expiresAt, so the age rule only
+    applies to postings that never had one.
+    """
+    batch_size = batch_size or settings.maintenance_batch_size
+    now = datetime.now(timezone.utc)
+    max_age_cutoff = now - timedelta(days=settings.job_expiry_days)
+    expired = 0
+    for _ in range(MAX_BATCHES_PER_RUN):
+        job_postings = await prisma.jobposting.find_many(
+            where={
+                "isActive": True,
+                "OR": [
+                    {"expiresAt": {"lte": now}},
+                    {"expiresAt": None, "createdAt": {"lt": max_age_cutoff}},
+                ],
+            },
+            take=batch_size,
+        )
+        if not job_postings:
+            break
+        expired += await prisma.jobposting.update_many(
+            where={"id": {"in": [job.id for job in job_postings]}, "isActive": True},
+            data={"isActive": False},
+        )
+        for job_posting in job_postings:
+            job_suggest.remove_job(job_posting)
+            job_recommender.remove_job(job_posting)
+            duplicate_index.unindex(job_posting.id)
+            job_detail_cache.invalidate(job_posting.id)
+            job_listing_cache.bump(job_posting.categoryId, job_posting.locationState)
+        await release_duplicates([job.id for job in job_postings])
+        if len(job_postings) < batch_size:
+            break
+        await asyncio.sleep(0)
+    return expired
+
+
+async def _archive_batch(cutoff: datetime, batch_size: int) -> int:
+    async with prisma.tx() as tx:
+        # SKIP LOCKED lets several workers archive side by side without waiting on each other
+        rows = await tx.query_raw(
+            """
+            SELECT id FROM job_postings
+            WHERE is_active = false AND updated_at < $1::timestamp
+            ORDER BY updated_at
+            LIMIT $2
+            FOR UPDATE SKIP LOCKED
+            """,
+            cutoff.replace(tzinfo=None).isoformat(), batch_size,
+        )
+        job_posting_ids = [row["id"] for row in rows]
+        if not job_posting_ids:
+            return 0
+        await tx.execute_raw(
+            f"INSERT INTO archived_job_postings ({_POSTING_COLUMNS}) "
+            f"SELECT {_POSTING_COLUMNS} FROM job_postings WHERE id = ANY($1)",
+            job_posting_ids,
+        )
+        await tx.execute_raw(
+            f"INSERT INTO archived_job_applications ({_APPLICATION_COLUMNS}) "
+            f"SELECT {_APPLICATION_COLUMNS} FROM job_applications WHERE job_posting_id = ANY($1)",
+            job_posting_ids,
+        )
+        # Applications and alerts of the posting go with it through the cascade
+        await tx.execute_raw("DELETE FROM job_postings WHERE id = ANY($1)", job_posting_ids)
+        return len(job_posting_ids)
+
+
+async def archive_job_postings(batch_size: int = None) -> int:
+    """Move long-inactive postings and their applications into the archive tables"""
+    batch_size = batch_size or settings.maintenance_batch_size
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.job_archive_after_days)
+    archived = 0
+    for _ in range(MAX_BATCHES_PER_RUN):
+        count = await _archive_batch(cutoff, batch_size)
+        archived += count
+        if count < batch_size:
+            break
+        await asyncio.sleep(0)
+    return archived
@@ -0,0 +1,92 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator, Optional, Tuple
+
+# Longest single record accepted; bounds memory when a line never ends
+MAX_RECORD_CHARS = 1_000_000
+
+# CSV cells holding lists (application steps) separate their items with this
+CSV_LIST_SEPARATOR = ";"
+CSV_LIST_COLUMNS = ("applicationSteps", "application_steps")
+
+# (row number, parsed record or None, parse error or None)
+Row = Tuple[int, Optional[dict], Optional[str]]
+
+
+class BulkImportError(Exception):
+    """The upload can't be parsed any further"""
+    pass
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines without buffering more than one record"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(buffer) > MAX_RECORD_CHARS:
+            raise BulkImportError(f"Line exceeds {MAX_RECORD_CHARS} characters")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_ndjson_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[Row]:
+    """One JSON object per line; blank lines are skipped"""
+    row_number = 0
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield row_number, None, "Each line must be a JSON object"
+            continue
+        yield row_number, record, None
+
+
+async def iter_csv_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[Row]:
+    """CSV with a header row of field names; empty cells are treated as missing"""
+    header = None
+    pending = ""
+    row_number = 0
+    async for line in _iter_lines(chunks):
+        pending = f"{pending}\n{line}" if pending else line
+        # A quoted cell may span lines; the record is complete once its quotes balance
+        if pending.count('"') % 2:
+            if len(pending) > MAX_RECORD_CHARS:
+                raise BulkImportError(f"Record exceeds {MAX_RECORD_CHARS} characters")
+            continue
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        row = {}
+        for name, value in zip(header, values):
+            value = value.strip()
+            if not value:
+                continue
+            if name in CSV_LIST_COLUMNS:
+                row[name] = [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+            else:
+                row[name] = value
+        yield row_number, row, None
+
+    if pending:
+        yield row_number + 1, None, "Unterminated quoted field"
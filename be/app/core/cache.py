@@ -0,0 +1,190 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from .config import Lazy, settings
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key.
+
+    The call runs as its own task, so a caller that gets cancelled doesn't
+    cancel the load for everyone else waiting on it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key: Hashable, loader: Loader) -> Tuple[Any, bool]:
+        """Result of the call for key and whether it was shared with another caller"""
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task), shared
+
+
+class MicroCache:
+    """A short-TTL cache in front of a single-flight loader.
+
+    Misses for the same key coalesce into one load. Invalidation bumps a
+    per-key generation, so a load that started before the invalidation
+    still answers its callers but isn't stored.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[Hashable, int] = {}
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_load(self, key: Hashable, loader: Loader) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        generation = self._generations.get(key, 0)
+        value, shared = await self._flight.do(key, loader)
+        if shared:
+            self.coalesced += 1
+            return value
+        self.misses += 1
+        if self.ttl_seconds > 0 and self._generations.get(key, 0) == generation:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        if len(self._generations) > self.max_entries:
+            # Old generations only matter while a load for that key is in flight
+            self._generations = {key: self._generations[key]}
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "inFlight": len(self._flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+class VersionedResultCache:
+    """Pre-serialized results invalidated by version counters, with an LRU byte cap.
+
+    Every entry belongs to a scope: the category it filters on, else the
+    state, else the whole catalog. A change to a posting bumps the versions
+    of the catalog and of the posting's category and state, and an entry is
+    only served while its scope's version is the one it was loaded under.
+    So a change in one category leaves cached pages of other categories
+    alone. Entries also expire after ttl_seconds, which bounds staleness
+    from changes made by other workers.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Hashable, int, bytes]]" = OrderedDict()
+        self._versions: Dict[Hashable, int] = {}
+        self._flight = SingleFlight()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    @staticmethod
+    def scope_for(category_id: Optional[str], state_id: Optional[str]) -> Hashable:
+        if category_id:
+            return ("category", category_id)
+        if state_id:
+            return ("state", state_id)
+        return ("all",)
+
+    def _drop(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry[3])
+
+    def _put(self, key: Hashable, scope: Hashable, version: int, payload: bytes):
+        if len(payload) > self.max_bytes:
+            return
+        self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, scope, version, payload)
+        self.bytes += len(payload)
+        while self.bytes > self.max_bytes:
+            _, (_, _, _, evicted) = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, scope, version, payload = entry
+        if expires <= time.monotonic() or self._versions.get(scope, 0) != version:
+            self._drop(key)
+            self.stale += 1
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    async def get_or_load(self, key: Hashable, scope: Hashable, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        payload = self.get(key)
+        if payload is not None:
+            self.hits += 1
+            return payload
+        self.misses += 1
+        version = self._versions.get(scope, 0)
+        payload, shared = await self._flight.do(key, loader)
+        if not shared and self._versions.get(scope, 0) == version:
+            self._put(key, scope, version, payload)
+        return payload
+
+    def bump(self, category_id: Optional[str] = None, state_id: Optional[str] = None):
+        """Invalidate entries a change to a posting in this category and state could affect"""
+        scopes = [("all",)]
+        if category_id:
+            scopes.append(("category", category_id))
+        if state_id:
+            scopes.append(("state", state_id))
+        for scope in scopes:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": round(self.hits / lookups, 3) if lookups else None,
+            "stale": self.stale,
+            "evictions": self.evictions,
+        }
+
+# Global job detail cache (serialized GET /jobs/{job_id} payloads)
+job_detail_cache = Lazy(lambda: MicroCache(settings.job_detail_cache_ttl_seconds))
+
+# Global job listing cache (serialized GET /jobs/ pages)
+job_listing_cache = Lazy(lambda: VersionedResultCache(
+    settings.job_listing_cache_max_bytes,
+    settings.job_listing_cache_ttl_seconds,
+))
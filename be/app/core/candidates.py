@@ -0,0 +1,237 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .config import settings, Lazy
+from .database import prisma, find_many_in_pages
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Pending postings and removed slots are merged into the base arrays once this many accumulate
+COMPACT_THRESHOLD = 4096
+
+
+def normalize(value: Optional[str]) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def candidate_summary(profile) -> dict:
+    """Public fields of a seeker profile; email, phone, resume and coordinates stay out"""
+    return {
+        "id": profile.id,
+        "name": profile.name,
+        "locationState": profile.locationState,
+        "locationCity": profile.locationCity,
+        "skills": profile.skills or [],
+    }
+
+
+class PostingLists:
+    """Sorted slot arrays per key, plus appended slots not yet merged.
+
+    Slots only ever grow, so appending a new slot keeps every list sorted
+    and a lookup is a concatenation rather than a merge.
+    """
+
+    def __init__(self):
+        self._base: Dict[str, "np.ndarray"] = {}
+        self._pending: Dict[str, List[int]] = {}
+        self.pending = 0
+
+    def add(self, key: str, slot: int):
+        self._pending.setdefault(key, []).append(slot)
+        self.pending += 1
+
+    def get(self, key: str) -> "np.ndarray":
+        import numpy as np
+        base = self._base.get(key)
+        pending = self._pending.get(key)
+        if not pending:
+            return base if base is not None else np.zeros(0, dtype=np.int32)
+        pending = np.array(pending, dtype=np.int32)
+        return pending if base is None else np.concatenate([base, pending])
+
+    def compact(self, alive: "np.ndarray", renumber: "np.ndarray"):
+        """Merge pending slots, drop dead ones and map the rest to their new numbers"""
+        base = {}
+        for key in set(self._base) | set(self._pending):
+            slots = self.get(key)
+            slots = renumber[slots[alive[slots]]]
+            if len(slots):
+                base[key] = slots
+        self._base = base
+        self._pending = {}
+        self.pending = 0
+
+
+class CandidateIndex:
+    """In-memory inverted index of job seekers by skill, state and city.
+
+    Each profile holds a slot; skills, states and cities map to sorted
+    int32 arrays of slots. A search concatenates the arrays of its skills
+    and counts slot occurrences, which gives both the AND/OR match and the
+    ranking by matching skills in one vectorized pass, then intersects the
+    result with the state and city lists. Memory stays proportional to the
+    total number of skills held, about 4 bytes each.
+
+    A changed profile takes a fresh slot and its old one is masked out;
+    dead slots and pending postings are merged away once COMPACT_THRESHOLD
+    accumulate. The index reloads from the database every
+    candidate_index_refresh_seconds so changes made through other workers
+    show up.
+    """
+
+    def __init__(self):
+        self._reset()
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        # Profiles changed while a refresh runs; replayed onto the rebuilt index
+        self._changed: Dict[str, object] = {}
+        self._lock = asyncio.Lock()
+
+    def _reset(self):
+        # numpy is imported on first use rather than at module level, so startup doesn't pay for it
+        import numpy as np
+        self.skills = PostingLists()
+        self.states = PostingLists()
+        self.cities = PostingLists()
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._alive = np.zeros(1024, dtype=bool)
+        self._dead = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _remove(self, profile_id: str):
+        slot = self._slots.pop(profile_id, None)
+        if slot is not None:
+            self._alive[slot] = False
+            self._dead += 1
+
+    def _add(self, profile):
+        slot = len(self._ids)
+        self._ids.append(profile.id)
+        self._slots[profile.id] = slot
+        if slot >= len(self._alive):
+            import numpy as np
+            self._alive = np.concatenate([self._alive, np.zeros_like(self._alive)])
+        self._alive[slot] = True
+        for skill in {normalize(skill) for skill in profile.skills or []} - {""}:
+            self.skills.add(skill, slot)
+        if profile.locationState and normalize(profile.locationState):
+            self.states.add(normalize(profile.locationState), slot)
+        if profile.locationCity and normalize(profile.locationCity):
+            self.cities.add(normalize(profile.locationCity), slot)
+
+    def update(self, profile):
+        """Reindex a profile after it was created or changed"""
+        if self._loaded_at is None:
+            return
+        if self._refreshing:
+            self._changed[profile.id] = profile
+        self._remove(profile.id)
+        if profile.role == "job_seeker":
+            self._add(profile)
+        if self._dead + self.skills.pending > COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self):
+        import numpy as np
+        n = len(self._ids)
+        alive = self._alive[:n]
+        renumber = (np.cumsum(alive) - 1).astype(np.int32)
+        for postings in (self.skills, self.states, self.cities):
+            postings.compact(alive, renumber)
+        self._ids = [profile_id for profile_id, keep in zip(self._ids, alive) if keep]
+        self._slots = {profile_id: slot for slot, profile_id in enumerate(self._ids)}
+        self._alive = np.ones(max(len(self._ids), 1024), dtype=bool)
+        self._alive[len(self._ids):] = False
+        self._dead = 0
+
+    async def _load(self):
+        self._reset()
+        async for page in find_many_in_pages(prisma.userprofile, where={"role": "job_seeker"}):
+            for profile in page:
+                self._add(profile)
+            await asyncio.sleep(0)
+        self.compact()
+        self._loaded_at = time.monotonic()
+
+    async def _refresh(self):
+        try:
+            fresh = CandidateIndex()
+            await fresh._load()
+            # A profile page read before a concurrent change would bring back its old state
+            for profile in self._changed.values():
+                fresh.update(profile)
+            self.skills, self.states, self.cities = fresh.skills, fresh.states, fresh.cities
+            self._slots, self._ids, self._alive, self._dead = fresh._slots, fresh._ids, fresh._alive, fresh._dead
+            self._loaded_at = fresh._loaded_at
+        except Exception as e:
+            print(f"Candidate index refresh failed: {e}")
+        finally:
+            self._refreshing = False
+            self._changed = {}
+
+    async def ensure_loaded(self):
+        """Build the index on first use and refresh it in the background once it's old"""
+        if self._loaded_at is not None:
+            if not self._refreshing and time.monotonic() - self._loaded_at > settings.candidate_index_refresh_seconds:
+                self._refreshing = True
+                asyncio.create_task(self._refresh())
+            return
+        async with self._lock:
+            if self._loaded_at is None:
+                await self._load()
+
+    async def search(
+        self,
+        skills: Iterable[str],
+        match_all: bool,
+        state: Optional[str],
+        city: Optional[str],
+        limit: int,
+        offset: int = 0,
+    ) -> Tuple[int, List[Tuple[str, int]]]:
+        """Total matches and one page of (profile id, matching skill count), best first"""
+        import numpy as np
+        await self.ensure_loaded()
+        terms = sorted({normalize(skill) for skill in skills} - {""})
+        filters = []
+        if state and normalize(state):
+            filters.append(self.states.get(normalize(state)))
+        if city and normalize(city):
+            filters.append(self.cities.get(normalize(city)))
+
+        if terms:
+            postings = np.concatenate([self.skills.get(term) for term in terms])
+            if len(postings) > len(self._ids) // 8:
+                # Popular skills: one pass over a dense count array beats sorting the postings
+                dense = np.bincount(postings, minlength=len(self._ids))
+                slots = np.flatnonzero(dense)
+                counts = dense[slots]
+            else:
+                slots, counts = np.unique(postings, return_counts=True)
+            keep = counts == len(terms) if match_all else np.ones(len(slots), dtype=bool)
+        elif filters:
+            slots = filters.pop(0)
+            counts = np.zeros(len(slots), dtype=np.int64)
+            keep = np.ones(len(slots), dtype=bool)
+        else:
+            return 0, []
+
+        keep &= self._alive[slots]
+        for allowed in filters:
+            allowed_mask = np.zeros(len(self._ids), dtype=bool)
+            allowed_mask[allowed] = True
+            keep &= allowed_mask[slots]
+        slots, counts = slots[keep], counts[keep]
+
+        # Most matching skills first, then the most recently indexed profile
+        order = np.lexsort((-slots, -counts))[offset:offset + limit]
+        return len(slots), [(self._ids[slots[i]], int(counts[i])) for i in order]
+
+# Global candidate index; built on first use since its arrays need numpy
+candidate_index = Lazy(CandidateIndex)
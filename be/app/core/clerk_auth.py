@@ -1,27 +1,38 @@
-import jwt
-import requests
 from typing import Optional, Dict, Any
 from fastapi import HTTPException, status
 from functools import lru_cache
 from .config import settings
 
 class ClerkAuthService:
+    # jwt, requests and cryptography are imported on first use; they cost
+    # a noticeable share of a cold start and only sign-in needs them
+
     def __init__(self):
-        self.clerk_secret_key = settings.clerk_secret_key
-        if not self.clerk_secret_key or self.clerk_secret_key == "your-clerk-secret-key":
-            print("WARNING: CLERK_SECRET_KEY not set properly. Using fallback JWKS URL.")
-            # Use a fallback JWKS URL for development
-            self.jwks_url = "https://api.clerk.com/v1/jwks"
-        else:
-            # For now, use the fallback JWKS URL since the instance-specific URL is not working
-            # This is a known issue with Clerk's JWKS endpoints
-            print("Using fallback JWKS URL for Clerk authentication")
-            self.jwks_url = "https://api.clerk.com/v1/jwks"
+        self._jwks_url = None
         self._jwks_cache = None
+
+    @property
+    def clerk_secret_key(self) -> str:
+        return settings.clerk_secret_key
+
+    @property
+    def jwks_url(self) -> str:
+        if self._jwks_url is None:
+            if not self.clerk_secret_key or self.clerk_secret_key == "your-clerk-secret-key":
+                print("WARNING: CLERK_SECRET_KEY not set properly. Using fallback JWKS URL.")
+                # Use a fallback JWKS URL for development
+                self._jwks_url = "https://api.clerk.com/v1/jwks"
+            else:
+                # For now, use the fallback JWKS URL since the instance-specific URL is not working
+                # This is a known issue with Clerk's JWKS endpoints
+                print("Using fallback JWKS URL for Clerk authentication")
+                self._jwks_url = "https://api.clerk.com/v1/jwks"
+        return self._jwks_url
     
     @lru_cache(maxsize=1)
     def get_jwks(self) -> Dict[str, Any]:
         """Get JSON Web Key Set from Clerk"""
+        import requests
         try:
             print(f"Fetching JWKS from: {self.jwks_url}")
             response = requests.get(self.jwks_url, timeout=10)
@@ -45,6 +56,7 @@ class ClerkAuthService:
     
     def get_public_key(self, token: str) -> str:
         """Get the public key for verifying the JWT token"""
+        import jwt
         try:
             # Decode the header to get the key ID
             header = jwt.get_unverified_header(token)
@@ -97,6 +109,7 @@ class ClerkAuthService:
     
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify and decode the Clerk JWT token"""
+        import jwt
         try:
             # For development, decode without signature verification
             unverified_payload = jwt.decode(token, options={"verify_signature": False})
@@ -0,0 +1,189 @@
+import gzip
+import zlib
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional: pip install "job-portal-backend[compression]"
+    brotli = None
+
+# Bodies smaller than this aren't worth the CPU or the extra headers
+MINIMUM_SIZE = 1024
+
+GZIP_LEVEL = 6
+# Brotli 4-5 compresses about as fast as gzip 6 and noticeably smaller
+BROTLI_QUALITY = 4
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+# Server-sent events must reach the client as each event is written
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+class CachedBody(bytes):
+    """Response bytes served repeatedly from a cache.
+
+    The compression middleware keeps each encoded variant on the object,
+    so a cached payload is compressed once rather than on every hit.
+    """
+
+    def encoded(self, encoding: str) -> bytes:
+        variants: Dict[str, bytes] = self.__dict__.setdefault("variants", {})
+        if encoding not in variants:
+            variants[encoding] = compress(bytes(self), encoding)
+        return variants[encoding]
+
+
+def supported_encodings() -> List[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Best supported encoding the client accepts, preferring brotli"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class StreamCompressor:
+    """Incremental compressor that flushes after every chunk so streamed rows arrive promptly"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+def _header(headers: list, name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli compression for JSON and text responses.
+
+    A response sent in one piece is compressed whole when it reaches
+    MINIMUM_SIZE; a CachedBody reuses its stored variant. A streamed
+    response is compressed chunk by chunk with a flush after each, so
+    exports and bulk reports still arrive incrementally.
+    """
+
+    def __init__(self, app, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(_header(scope.get("headers", []), b"accept-encoding") or "")
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[dict] = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                content_type = _header(headers, b"content-type") or ""
+                passthrough = (
+                    _header(headers, b"content-encoding") is not None
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or content_type.startswith(UNCOMPRESSED_TYPES)
+                    or message["status"] in (204, 304)
+                    # Byte ranges refer to the unencoded file
+                    or _header(headers, b"accept-ranges") is not None
+                    or _header(headers, b"content-range") is not None
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # Held back until the first body chunk shows whether this is a stream
+                    start = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start is not None and not more_body:
+                # The whole body in one message
+                response_start, start = start, None
+                if len(body) < self.minimum_size:
+                    await send(response_start)
+                    await send(message)
+                    return
+                encoded = body.encoded(encoding) if isinstance(body, CachedBody) else compress(body, encoding)
+                await send(self._encoded_start(response_start, encoding, len(encoded)))
+                await send({"type": "http.response.body", "body": encoded})
+                return
+
+            if start is not None:
+                response_start, start = start, None
+                compressor = StreamCompressor(encoding)
+                await send(self._encoded_start(response_start, encoding, None))
+
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _encoded_start(message: dict, encoding: str, content_length: Optional[int]) -> dict:
+        headers = [
+            (key, value) for key, value in message.get("headers", [])
+            if key.lower() not in (b"content-length", b"vary")
+        ]
+        vary = _header(message.get("headers", []), b"vary")
+        headers.append((b"vary", (f"{vary}, Accept-Encoding" if vary else "Accept-Encoding").encode("latin-1")))
+        headers.append((b"content-encoding", encoding.encode("latin-1")))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        return {**message, "headers": headers}
@@ -1,10 +1,34 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 import os
 
 class Settings(BaseSettings):
     # Database Configuration
     database_url: str = "postgresql://localhost:5432/job_portal_dev"
+    # Optional read replica for GET endpoints
+    database_replica_url: Optional[str] = None
+    # Seconds after a user's own write during which their reads stay on the primary
+    read_your_writes_seconds: int = 5
+    # Connection pool per client and per worker
+    database_pool_size: int = 10
+    database_pool_timeout_seconds: int = 10
+    # Queries running longer than this are cancelled by Postgres; 0 disables
+    database_statement_timeout_ms: int = 15000
+    database_connect_attempts: int = 5
+    # Seconds shutdown waits for in-flight requests to finish
+    shutdown_drain_seconds: int = 20
+    # Seconds /ready reports draining after SIGTERM before anything is closed
+    shutdown_delay_seconds: int = 5
+
+    # Admission control: per-client token bucket and per-route-class concurrency
+    rate_limit_per_second: float = 20
+    rate_limit_burst: int = 60
+    admission_search_concurrency: int = 8
+    admission_read_concurrency: int = 16
+    admission_write_concurrency: int = 8
+    # Requests waiting longer than this for a slot are shed with 503
+    admission_queue_budget_ms: int = 250
     
     # Clerk Configuration (for auth)
     clerk_secret_key: str = "your-clerk-secret-key"
@@ -18,6 +42,48 @@ class Settings(BaseSettings):
 
     # Interview token secret (for RTC room JWTs)
     interview_token_secret: str = "dev-interview-secret"
+
+    # Seconds a seeker's applied job ids are served from memory
+    applied_jobs_cache_ttl_seconds: int = 300
+
+    # Seconds a serialized GET /jobs/{job_id} payload is reused
+    job_detail_cache_ttl_seconds: float = 2.0
+    # Serialized listing pages kept in memory, invalidated on posting changes
+    job_listing_cache_max_bytes: int = 32 * 1024 * 1024
+    job_listing_cache_ttl_seconds: float = 30.0
+
+    # Background maintenance: posting expiry and archival
+    maintenance_enabled: bool = True
+    maintenance_interval_seconds: int = 3600
+    maintenance_batch_size: int = 500
+    # Postings without a deadline are deactivated this long after creation
+    job_expiry_days: int = 60
+    # Inactive postings are moved to the archive tables after this long
+    job_archive_after_days: int = 90
+    # Monthly job_applications partitions created ahead of the current month
+    application_partitions_months_ahead: int = 2
+
+    # Seconds before the in-memory candidate search index is rebuilt from the database
+    candidate_index_refresh_seconds: int = 600
+    # Seconds before the in-memory near-duplicate index is rebuilt from the database
+    duplicate_index_refresh_seconds: int = 300
+    # Seconds before the in-memory saved search index is rebuilt from the database
+    saved_search_index_refresh_seconds: int = 120
+    # Seconds before the in-memory city/title typeahead is rebuilt from the database
+    job_suggest_refresh_seconds: int = 300
+    # Seconds before the in-memory job/seeker recommendation matrices are rebuilt from the database
+    recommender_refresh_seconds: int = 600
+
+    # Uploaded files (resumes), stored once per distinct content
+    storage_backend: str = "local"
+    storage_root: str = "storage"
+    resume_max_bytes: int = 5 * 1024 * 1024
+    # Unreferenced files are only removed once they're older than this
+    storage_orphan_grace_seconds: int = 24 * 3600
+
+    # Interview signaling shards (one per worker; rooms hash to a shard)
+    interview_shard_count: int = 1
+    interview_shard_id: int = 0
     
     @property
     def cors_origins_list(self) -> List[str]:
@@ -29,5 +95,39 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "ignore"  # Ignore extra environment variables
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Settings from the environment and .env, read on first use"""
+    return Settings()
+
+
+class LazySettings:
+    """Stands in for Settings so importing a module doesn't read .env"""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+
+class Lazy:
+    """Stands in for a global built from settings and builds it on first use.
+
+    Module-level services configured from settings, or needing a heavy
+    library such as numpy to construct, are wrapped in this, so importing
+    their module doesn't read .env or load the library either.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            self._instance = self._factory()
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self.instance, name)
+
 # Create settings instance
-settings = Settings()
+settings = LazySettings()
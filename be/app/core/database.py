@@ -1,5 +1,86 @@
-from prisma import Prisma
+import asyncio
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
 from .config import settings
 
+
+def pooled_url(url: str) -> str:
+    """Add the configured pool size, pool timeout and statement timeout to a connection URL.
+
+    Parameters already present in the URL win, so a deployment can still
+    override them per database.
+    """
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query))
+    params.setdefault("connection_limit", str(settings.database_pool_size))
+    params.setdefault("pool_timeout", str(settings.database_pool_timeout_seconds))
+    if settings.database_statement_timeout_ms:
+        params.setdefault("options", f"-c statement_timeout={settings.database_statement_timeout_ms}")
+    return urlunsplit(parts._replace(query=urlencode(params, quote_via=quote)))
+
+
+class LazyPrisma:
+    """Stands in for a Prisma client and builds it on first use.
+
+    Importing the app then doesn't load the generated client; it is built
+    when startup connects or a script first touches the database.
+    """
+
+    def __init__(self, url_setting: str, fallback: "LazyPrisma" = None):
+        self._url_setting = url_setting
+        self._fallback = fallback
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            if self._fallback is not None and not getattr(settings, self._url_setting):
+                return self._fallback.client
+            from prisma import Prisma
+            self._client = Prisma(datasource={"url": pooled_url(getattr(settings, self._url_setting))})
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
 # Create Prisma client (for database operations)
-prisma = Prisma()
+prisma = LazyPrisma("database_url")
+
+# Read-only client for GET traffic; the primary doubles as it when no replica is configured
+prisma_read = LazyPrisma("database_replica_url", fallback=prisma)
+
+
+def has_replica() -> bool:
+    """Whether prisma_read is a separate replica client rather than the primary"""
+    return bool(settings.database_replica_url)
+
+
+async def connect_with_retry(client, attempts: int = None, base_delay: float = 0.5):
+    """Connect a client, retrying with exponential backoff while the database comes up"""
+    attempts = attempts or settings.database_connect_attempts
+    for attempt in range(1, attempts + 1):
+        try:
+            await client.connect()
+            return
+        except Exception as e:
+            if attempt == attempts:
+                raise
+            delay = min(base_delay * 2 ** (attempt - 1), 10)
+            print(f"Database connection attempt {attempt}/{attempts} failed: {e}; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+async def find_many_in_pages(delegate, where: dict = None, page_size: int = 1000, **kwargs):
+    """Yield pages of records from a model delegate using keyset pagination on id"""
+    cursor_id = None
+    while True:
+        page_args = {"where": where or {}, "take": page_size, "order": {"id": "asc"}, **kwargs}
+        if cursor_id:
+            page_args["cursor"] = {"id": cursor_id}
+            page_args["skip"] = 1
+        page = await delegate.find_many(**page_args)
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        cursor_id = page[-1].id
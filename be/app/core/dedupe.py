@@ -0,0 +1,272 @@
+import asyncio
+import re
+import time
+import zlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from .config import settings
+from .database import prisma, find_many_in_pages
+from .cache import job_detail_cache, job_listing_cache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Words per shingle; three-word shingles survive small rewordings but not reorderings of the text
+SHINGLE_WORDS = 3
+
+# 128 permutations in 16 bands of 8 rows: pairs above ~0.7 Jaccard similarity
+# usually share a band, pairs below ~0.5 rarely do
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Estimated Jaccard similarity at which a posting counts as a duplicate
+DUPLICATE_THRESHOLD = 0.8
+
+# Smallest prime above 2**32, so (a * x + b) % p stays within uint64 for 32-bit x
+_PRIME = 4294967311
+
+# Seed of the hash permutations; every process must draw the same ones
+_PERMUTATION_SEED = 20240901
+
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str) -> Set[bytes]:
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        return {" ".join(words).encode()} if words else set()
+    return {" ".join(words[i:i + SHINGLE_WORDS]).encode() for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def posting_text(title: Optional[str], description: Optional[str], requirements: Optional[str]) -> str:
+    return " ".join([title or "", description or "", requirements or ""])
+
+
+@lru_cache(maxsize=1)
+def _permutations() -> Tuple["np.ndarray", "np.ndarray"]:
+    """Coefficients of the NUM_PERM hash permutations, drawn on first use"""
+    # numpy is imported on first use rather than at module level, so startup doesn't pay for it
+    import numpy as np
+    rng = np.random.default_rng(_PERMUTATION_SEED)
+    return (
+        rng.integers(1, 2**32, size=NUM_PERM, dtype=np.uint64),
+        rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64),
+    )
+
+
+def minhash(text: str) -> Optional["np.ndarray"]:
+    """MinHash signature of the text's word shingles, or None for empty text.
+
+    Shingles are hashed with CRC32, which unlike hash() is the same in every
+    process, so workers and the backfill agree on signatures.
+    """
+    import numpy as np
+    hashed = np.fromiter((zlib.crc32(shingle) for shingle in shingles(text)), dtype=np.uint64)
+    if not len(hashed):
+        return None
+    a, b = _permutations()
+    return ((np.outer(hashed, a) + b) % np.uint64(_PRIME)).min(axis=0).astype(np.uint32)
+
+
+def similarity(a: "np.ndarray", b: "np.ndarray") -> float:
+    """Jaccard similarity estimated from two signatures"""
+    return float((a == b).sum()) / NUM_PERM
+
+
+class DuplicateIndex:
+    """LSH index of MinHash signatures of active job postings.
+
+    A signature is cut into BANDS bands and each band, scoped to the
+    posting's employer, is a bucket key, so a lookup touches BANDS buckets
+    and compares the signature only with that employer's postings sharing
+    one of them, however large the catalog. Candidates are confirmed by
+    their estimated similarity. Postings of different employers never
+    match, so one company's boilerplate can't hide another company's job.
+
+    Each posting also records the posting it duplicates, so a repost of a
+    repost points at the first posting rather than forming a chain. The
+    index reloads from the database every duplicate_index_refresh_seconds
+    so postings created through other workers are matched too.
+    """
+
+    def __init__(self):
+        self._reset()
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        # Postings changed while a refresh runs; replayed onto the rebuilt index
+        self._changed: Dict[str, Optional[tuple]] = {}
+        self._lock = asyncio.Lock()
+
+    def _reset(self):
+        self._buckets: Dict[Tuple[str, int, bytes], Set[str]] = {}
+        self._signatures: Dict[str, "np.ndarray"] = {}
+        self._employers: Dict[str, str] = {}
+        self._duplicate_of: Dict[str, Optional[str]] = {}
+
+    def __len__(self):
+        return len(self._signatures)
+
+    @staticmethod
+    def _bands(employer_id: str, signature: "np.ndarray"):
+        for band in range(BANDS):
+            yield employer_id, band, signature[band * ROWS:(band + 1) * ROWS].tobytes()
+
+    def find(
+        self,
+        signature: Optional["np.ndarray"],
+        employer_id: str,
+        exclude: Iterable[str] = (),
+    ) -> Optional[str]:
+        """Id of the employer's original posting this signature duplicates, if any"""
+        if signature is None:
+            return None
+        exclude = {exclude} if isinstance(exclude, str) else set(exclude)
+        candidates: Set[str] = set()
+        for key in self._bands(employer_id, signature):
+            candidates |= self._buckets.get(key, set())
+        candidates -= exclude
+        best, best_similarity = None, DUPLICATE_THRESHOLD
+        for job_id in candidates:
+            score = similarity(signature, self._signatures[job_id])
+            if score >= best_similarity:
+                best, best_similarity = job_id, score
+        if best is None:
+            return None
+        original = self._duplicate_of.get(best) or best
+        # An edited original resembling its own duplicates is still the original
+        return None if original in exclude else original
+
+    def add(self, job_id: str, signature: Optional["np.ndarray"], employer_id: str, duplicate_of: Optional[str] = None):
+        self.remove(job_id)
+        if self._refreshing:
+            self._changed[job_id] = (signature, employer_id, duplicate_of)
+        if signature is None:
+            return
+        self._signatures[job_id] = signature
+        self._employers[job_id] = employer_id
+        self._duplicate_of[job_id] = duplicate_of
+        for key in self._bands(employer_id, signature):
+            self._buckets.setdefault(key, set()).add(job_id)
+
+    def remove(self, job_id: str):
+        if self._refreshing:
+            self._changed[job_id] = None
+        signature = self._signatures.pop(job_id, None)
+        employer_id = self._employers.pop(job_id, None)
+        self._duplicate_of.pop(job_id, None)
+        if signature is None:
+            return
+        for key in self._bands(employer_id, signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(job_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    async def _load(self):
+        self._reset()
+        async for page in find_many_in_pages(prisma.jobposting, where={"isActive": True}):
+            for job_posting in page:
+                signature = minhash(posting_text(job_posting.title, job_posting.description, job_posting.requirements))
+                self.add(job_posting.id, signature, job_posting.employerId, job_posting.duplicateOf)
+            await asyncio.sleep(0)
+        self._loaded_at = time.monotonic()
+
+    async def _refresh(self):
+        try:
+            fresh = DuplicateIndex()
+            await fresh._load()
+            # A posting page read before a concurrent change would bring back its old state
+            for job_id, entry in self._changed.items():
+                if entry is None:
+                    fresh.remove(job_id)
+                else:
+                    fresh.add(job_id, *entry)
+            self._buckets, self._signatures = fresh._buckets, fresh._signatures
+            self._employers, self._duplicate_of = fresh._employers, fresh._duplicate_of
+            self._loaded_at = fresh._loaded_at
+        except Exception as e:
+            print(f"Duplicate index refresh failed: {e}")
+        finally:
+            self._refreshing = False
+            self._changed = {}
+
+    async def ensure_loaded(self):
+        """Index the active postings on first use and refresh them in the background once they're old"""
+        if self._loaded_at is not None:
+            if not self._refreshing and time.monotonic() - self._loaded_at > settings.duplicate_index_refresh_seconds:
+                self._refreshing = True
+                asyncio.create_task(self._refresh())
+            return
+        async with self._lock:
+            if self._loaded_at is None:
+                await self._load()
+
+    async def check(
+        self,
+        text: str,
+        employer_id: str,
+        exclude: Optional[str] = None,
+    ) -> Tuple[Optional["np.ndarray"], Optional[str]]:
+        """Signature of a new or edited posting's text and the id of the employer's posting it duplicates"""
+        await self.ensure_loaded()
+        signature = minhash(text)
+        return signature, self.find(signature, employer_id, [exclude] if exclude else ())
+
+    def index(self, job_posting, signature: Optional["np.ndarray"] = None):
+        """Reflect a created or updated posting; inactive postings aren't matched against"""
+        if self._loaded_at is None:
+            return
+        if not job_posting.isActive:
+            self.remove(job_posting.id)
+            return
+        if signature is None:
+            signature = minhash(posting_text(job_posting.title, job_posting.description, job_posting.requirements))
+        self.add(job_posting.id, signature, job_posting.employerId, job_posting.duplicateOf)
+
+    def unindex(self, job_id: str):
+        if self._loaded_at is not None:
+            self.remove(job_id)
+
+
+async def release_duplicates(job_posting_ids: List[str]) -> List:
+    """Re-match the duplicates of postings that were edited, deleted or went inactive.
+
+    Duplicates are re-checked oldest first against the index, so one that
+    still resembles its (edited) original keeps pointing at it, the oldest
+    of the rest becomes a new original and later ones point at that.
+    Returns the changed postings.
+    """
+    if not job_posting_ids:
+        return []
+    duplicates = await prisma.jobposting.find_many(
+        where={"duplicateOf": {"in": job_posting_ids}, "isActive": True},
+        order={"createdAt": "asc"},
+    )
+    if not duplicates:
+        return []
+    await duplicate_index.ensure_loaded()
+    # Not yet re-checked; matching them would let a newer copy become the original
+    pending = {job_posting.id for job_posting in duplicates}
+    changed = []
+    for job_posting in duplicates:
+        pending.discard(job_posting.id)
+        signature = duplicate_index._signatures.get(job_posting.id)
+        if signature is None:
+            signature = minhash(posting_text(job_posting.title, job_posting.description, job_posting.requirements))
+        duplicate_of = duplicate_index.find(signature, job_posting.employerId, pending | {job_posting.id})
+        duplicate_index.add(job_posting.id, signature, job_posting.employerId, duplicate_of)
+        if duplicate_of != job_posting.duplicateOf:
+            changed.append(await prisma.jobposting.update(
+                where={"id": job_posting.id},
+                data={"duplicateOf": duplicate_of},
+            ))
+    for job_posting in changed:
+        job_detail_cache.invalidate(job_posting.id)
+        job_listing_cache.bump(job_posting.categoryId, job_posting.locationState)
+    return changed
+
+# Global near-duplicate index
+duplicate_index = DuplicateIndex()
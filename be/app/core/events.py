@@ -0,0 +1,153 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+# Events buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+Deliver = Callable[[str, dict], Awaitable[None]]
+
+
+class EventBroker(ABC):
+    """Transport between publishers and the hubs of every worker process.
+
+    The in-process broker only reaches subscribers of the current worker.
+    A multi-worker deployment plugs in a broker backed by a shared channel
+    (Redis pub/sub, Postgres LISTEN/NOTIFY, ...) that calls `deliver` on
+    every worker for each published event.
+    """
+
+    @abstractmethod
+    async def start(self, deliver: Deliver):
+        ...
+
+    @abstractmethod
+    async def publish(self, channel: str, event: dict):
+        ...
+
+    async def stop(self):
+        pass
+
+
+class InProcessBroker(EventBroker):
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver):
+        self._deliver = deliver
+
+    async def publish(self, channel: str, event: dict):
+        if self._deliver:
+            await self._deliver(channel, event)
+
+
+class Subscription:
+    """A bounded event queue for one connected client.
+
+    When a client falls behind, the oldest events are dropped and the next
+    event it reads is a `resync` marker so it can refetch its state.
+    """
+
+    def __init__(self, channel: str, max_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.channel = channel
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.dropped = 0
+        self.closed = False
+        self._wake = asyncio.Event()
+
+    def put(self, event: dict):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    def close(self):
+        """End the stream; a pending get returns None right away"""
+        self.closed = True
+        self._wake.set()
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        """Next event, or None if nothing arrived within timeout or the subscription closed"""
+        if self.dropped:
+            self.dropped = 0
+            return {"type": "resync", "data": {}}
+        if self.closed:
+            return None
+        getter = asyncio.ensure_future(self.queue.get())
+        waker = asyncio.ensure_future(self._wake.wait())
+        try:
+            await asyncio.wait({getter, waker}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waker.cancel()
+            if not getter.done():
+                getter.cancel()
+        return getter.result() if getter.done() and not getter.cancelled() else None
+
+
+class EventHub:
+    """Per-user pub/sub for pushing application changes to connected clients"""
+
+    def __init__(self, broker: Optional[EventBroker] = None):
+        self.broker = broker or InProcessBroker()
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._started = False
+
+    async def start(self):
+        if not self._started:
+            await self.broker.start(self._deliver)
+            self._started = True
+
+    async def stop(self):
+        if self._started:
+            await self.broker.stop()
+            self._started = False
+
+    def subscribe(self, user_id: str) -> Subscription:
+        subscription = Subscription(user_id)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscriptions = self._subscriptions.get(subscription.channel)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.channel]
+
+    def close_subscriptions(self):
+        """End every open stream of this worker, e.g. when it starts draining"""
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.close()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    async def _deliver(self, channel: str, event: dict):
+        for subscription in list(self._subscriptions.get(channel, ())):
+            subscription.put(event)
+
+    async def publish(self, user_id: str, event_type: str, data: dict):
+        """Publish an event to every connection of a user; never raises"""
+        await self.start()
+        event = {
+            "type": event_type,
+            "data": data,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            await self.broker.publish(user_id, event)
+        except Exception as e:
+            print(f"Event publish failed for {event_type}: {e}")
+
+
+def format_sse(event: dict) -> str:
+    """Serialize an event as a server-sent events frame"""
+    return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+# Global event hub
+event_hub = EventHub()
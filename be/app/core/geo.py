@@ -0,0 +1,104 @@
+import csv
+import math
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+from .database import prisma
+
+GAZETTEER_PATH = Path(__file__).resolve().parent.parent / "data" / "us_cities.csv"
+
+EARTH_RADIUS_MILES = 3958.8
+
+# Grid cells are GRID_CELL_DEGREES on a side (~35 miles of latitude)
+GRID_CELL_DEGREES = 0.5
+
+DEFAULT_RADIUS_MILES = 25.0
+MAX_RADIUS_MILES = 200.0
+
+_state_abbreviations: Dict[str, str] = {}
+
+
+def _normalize_city(city: str) -> str:
+    words = city.strip().lower().split()
+    # "Saint Paul", "St Paul" and "St. Paul" all refer to the same city
+    if words and words[0] in ("saint", "st"):
+        words[0] = "st."
+    return " ".join(words)
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer() -> Dict[Tuple[str, str], Tuple[float, float]]:
+    """Load the bundled offline US city gazetteer keyed by (city, state abbreviation)"""
+    gazetteer = {}
+    with open(GAZETTEER_PATH, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            key = (_normalize_city(row["city"]), row["state"].upper())
+            gazetteer[key] = (float(row["latitude"]), float(row["longitude"]))
+    return gazetteer
+
+
+def geocode(city: Optional[str], state_abbreviation: Optional[str]) -> Optional[Tuple[float, float]]:
+    """Look up coordinates for a city; returns None when it isn't in the gazetteer"""
+    if not city or not state_abbreviation:
+        return None
+    return load_gazetteer().get((_normalize_city(city), state_abbreviation.strip().upper()))
+
+
+def parse_near(near: str) -> Optional[Tuple[float, float]]:
+    """Resolve a `near=` value of the form "City, ST" to coordinates"""
+    city, sep, state = near.rpartition(",")
+    if not sep:
+        return None
+    return geocode(city, state)
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in miles"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def grid_cell(latitude: float, longitude: float) -> str:
+    """Key of the grid cell containing a point"""
+    return f"{math.floor(latitude / GRID_CELL_DEGREES)}:{math.floor(longitude / GRID_CELL_DEGREES)}"
+
+
+def cells_within(latitude: float, longitude: float, radius_miles: float) -> List[str]:
+    """Grid cells covering the bounding box of a circle around a point"""
+    lat_delta = radius_miles / 69.0
+    # Longitude degrees shrink towards the poles; clamp to keep the box finite
+    lon_delta = radius_miles / (69.0 * max(math.cos(math.radians(latitude)), 0.01))
+    lat_lo = math.floor((latitude - lat_delta) / GRID_CELL_DEGREES)
+    lat_hi = math.floor((latitude + lat_delta) / GRID_CELL_DEGREES)
+    lon_lo = math.floor((longitude - lon_delta) / GRID_CELL_DEGREES)
+    lon_hi = math.floor((longitude + lon_delta) / GRID_CELL_DEGREES)
+    return [
+        f"{lat}:{lon}"
+        for lat in range(lat_lo, lat_hi + 1)
+        for lon in range(lon_lo, lon_hi + 1)
+    ]
+
+
+async def _state_abbreviation(state_id: str) -> Optional[str]:
+    if not _state_abbreviations:
+        for state in await prisma.usstate.find_many():
+            _state_abbreviations[state.id] = state.abbreviation
+    return _state_abbreviations.get(state_id)
+
+
+async def geocode_location(state_id: Optional[str], city: Optional[str]) -> dict:
+    """Resolve a stored state id and city to the coordinate columns of a row.
+
+    Unknown locations clear the coordinates so stale values don't linger
+    after a location change.
+    """
+    coordinates = None
+    if state_id and city:
+        coordinates = geocode(city, await _state_abbreviation(state_id))
+    if not coordinates:
+        return {"latitude": None, "longitude": None}
+    latitude, longitude = coordinates
+    return {"latitude": latitude, "longitude": longitude}
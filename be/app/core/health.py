@@ -0,0 +1,161 @@
+import asyncio
+import signal
+import threading
+import time
+from typing import Callable, List
+from .config import settings
+from .database import prisma, prisma_read, has_replica
+
+# How long the readiness ping may take before the database counts as down
+PING_TIMEOUT_SECONDS = 2.0
+
+_POOL_GAUGES = {
+    "prisma_pool_connections_busy": "busy",
+    "prisma_pool_connections_idle": "idle",
+    "prisma_pool_connections_open": "open",
+    "prisma_client_queries_wait": "waiting",
+}
+
+
+# Responses that stay open until the client leaves; closed on drain rather than waited for
+LONG_LIVED_TYPES = (b"text/event-stream",)
+
+
+class RequestTracker:
+    """ASGI middleware counting in-flight requests so shutdown can drain them.
+
+    Event streams stop counting once their headers are sent: they only end
+    when the client leaves, so drain closes them instead of waiting.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        counted = True
+
+        async def send_and_track(message):
+            nonlocal counted
+            if message["type"] == "http.response.start" and counted:
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                if content_type.startswith(LONG_LIVED_TYPES):
+                    counted = False
+                    lifecycle.in_flight -= 1
+            await send(message)
+
+        lifecycle.in_flight += 1
+        try:
+            await self.app(scope, receive, send_and_track)
+        finally:
+            if counted:
+                lifecycle.in_flight -= 1
+
+
+class Lifecycle:
+    def __init__(self):
+        self.in_flight = 0
+        self.draining = False
+        self._drained = False
+        self._on_drain: List[Callable[[], None]] = []
+
+    def on_drain(self, callback: Callable[[], None]):
+        """Run callback once draining starts, e.g. to close long-lived streams"""
+        self._on_drain.append(callback)
+
+    async def drain(self, timeout: float = None, delay: float = 0):
+        """Stop reporting ready and wait for in-flight requests, up to timeout seconds.
+
+        With a delay, /ready reports draining for that long first so the
+        load balancer stops routing here before anything is closed.
+        """
+        if self._drained:
+            return
+        self.draining = True
+        if delay:
+            await asyncio.sleep(delay)
+        for callback in self._on_drain:
+            callback()
+        deadline = time.monotonic() + (timeout if timeout is not None else settings.shutdown_drain_seconds)
+        while self.in_flight > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        if self.in_flight:
+            print(f"Shutting down with {self.in_flight} requests still in flight")
+        self._drained = True
+
+    def install_signal_handler(self):
+        """Drain on SIGTERM before the server sees it.
+
+        The server stops accepting connections as soon as its own handler
+        runs, so that handler is deferred until the drain finishes: /ready
+        reports draining while the listener is still open and in-flight
+        requests complete normally. A second SIGTERM skips the wait.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+        if not callable(previous):
+            return
+        loop = asyncio.get_running_loop()
+
+        async def drain_then_exit(sig, frame):
+            try:
+                await self.drain(delay=settings.shutdown_delay_seconds)
+            finally:
+                previous(sig, frame)
+
+        def handle_sigterm(sig, frame):
+            if self.draining:
+                previous(sig, frame)
+                return
+            self.draining = True
+            loop.call_soon_threadsafe(lambda: loop.create_task(drain_then_exit(sig, frame)))
+
+        signal.signal(signal.SIGTERM, handle_sigterm)
+
+
+async def _ping(client) -> dict:
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(client.query_raw("SELECT 1"), PING_TIMEOUT_SECONDS)
+        return {"ok": True, "latencyMs": round((time.monotonic() - started) * 1000, 1)}
+    except Exception as e:
+        return {"ok": False, "error": str(e) or type(e).__name__}
+
+
+async def _pool_stats(client) -> dict:
+    """Pool gauges from the engine's metrics; empty if metrics are unavailable"""
+    try:
+        metrics = await client.get_metrics()
+    except Exception:
+        return {}
+    stats = {
+        name: int(gauge.value)
+        for gauge in metrics.gauges
+        if (name := _POOL_GAUGES.get(gauge.key)) is not None
+    }
+    stats["size"] = settings.database_pool_size
+    if "busy" in stats:
+        stats["saturation"] = round(stats["busy"] / settings.database_pool_size, 2)
+    return stats
+
+
+async def readiness() -> dict:
+    """Database reachability and pool pressure for the orchestrator"""
+    clients = {"primary": prisma}
+    if has_replica():
+        clients["replica"] = prisma_read
+    databases = {}
+    for name, client in clients.items():
+        databases[name] = {**await _ping(client), "pool": await _pool_stats(client)}
+    return {
+        "ready": not lifecycle.draining and all(database["ok"] for database in databases.values()),
+        "draining": lifecycle.draining,
+        "inFlightRequests": lifecycle.in_flight,
+        "databases": databases,
+    }
+
+# Global lifecycle state
+lifecycle = Lifecycle()
@@ -0,0 +1,318 @@
+import base64
+from datetime import datetime, timezone
+from typing import List, Optional
+from fastapi import HTTPException
+from app.models.job import (
+    ApplicationStatus, ApplicationHistoryPage, ApplicationHistoryItem, ApplicationHistoryJob,
+    CompanyRef, NamedRef,
+)
+from .database import prisma
+from .applied_cache import applied_jobs_cache
+from .geo import EARTH_RADIUS_MILES, cells_within, haversine_miles
+
+
+def build_job_filters(
+    category_id: Optional[str] = None,
+    state_id: Optional[str] = None,
+    city: Optional[str] = None,
+    salary_min: Optional[int] = None,
+    salary_max: Optional[int] = None,
+    search: Optional[str] = None,
+    include_duplicates: bool = False,
+) -> dict:
+    """Build the Prisma where clause shared by the listing and dashboard endpoints"""
+    where_clause = {"isActive": True}
+    if not include_duplicates:
+        where_clause["duplicateOf"] = None
+
+    if category_id:
+        where_clause["categoryId"] = category_id
+    if state_id:
+        where_clause["locationState"] = state_id
+    if city:
+        where_clause["locationCity"] = {"contains": city, "mode": "insensitive"}
+    if salary_min:
+        where_clause["salaryMin"] = {"gte": salary_min}
+    if salary_max:
+        where_clause["salaryMax"] = {"lte": salary_max}
+    if search:
+        where_clause["OR"] = [
+            {"title": {"contains": search, "mode": "insensitive"}},
+            {"description": {"contains": search, "mode": "insensitive"}}
+        ]
+    return where_clause
+
+def _like_pattern(value: str) -> str:
+    """ILIKE pattern matching value anywhere, with its wildcards taken literally"""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def job_filter_sql(
+    category_id: Optional[str] = None,
+    state_id: Optional[str] = None,
+    city: Optional[str] = None,
+    salary_min: Optional[int] = None,
+    salary_max: Optional[int] = None,
+    search: Optional[str] = None,
+    include_duplicates: bool = False,
+    origin=None,
+    radius: Optional[float] = None,
+) -> tuple:
+    """SQL conditions and parameters equivalent to build_job_filters, plus the radius filter"""
+    conditions = ["is_active"]
+    params: list = []
+
+    def param(value) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    if not include_duplicates:
+        conditions.append("duplicate_of IS NULL")
+    if category_id:
+        conditions.append(f"category_id = {param(category_id)}")
+    if state_id:
+        conditions.append(f"location_state = {param(state_id)}")
+    if city:
+        conditions.append(f"location_city ILIKE {param(_like_pattern(city))}")
+    if salary_min:
+        conditions.append(f"salary_min >= {param(salary_min)}::int")
+    if salary_max:
+        conditions.append(f"salary_max <= {param(salary_max)}::int")
+    if search:
+        pattern = param(_like_pattern(search))
+        conditions.append(f"(title ILIKE {pattern} OR description ILIKE {pattern})")
+    if origin:
+        latitude, longitude = f"{param(origin[0])}::float8", f"{param(origin[1])}::float8"
+        # The geo_cell index narrows to the surrounding cells; the haversine distance is exact
+        conditions.append(f"geo_cell = ANY({param(cells_within(origin[0], origin[1], radius))}::text[])")
+        conditions.append(
+            f"2 * {EARTH_RADIUS_MILES} * asin(least(1, sqrt("
+            f"power(sin(radians(latitude - {latitude}) / 2), 2) + "
+            f"cos(radians({latitude})) * cos(radians(latitude)) * "
+            f"power(sin(radians(longitude - {longitude}) / 2), 2)"
+            f"))) <= {param(radius)}::float8"
+        )
+    return " AND ".join(conditions), params
+
+async def fetch_nearby_job_postings(where_clause: dict, origin, radius: float, limit: int, offset: int, db=prisma):
+    """Postings within radius miles of origin, nearest first"""
+    # Narrow to the grid cells around the origin via the geo_cell index
+    where_clause["geoCell"] = {"in": cells_within(origin[0], origin[1], radius)}
+
+    job_postings = await db.jobposting.find_many(
+        where=where_clause,
+        include={
+            "employer": True,
+            "category": True,
+            "locationStateRef": True
+        }
+    )
+    nearby = []
+    for job_posting in job_postings:
+        distance = haversine_miles(origin[0], origin[1], job_posting.latitude, job_posting.longitude)
+        if distance <= radius:
+            job_dict = job_posting.model_dump()
+            job_dict["distanceMiles"] = round(distance, 1)
+            nearby.append(job_dict)
+    nearby.sort(key=lambda job: job["distanceMiles"])
+    return nearby[offset:offset + limit]
+
+async def fetch_job_postings(where_clause: dict, limit: int, offset: int, db=prisma):
+    job_postings = await db.jobposting.find_many(
+        where=where_clause,
+        include={
+            "employer": True,
+            "category": True,
+            "locationStateRef": True
+        }
+    )
+    # Manual pagination since take/skip might not be supported
+    return job_postings[offset:offset + limit]
+
+async def fetch_employer_job_postings(user_profile, db=prisma) -> List[dict]:
+    """Employer's postings, newest first, with application counts"""
+    job_postings = await db.jobposting.find_many(
+        where={"employerId": user_profile.id},
+        include={
+            "employer": True,
+            "category": True,
+            "locationStateRef": True
+        }
+    )
+    # Sort results manually since orderBy is not supported in this Prisma version
+    job_postings.sort(key=lambda x: x.createdAt, reverse=True)
+    if not job_postings:
+        return []
+
+    # One grouped count for all postings instead of a count per posting
+    groups = await db.jobapplication.group_by(
+        by=["jobPostingId"],
+        where={"jobPostingId": {"in": [job.id for job in job_postings]}},
+        count=True,
+    )
+    counts = {group["jobPostingId"]: group["_count"]["_all"] for group in groups}
+
+    job_postings_dict = []
+    for job_posting in job_postings:
+        application_count = counts.get(job_posting.id, 0)
+        # Convert to dict and add custom fields
+        job_dict = job_posting.__dict__
+        job_dict["applicationCount"] = application_count
+        job_dict["_count"] = {"jobApplications": application_count}
+        job_postings_dict.append(job_dict)
+    return job_postings_dict
+
+def timestamp_param(value: datetime) -> str:
+    """A datetime as the naive UTC text the timestamp columns store"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+# job_applications is partitioned by applied_at month. Lookups by seeker or
+# posting also bound applied_at from below by the profile's creation time
+# (nobody applies before their profile, or to an employer's posting before
+# the employer's profile, exists) so partitions older than that are pruned.
+
+def _encode_history_cursor(applied_at: str, application_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{applied_at}|{application_id}".encode()).decode()
+
+def _decode_history_cursor(cursor: str):
+    try:
+        applied_at, application_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(applied_at.replace("Z", "+00:00")), application_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def fetch_application_history(
+    user_profile,
+    limit: int,
+    cursor: Optional[str] = None,
+    statuses: Optional[List[ApplicationStatus]] = None,
+    db=prisma,
+) -> ApplicationHistoryPage:
+    """One page of a seeker's applications, newest first, with only the job fields the history shows.
+
+    A single joined query replaces the nested includes, and the
+    (appliedAt, id) keyset keeps every page an index range scan.
+    """
+    conditions = ["a.job_seeker_id = $1", "a.applied_at >= $2::timestamp"]
+    params: list = [user_profile.id, timestamp_param(user_profile.createdAt)]
+    if statuses:
+        params.append([status.value for status in statuses])
+        conditions.append(f"a.status::text = ANY(${len(params)})")
+    if cursor:
+        applied_at, application_id = _decode_history_cursor(cursor)
+        params.extend([timestamp_param(applied_at), application_id])
+        # The plain bound lets the planner prune partitions newer than the cursor
+        conditions.append(f"a.applied_at <= ${len(params) - 1}::timestamp")
+        conditions.append(f"(a.applied_at, a.id) < (${len(params) - 1}::timestamp, ${len(params)})")
+    params.append(limit + 1)
+
+    rows = await db.query_raw(
+        f"""
+        SELECT a.id, a.job_posting_id, a.status::text AS status, a.applied_at, a.updated_at,
+               p.title, p.location_city, p.salary_min, p.salary_max, p.is_active,
+               e.company_name, c.name AS category_name, s.name AS state_name
+        FROM job_applications a
+        JOIN job_postings p ON p.id = a.job_posting_id
+        JOIN user_profiles e ON e.id = p.employer_id
+        LEFT JOIN job_categories c ON c.id = p.category_id
+        LEFT JOIN us_states s ON s.id = p.location_state
+        WHERE {" AND ".join(conditions)}
+        ORDER BY a.applied_at DESC, a.id DESC
+        LIMIT ${len(params)}
+        """,
+        *params,
+    )
+
+    items = [
+        ApplicationHistoryItem(
+            id=row["id"],
+            jobPostingId=row["job_posting_id"],
+            status=row["status"],
+            appliedAt=row["applied_at"],
+            updatedAt=row["updated_at"],
+            jobPosting=ApplicationHistoryJob(
+                id=row["job_posting_id"],
+                title=row["title"],
+                locationCity=row["location_city"],
+                salaryMin=row["salary_min"],
+                salaryMax=row["salary_max"],
+                isActive=row["is_active"],
+                employer=CompanyRef(companyName=row["company_name"]),
+                category=NamedRef(name=row["category_name"]) if row["category_name"] else None,
+                locationStateRef=NamedRef(name=row["state_name"]) if row["state_name"] else None,
+            ),
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = _encode_history_cursor(str(last["applied_at"]), last["id"])
+    return ApplicationHistoryPage(items=items, nextCursor=next_cursor)
+
+async def fetch_applied_job_ids(user_profile) -> List[str]:
+    return sorted(await applied_jobs_cache.get_job_ids(user_profile.id))
+
+async def fetch_archived_job_postings(user_profile, db=prisma) -> List[dict]:
+    """Employer's archived postings, most recently archived first, with application counts"""
+    job_postings = await db.archivedjobposting.find_many(
+        where={"employerId": user_profile.id}
+    )
+    job_postings.sort(key=lambda x: x.archivedAt, reverse=True)
+    if not job_postings:
+        return []
+
+    groups = await db.archivedjobapplication.group_by(
+        by=["jobPostingId"],
+        where={"jobPostingId": {"in": [job.id for job in job_postings]}},
+        count=True,
+    )
+    counts = {group["jobPostingId"]: group["_count"]["_all"] for group in groups}
+    return [
+        {**job_posting.__dict__, "applicationCount": counts.get(job_posting.id, 0)}
+        for job_posting in job_postings
+    ]
+
+async def fetch_archived_applications(user_profile, db=prisma) -> List[dict]:
+    job_postings = {
+        job.id: job for job in await db.archivedjobposting.find_many(
+            where={"employerId": user_profile.id}
+        )
+    }
+    if not job_postings:
+        return []
+    applications = await db.archivedjobapplication.find_many(
+        where={"jobPostingId": {"in": list(job_postings)}}
+    )
+    seekers = {
+        seeker.id: seeker for seeker in await db.userprofile.find_many(
+            where={"id": {"in": list({application.jobSeekerId for application in applications})}}
+        )
+    } if applications else {}
+    return [
+        {
+            **application.__dict__,
+            "jobPosting": job_postings[application.jobPostingId],
+            "jobSeeker": seekers.get(application.jobSeekerId),
+        }
+        for application in applications
+    ]
+
+async def fetch_employer_applications(user_profile, db=prisma):
+    return await db.jobapplication.find_many(
+        where={
+            "jobPosting": {"is": {"employerId": user_profile.id}},
+            "appliedAt": {"gte": user_profile.createdAt},
+        },
+        include={
+            "jobSeeker": True,
+            "jobPosting": {
+                "include": {
+                    "category": True,
+                    "locationStateRef": True
+                }
+            }
+        },
+    )
@@ -0,0 +1,19 @@
+from .config import settings
+from .database import prisma
+
+
+async def create_application_partitions() -> int:
+    """Create the upcoming monthly job_applications partitions.
+
+    A no-op until prisma/sql/partition_job_applications.sql has been applied.
+    """
+    rows = await prisma.query_raw(
+        "SELECT to_regproc('create_job_application_partitions') IS NOT NULL AS installed"
+    )
+    if not rows or not rows[0]["installed"]:
+        return 0
+    rows = await prisma.query_raw(
+        "SELECT create_job_application_partitions($1) AS created",
+        settings.application_partitions_months_ahead,
+    )
+    return rows[0]["created"]
@@ -0,0 +1,292 @@
+import asyncio
+import math
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Iterable, Optional, Tuple
+
+from .config import settings
+from .database import prisma, find_many_in_pages
+from .search import tokenize
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy import sparse
+
+# Pending rows are merged into the base matrix once this many accumulate
+COMPACT_THRESHOLD = 2048
+
+
+def _top_k(scores: "np.ndarray", k: int) -> "np.ndarray":
+    """Indices of the k highest positive scores, best first"""
+    import numpy as np
+    positive = np.flatnonzero(scores > 0)
+    if len(positive) > k:
+        positive = positive[np.argpartition(scores[positive], -k)[-k:]]
+    return positive[np.argsort(-scores[positive], kind="stable")]
+
+
+class TermMatrix:
+    """Documents as rows of l2-normalized sublinear term frequencies.
+
+    Rows live in a CSC base matrix plus a small set of pending rows for new
+    or changed documents; removed rows are masked out. Column-major storage
+    means a query only touches the columns of its own terms. Pending rows
+    are merged into the base once COMPACT_THRESHOLD of them accumulate, so a
+    single change never rebuilds the whole matrix. IDF is applied on the
+    query side, which keeps stored rows valid as document frequencies move.
+    """
+
+    def __init__(self):
+        # numpy and scipy are imported here rather than at module level: the
+        # matrices are only built on the first recommendation, well after startup
+        import numpy as np
+        from scipy import sparse
+        self.vocabulary: Dict[str, int] = {}
+        self._doc_freq = np.zeros(1024, dtype=np.int64)
+        self._doc_terms: Dict[str, "np.ndarray"] = {}
+        self._base = sparse.csc_matrix((0, 0), dtype=np.float32)
+        self._base_ids: List[str] = []
+        self._base_rows: Dict[str, int] = {}
+        self._alive = np.zeros(0, dtype=bool)
+        self._dead = 0
+        self._pending: Dict[str, Tuple["np.ndarray", "np.ndarray"]] = {}
+        self._pending_ids: List[str] = []
+        self._pending_matrix: Optional["sparse.csc_matrix"] = None
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def _term_id(self, term: str) -> int:
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            import numpy as np
+            term_id = len(self.vocabulary)
+            self.vocabulary[term] = term_id
+            if term_id >= len(self._doc_freq):
+                self._doc_freq = np.concatenate([self._doc_freq, np.zeros_like(self._doc_freq)])
+        return term_id
+
+    @staticmethod
+    def _rows_to_csr(rows: List[Tuple["np.ndarray", "np.ndarray"]], n_cols: int) -> "sparse.csr_matrix":
+        import numpy as np
+        from scipy import sparse
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        if not rows:
+            return sparse.csr_matrix((0, n_cols), dtype=np.float32)
+        indptr[1:] = np.cumsum([len(indices) for indices, _ in rows])
+        indices = np.concatenate([indices for indices, _ in rows])
+        data = np.concatenate([weights for _, weights in rows])
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), n_cols))
+
+    def upsert(self, doc_id: str, tokens: Iterable[str], compact: bool = True):
+        """Add or replace a document's row"""
+        import numpy as np
+        self.remove(doc_id)
+        counts = Counter(tokens)
+        if not counts:
+            return
+        indices = np.fromiter((self._term_id(term) for term in counts), dtype=np.int32, count=len(counts))
+        weights = np.fromiter((1.0 + math.log(c) for c in counts.values()), dtype=np.float32, count=len(counts))
+        weights /= np.linalg.norm(weights)
+        order = np.argsort(indices)
+        indices, weights = indices[order], weights[order]
+
+        self._doc_freq[indices] += 1
+        self._doc_terms[doc_id] = indices
+        self._pending[doc_id] = (indices, weights)
+        self._pending_matrix = None
+        if compact and len(self._pending) >= COMPACT_THRESHOLD:
+            self.compact()
+
+    def remove(self, doc_id: str):
+        indices = self._doc_terms.pop(doc_id, None)
+        if indices is None:
+            return
+        self._doc_freq[indices] -= 1
+        if self._pending.pop(doc_id, None) is not None:
+            self._pending_matrix = None
+        row = self._base_rows.pop(doc_id, None)
+        if row is not None:
+            self._alive[row] = False
+            self._dead += 1
+            if self._dead > max(len(self._base_ids) // 4, COMPACT_THRESHOLD):
+                self.compact()
+
+    def compact(self):
+        """Merge pending rows into the base and drop removed rows"""
+        import numpy as np
+        from scipy import sparse
+        n_cols = len(self.vocabulary)
+        keep = np.flatnonzero(self._alive)
+        base = self._base.tocsr()[keep]
+        base.resize((base.shape[0], n_cols))
+        pending_ids = list(self._pending)
+        pending = self._rows_to_csr([self._pending[doc_id] for doc_id in pending_ids], n_cols)
+
+        self._base = sparse.vstack([base, pending], format="csr", dtype=np.float32).tocsc()
+        self._base_ids = [self._base_ids[i] for i in keep] + pending_ids
+        self._base_rows = {doc_id: row for row, doc_id in enumerate(self._base_ids)}
+        self._alive = np.ones(len(self._base_ids), dtype=bool)
+        self._dead = 0
+        self._pending.clear()
+        self._pending_matrix = None
+
+    def _query_terms(self, tokens: Iterable[str]) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        """Term ids and idf-weighted, normalized weights of a query"""
+        import numpy as np
+        counts = Counter(token for token in tokens if token in self.vocabulary)
+        if not counts:
+            return None
+        indices = np.fromiter((self.vocabulary[term] for term in counts), dtype=np.int64, count=len(counts))
+        weights = np.fromiter((1.0 + math.log(c) for c in counts.values()), dtype=np.float32, count=len(counts))
+        n_docs = max(len(self._doc_terms), 1)
+        weights *= np.log((1 + n_docs) / (1 + self._doc_freq[indices])).astype(np.float32) + 1.0
+        return indices, weights / np.linalg.norm(weights)
+
+    def top_k(self, tokens: Iterable[str], k: int, exclude: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        """Best matching (doc_id, score) pairs for a query, highest first"""
+        query = self._query_terms(tokens)
+        if query is None or k <= 0:
+            return []
+        indices, weights = query
+        exclude = set(exclude)
+        wanted = k + len(exclude)
+        candidates: List[Tuple[float, str]] = []
+
+        in_base = indices < self._base.shape[1]
+        if in_base.any():
+            scores = self._base[:, indices[in_base]] @ weights[in_base]
+            scores[~self._alive] = 0
+            for row in _top_k(scores, wanted):
+                candidates.append((float(scores[row]), self._base_ids[row]))
+
+        if self._pending:
+            if self._pending_matrix is None:
+                self._pending_ids = list(self._pending)
+                self._pending_matrix = self._rows_to_csr(
+                    [self._pending[doc_id] for doc_id in self._pending_ids], len(self.vocabulary)
+                ).tocsc()
+            in_pending = indices < self._pending_matrix.shape[1]
+            scores = self._pending_matrix[:, indices[in_pending]] @ weights[in_pending]
+            for row in _top_k(scores, wanted):
+                candidates.append((float(scores[row]), self._pending_ids[row]))
+
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        return [(doc_id, score) for score, doc_id in candidates if doc_id not in exclude][:k]
+
+
+class RecommendationService:
+    """Skill matching between job seekers and active job postings.
+
+    Postings are indexed by the terms of their title and requirements and
+    seekers by their skills; each side is queried with the other's terms.
+    Both matrices are rebuilt from the database every
+    recommender_refresh_seconds, so postings and profiles changed through
+    other workers (including postings expired by the scheduler) show up.
+    """
+
+    def __init__(self):
+        self.jobs: Optional[TermMatrix] = None
+        self.seekers: Optional[TermMatrix] = None
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        # Postings and profiles changed while a refresh runs; replayed onto the rebuilt matrices
+        self._changed_jobs: Dict[str, object] = {}
+        self._changed_seekers: Dict[str, object] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def job_tokens(job_posting) -> List[str]:
+        return tokenize(job_posting.title) + tokenize(job_posting.requirements)
+
+    @staticmethod
+    def seeker_tokens(profile) -> List[str]:
+        return tokenize(" ".join(profile.skills or []))
+
+    @classmethod
+    async def _load(cls) -> Tuple[TermMatrix, TermMatrix]:
+        jobs, seekers = TermMatrix(), TermMatrix()
+        async for page in find_many_in_pages(prisma.jobposting, where={"isActive": True}):
+            for job_posting in page:
+                jobs.upsert(job_posting.id, cls.job_tokens(job_posting), compact=False)
+            await asyncio.sleep(0)
+        async for page in find_many_in_pages(prisma.userprofile, where={"role": "job_seeker"}):
+            for profile in page:
+                seekers.upsert(profile.id, cls.seeker_tokens(profile), compact=False)
+            await asyncio.sleep(0)
+        jobs.compact()
+        seekers.compact()
+        return jobs, seekers
+
+    def _apply_job(self, jobs: TermMatrix, job_id: str, job_posting):
+        if job_posting is not None and job_posting.isActive:
+            jobs.upsert(job_id, self.job_tokens(job_posting))
+        else:
+            jobs.remove(job_id)
+
+    def _apply_seeker(self, seekers: TermMatrix, profile):
+        if profile.role == "job_seeker":
+            seekers.upsert(profile.id, self.seeker_tokens(profile))
+        else:
+            seekers.remove(profile.id)
+
+    async def _refresh(self):
+        try:
+            jobs, seekers = await self._load()
+            # A page read before a concurrent change would bring back its old state
+            for job_id, job_posting in self._changed_jobs.items():
+                self._apply_job(jobs, job_id, job_posting)
+            for profile in self._changed_seekers.values():
+                self._apply_seeker(seekers, profile)
+            self.jobs, self.seekers = jobs, seekers
+            self._loaded_at = time.monotonic()
+        except Exception as e:
+            print(f"Recommendation index refresh failed: {e}")
+        finally:
+            self._refreshing = False
+            self._changed_jobs = {}
+            self._changed_seekers = {}
+
+    async def ensure_loaded(self):
+        """Build both matrices from the database on first use and refresh them in the background once they're old"""
+        if self._loaded_at is not None:
+            if not self._refreshing and time.monotonic() - self._loaded_at > settings.recommender_refresh_seconds:
+                self._refreshing = True
+                asyncio.create_task(self._refresh())
+            return
+        async with self._lock:
+            if self._loaded_at is None:
+                self.jobs, self.seekers = await self._load()
+                self._loaded_at = time.monotonic()
+
+    def add_job(self, job_posting):
+        if self._loaded_at is None:
+            return
+        if self._refreshing:
+            self._changed_jobs[job_posting.id] = job_posting
+        self._apply_job(self.jobs, job_posting.id, job_posting)
+
+    def remove_job(self, job_posting):
+        if self._loaded_at is None:
+            return
+        if self._refreshing:
+            self._changed_jobs[job_posting.id] = None
+        self.jobs.remove(job_posting.id)
+
+    def update_seeker(self, profile):
+        if self._loaded_at is None:
+            return
+        if self._refreshing:
+            self._changed_seekers[profile.id] = profile
+        self._apply_seeker(self.seekers, profile)
+
+    async def recommend_jobs(self, profile, limit: int, exclude: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        await self.ensure_loaded()
+        return self.jobs.top_k(self.seeker_tokens(profile), limit, exclude)
+
+    async def top_candidates(self, job_posting, limit: int) -> List[Tuple[str, float]]:
+        await self.ensure_loaded()
+        return self.seekers.top_k(self.job_tokens(job_posting), limit)
+
+# Global recommendation service
+job_recommender = RecommendationService()
@@ -0,0 +1,50 @@
+import time
+from fastapi import Request
+from .config import settings
+from .database import prisma, prisma_read, has_replica
+
+# Cookie holding the time until which a client's reads must see the primary
+RECENT_WRITE_COOKIE = "recent_write"
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def get_read_db(request: Request):
+    """Client for a read: the replica, unless the caller wrote recently enough to miss replication"""
+    if not has_replica():
+        return prisma_read
+    try:
+        recent_write_until = float(request.cookies.get(RECENT_WRITE_COOKIE, 0))
+    except ValueError:
+        recent_write_until = 0
+    return prisma if recent_write_until > time.time() else prisma_read
+
+
+class ReadYourWritesMiddleware:
+    """Marks a client after a successful write so its next reads go to the primary.
+
+    The marker lives in a short-lived cookie, so it follows the browser
+    session across workers without any shared state. Forging it only
+    moves that client's reads to the primary.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS or not has_replica():
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                window = settings.read_your_writes_seconds
+                secure = settings.environment.lower() == "production"
+                cookie = (
+                    f"{RECENT_WRITE_COOKIE}={time.time() + window:.3f}; Max-Age={window}; Path=/; HttpOnly; "
+                    + ("Secure; SameSite=None" if secure else "SameSite=Lax")
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
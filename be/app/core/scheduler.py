@@ -0,0 +1,49 @@
+import asyncio
+import random
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+Task = Callable[[], Awaitable[object]]
+
+
+class Scheduler:
+    """Runs periodic maintenance tasks inside the app process.
+
+    Each task loops on its own interval and a failing run is logged and
+    retried on the next tick. Tasks must be safe to run from several
+    workers at once; the first run is jittered so workers don't line up.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, Tuple[float, Task]] = {}
+        self._running: List[asyncio.Task] = []
+
+    def add_task(self, name: str, interval_seconds: float, task: Task):
+        self._tasks[name] = (interval_seconds, task)
+
+    async def _loop(self, name: str, interval_seconds: float, task: Task):
+        await asyncio.sleep(random.uniform(0, min(interval_seconds, 60)))
+        while True:
+            try:
+                result = await task()
+                if result:
+                    print(f"Scheduled task {name}: {result}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Scheduled task {name} failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    async def start(self):
+        if self._running:
+            return
+        for name, (interval_seconds, task) in self._tasks.items():
+            self._running.append(asyncio.create_task(self._loop(name, interval_seconds, task)))
+
+    async def stop(self):
+        for running in self._running:
+            running.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+        self._running = []
+
+# Global scheduler
+scheduler = Scheduler()
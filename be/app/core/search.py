@@ -0,0 +1,52 @@
+import re
+from typing import Optional, List, Tuple
+
+# Salary bands used for faceting, as (key, lower bound inclusive, upper bound exclusive)
+SALARY_BANDS: List[Tuple[str, int, Optional[int]]] = [
+    ("under_25k", 0, 25000),
+    ("25k_50k", 25000, 50000),
+    ("50k_75k", 50000, 75000),
+    ("75k_100k", 75000, 100000),
+    ("100k_plus", 100000, None),
+]
+
+UNSPECIFIED_SALARY_BAND = "unspecified"
+
+
+def salary_band(salary_min: Optional[int]) -> str:
+    """Map a posting's minimum salary to its facet band key"""
+    if salary_min is None:
+        return UNSPECIFIED_SALARY_BAND
+    for key, lower, upper in SALARY_BANDS:
+        if salary_min >= lower and (upper is None or salary_min < upper):
+            return key
+    # Negative salaries are bad data; bucket them with the lowest band
+    return SALARY_BANDS[0][0]
+
+
+def salary_band_sql(column: str) -> str:
+    """SQL CASE expression computing salary_band() of a column in the database"""
+    whens = [f"WHEN {column} IS NULL THEN '{UNSPECIFIED_SALARY_BAND}'"]
+    for key, _, upper in SALARY_BANDS:
+        # Bands are contiguous, so the first upper bound a value is under picks its band
+        whens.append(f"WHEN {column} < {upper} THEN '{key}'" if upper is not None else f"ELSE '{key}'")
+    return f"CASE {' '.join(whens)} END"
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the
+their this to we will with you your must able etc years year experience required
+preferred plus strong work working job role position team including
+""".split())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased word tokens for matching, without stop words"""
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOP_WORDS and (len(token) > 1 or not token.isalpha())
+    ]
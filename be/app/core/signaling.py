@@ -0,0 +1,187 @@
+import asyncio
+import uuid
+import zlib
+from typing import Awaitable, Callable, Dict, Optional
+from .config import Lazy, settings
+
+ROLES = ("participant", "interviewer", "observer")
+
+# Messages relayed between peers; everything else is rejected
+RELAY_TYPES = ("offer", "answer", "ice")
+
+# Outgoing messages buffered per connection before it is dropped as too slow
+SEND_QUEUE_SIZE = 64
+
+Send = Callable[[dict], Awaitable[None]]
+Close = Callable[[int], Awaitable[None]]
+
+# WebSocket close codes
+CLOSE_SLOW_CONSUMER = 4008
+CLOSE_WRONG_SHARD = 4009
+
+
+def crc32_shard(room_id: str, shard_count: int) -> int:
+    """Default room sharding: stable hash of the room id"""
+    return zlib.crc32(room_id.encode("utf-8")) % shard_count
+
+
+class SignalingError(Exception):
+    pass
+
+
+class Peer:
+    """One connection in a room with its own bounded send queue and writer task"""
+
+    def __init__(self, user_id: str, role: str, send: Send, close: Close, queue_size: int = SEND_QUEUE_SIZE):
+        self.peer_id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.role = role
+        self._send = send
+        self._close = close
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._writer: Optional[asyncio.Task] = None
+        self.closed = False
+
+    def start(self):
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self):
+        try:
+            while True:
+                message = await self._queue.get()
+                await self._send(message)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # The socket is gone; the receive loop will notice and leave the room
+            self.closed = True
+
+    def enqueue(self, message: dict) -> bool:
+        """Queue a message without waiting; False if the peer can't keep up"""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def close(self, code: int):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self._close(code)
+        except Exception:
+            pass
+
+    def stop(self):
+        self.closed = True
+        if self._writer:
+            self._writer.cancel()
+
+    def describe(self) -> dict:
+        return {"peerId": self.peer_id, "userId": self.user_id, "role": self.role}
+
+
+class SignalingHub:
+    """Room membership and SDP/ICE relay for interview rooms.
+
+    A room lives entirely in one process. With several workers, set
+    `shard_count`/`shard_id` per worker and route connections with the same
+    resolver; a worker refuses rooms that hash to another shard.
+    """
+
+    def __init__(
+        self,
+        shard_count: int = 1,
+        shard_id: int = 0,
+        shard_resolver: Callable[[str, int], int] = crc32_shard,
+        queue_size: int = SEND_QUEUE_SIZE,
+    ):
+        self.shard_count = shard_count
+        self.shard_id = shard_id
+        self.shard_resolver = shard_resolver
+        self.queue_size = queue_size
+        self.rooms: Dict[str, Dict[str, Peer]] = {}
+        self.slow_disconnects = 0
+
+    def owns_room(self, room_id: str) -> bool:
+        return self.shard_resolver(room_id, self.shard_count) == self.shard_id
+
+    def _broadcast(self, room: Dict[str, Peer], message: dict, exclude: Optional[str] = None):
+        for peer in list(room.values()):
+            if peer.peer_id != exclude:
+                self._deliver(peer, message)
+
+    def _deliver(self, peer: Peer, message: dict):
+        if not peer.enqueue(message) and not peer.closed:
+            self.slow_disconnects += 1
+            asyncio.create_task(peer.close(CLOSE_SLOW_CONSUMER))
+
+    def join(self, room_id: str, user_id: str, role: str, send: Send, close: Close) -> Peer:
+        """Add a connection to a room and announce it to the other members"""
+        if role not in ROLES:
+            raise SignalingError(f"Invalid role: {role}")
+        if not self.owns_room(room_id):
+            raise SignalingError("Room is served by another shard")
+
+        peer = Peer(user_id, role, send, close, self.queue_size)
+        peer.start()
+        room = self.rooms.setdefault(room_id, {})
+        self._deliver(peer, {
+            "type": "room.state",
+            "peerId": peer.peer_id,
+            "peers": [member.describe() for member in room.values()],
+        })
+        self._broadcast(room, {"type": "peer.joined", **peer.describe()})
+        room[peer.peer_id] = peer
+        return peer
+
+    def leave(self, room_id: str, peer: Peer):
+        peer.stop()
+        room = self.rooms.get(room_id)
+        if room is None or room.pop(peer.peer_id, None) is None:
+            return
+        if room:
+            self._broadcast(room, {"type": "peer.left", "peerId": peer.peer_id})
+        else:
+            del self.rooms[room_id]
+
+    def relay(self, room_id: str, sender: Peer, message: dict):
+        """Forward an offer, answer or ICE candidate to one peer or the whole room"""
+        message_type = message.get("type")
+        if message_type not in RELAY_TYPES:
+            raise SignalingError(f"Unsupported message type: {message_type}")
+        target = message.get("to")
+        if sender.role == "observer" and not target:
+            # Observers only negotiate point-to-point; they never broadcast
+            raise SignalingError("Observers must address messages to a peer")
+
+        room = self.rooms.get(room_id, {})
+        outgoing = {
+            "type": message_type,
+            "from": sender.peer_id,
+            "role": sender.role,
+            "payload": message.get("payload"),
+        }
+        if target:
+            peer = room.get(target)
+            if peer is None:
+                raise SignalingError(f"Unknown peer: {target}")
+            self._deliver(peer, outgoing)
+        else:
+            self._broadcast(room, outgoing, exclude=sender.peer_id)
+
+    def stats(self) -> dict:
+        return {
+            "rooms": len(self.rooms),
+            "connections": sum(len(room) for room in self.rooms.values()),
+            "slowDisconnects": self.slow_disconnects,
+        }
+
+# Global signaling hub
+signaling_hub = Lazy(lambda: SignalingHub(
+    shard_count=settings.interview_shard_count,
+    shard_id=settings.interview_shard_id,
+))
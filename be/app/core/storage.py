@@ -0,0 +1,342 @@
+import hashlib
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Collection, Dict, List, NamedTuple, Optional, Tuple, Type
+from anyio import to_thread
+from fastapi import Response
+from fastapi.responses import FileResponse
+from .config import Lazy, settings
+from .database import prisma
+
+try:
+    import python_multipart as multipart
+except ModuleNotFoundError:  # python-multipart < 0.0.13
+    import multipart
+
+
+class StorageError(Exception):
+    """The upload couldn't be stored"""
+    pass
+
+
+class StorageLimitError(StorageError):
+    """The upload grew past the size limit before it ended"""
+    pass
+
+
+class StoredFile(NamedTuple):
+    key: str
+    size: int
+    # False when identical content was already stored and has been reused
+    created: bool
+
+
+class StorageWriter(ABC):
+    """Receives one upload chunk by chunk; commit() stores it under its content hash"""
+
+    @abstractmethod
+    async def write(self, data: bytes):
+        pass
+
+    @abstractmethod
+    async def commit(self) -> StoredFile:
+        pass
+
+    @abstractmethod
+    async def abort(self):
+        pass
+
+
+class StorageBackend(ABC):
+    """Content-addressed blob storage.
+
+    Keys are the SHA-256 hex digest of the content, so identical uploads
+    share one stored copy. Blobs are never overwritten; unreferenced ones
+    are removed by remove_orphaned_files().
+    """
+
+    @abstractmethod
+    def writer(self, max_bytes: int) -> StorageWriter:
+        pass
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def iter_keys(self, older_than: float) -> AsyncIterator[str]:
+        """Keys of blobs last stored or reused before the given Unix time"""
+        pass
+
+    @abstractmethod
+    def response(self, key: str, filename: str, media_type: str) -> Response:
+        """A download response for the blob"""
+        pass
+
+
+def is_storage_key(key: str) -> bool:
+    return len(key) == 64 and all(c in "0123456789abcdef" for c in key)
+
+
+# Upload bytes gathered before one write to disk; each write is a worker thread hop
+WRITE_BUFFER_BYTES = 256 * 1024
+
+
+class LocalStorageWriter(StorageWriter):
+    """Buffers chunks and writes them from a worker thread, so disk I/O never blocks the event loop"""
+
+    def __init__(self, backend: "LocalStorageBackend", max_bytes: int):
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._temp_path = backend.temp_dir / uuid.uuid4().hex
+        self._file = None
+        self._buffer = bytearray()
+
+    def _write_sync(self, data: bytes):
+        if self._file is None:
+            self.backend.temp_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._temp_path, "wb")
+        self._file.write(data)
+
+    async def _flush(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        await to_thread.run_sync(self._write_sync, data)
+
+    async def write(self, data: bytes):
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            await self.abort()
+            raise StorageLimitError(f"File exceeds {self.max_bytes} bytes")
+        self._hash.update(data)
+        self._buffer += data
+        if len(self._buffer) >= WRITE_BUFFER_BYTES:
+            await self._flush()
+
+    def _store_sync(self, key: str) -> bool:
+        self._file.close()
+        path = self.backend.path(key)
+        if path.exists():
+            # Identical content is already stored; refresh its age for the orphan sweep
+            self._temp_path.unlink(missing_ok=True)
+            os.utime(path)
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._temp_path, path)
+        return True
+
+    async def commit(self) -> StoredFile:
+        # Also creates the temp file for an empty upload
+        await self._flush()
+        key = self._hash.hexdigest()
+        created = await to_thread.run_sync(self._store_sync, key)
+        return StoredFile(key, self.size, created)
+
+    def _discard_sync(self):
+        if self._file is not None:
+            self._file.close()
+        self._temp_path.unlink(missing_ok=True)
+
+    async def abort(self):
+        self._buffer.clear()
+        await to_thread.run_sync(self._discard_sync)
+
+
+class LocalStorageBackend(StorageBackend):
+    """Blobs under root/ab/cd/<sha256>, written through root/tmp and renamed into place.
+
+    Downloads are FileResponses, which answer Range requests and hand the
+    file to the server through the pathsend extension when it supports
+    one (sendfile), instead of reading it into Python.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.temp_dir = self.root / "tmp"
+
+    def path(self, key: str) -> Path:
+        if not is_storage_key(key):
+            raise ValueError(f"Invalid storage key: {key}")
+        return self.root / key[:2] / key[2:4] / key
+
+    def writer(self, max_bytes: int) -> StorageWriter:
+        return LocalStorageWriter(self, max_bytes)
+
+    async def exists(self, key: str) -> bool:
+        return await to_thread.run_sync(self.path(key).exists)
+
+    async def delete(self, key: str):
+        await to_thread.run_sync(lambda: self.path(key).unlink(missing_ok=True))
+
+    def _keys_sync(self, directory: Path, older_than: float) -> List[str]:
+        return [
+            path.name for path in directory.glob("??/*")
+            if is_storage_key(path.name) and path.stat().st_mtime < older_than
+        ]
+
+    async def iter_keys(self, older_than: float) -> AsyncIterator[str]:
+        # One top-level prefix directory per thread hop keeps each scan short
+        directories = await to_thread.run_sync(lambda: sorted(self.root.glob("??")))
+        for directory in directories:
+            for key in await to_thread.run_sync(self._keys_sync, directory, older_than):
+                yield key
+
+    def response(self, key: str, filename: str, media_type: str) -> Response:
+        return FileResponse(
+            self.path(key),
+            media_type=media_type,
+            filename=filename,
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+
+STORAGE_BACKENDS: Dict[str, Type[StorageBackend]] = {
+    "local": LocalStorageBackend,
+}
+
+
+def create_storage_backend(name: str, root: str) -> StorageBackend:
+    backend = STORAGE_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown storage backend: {name}. Available: {', '.join(STORAGE_BACKENDS)}")
+    return backend(root)
+
+
+def _disposition_params(value: bytes) -> Dict[str, str]:
+    params = {}
+    for item in value.decode("latin-1").split(";")[1:]:
+        name, _, param = item.strip().partition("=")
+        params[name.strip().lower()] = param.strip().strip('"')
+    return params
+
+
+async def receive_multipart_file(
+    chunks: AsyncIterable[bytes],
+    content_type: str,
+    writer: StorageWriter,
+    field_name: str = "file",
+    allowed_types: Optional[Collection[str]] = None,
+) -> Tuple[StoredFile, str, str]:
+    """Stream one file field of a multipart/form-data body into a storage writer.
+
+    The body is parsed as it arrives, so no more than one chunk of it is held
+    in memory, and the writer's size limit stops the upload mid-stream.
+    A file whose declared type isn't in allowed_types is refused before any
+    of it is written. Other fields are ignored. Returns the stored file, the
+    client's filename and the part's content type.
+    """
+    media_type, params = multipart.multipart.parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if media_type != b"multipart/form-data" or not boundary:
+        raise StorageError("Expected a multipart/form-data body")
+
+    headers: Dict[bytes, bytes] = {}
+    header_field = bytearray()
+    header_value = bytearray()
+    pending: List[bytes] = []
+    part = {"target": False, "found": False, "filename": "", "content_type": ""}
+
+    def on_part_begin():
+        headers.clear()
+
+    def on_header_field(data, start, end):
+        header_field.extend(data[start:end])
+
+    def on_header_value(data, start, end):
+        header_value.extend(data[start:end])
+
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_headers_finished():
+        disposition = _disposition_params(headers.get(b"content-disposition", b""))
+        part["target"] = disposition.get("name") == field_name and "filename" in disposition
+        if part["target"]:
+            if part["found"]:
+                raise StorageError(f"Only one '{field_name}' file may be uploaded")
+            part["found"] = True
+            # Browsers on Windows may send the full client path
+            part["filename"] = disposition["filename"].replace("\\", "/").rsplit("/", 1)[-1]
+            part["content_type"] = headers.get(b"content-type", b"application/octet-stream").decode("latin-1")
+            if allowed_types is not None and part["content_type"] not in allowed_types:
+                raise StorageError(f"Unsupported file type: {part['content_type']}")
+
+    def on_part_data(data, start, end):
+        if part["target"]:
+            pending.append(data[start:end])
+
+    parser = multipart.MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+    })
+    try:
+        async for chunk in chunks:
+            parser.write(chunk)
+            for data in pending:
+                await writer.write(data)
+            pending.clear()
+        parser.finalize()
+        if not part["found"]:
+            raise StorageError(f"Missing '{field_name}' file field")
+        return await writer.commit(), part["filename"], part["content_type"]
+    except StorageLimitError:
+        raise
+    except multipart.exceptions.MultipartParseError as e:
+        await writer.abort()
+        raise StorageError(f"Malformed multipart body: {e}")
+    except BaseException:
+        await writer.abort()
+        raise
+
+
+async def remove_orphaned_files(backend: StorageBackend, is_referenced, grace_seconds: float) -> int:
+    """Delete blobs older than the grace period that is_referenced(keys) doesn't claim.
+
+    The grace period covers uploads whose profile update hasn't committed yet.
+    """
+    removed = 0
+    batch: List[str] = []
+
+    async def flush():
+        nonlocal removed
+        referenced = await is_referenced(batch)
+        for key in batch:
+            if key not in referenced:
+                await backend.delete(key)
+                removed += 1
+        batch.clear()
+
+    async for key in backend.iter_keys(time.time() - grace_seconds):
+        batch.append(key)
+        if len(batch) >= 500:
+            await flush()
+    if batch:
+        await flush()
+    return removed
+
+# Global resume storage
+resume_storage = Lazy(lambda: create_storage_backend(settings.storage_backend, settings.storage_root))
+
+
+async def remove_orphaned_resumes() -> int:
+    """Delete stored resumes no profile points at any more"""
+    async def is_referenced(keys: List[str]) -> set:
+        profiles = await prisma.userprofile.find_many(where={"resumeKey": {"in": keys}})
+        return {profile.resumeKey for profile in profiles}
+
+    return await remove_orphaned_files(resume_storage, is_referenced, settings.storage_orphan_grace_seconds)
@@ -0,0 +1,140 @@
+import asyncio
+import heapq
+import time
+from bisect import bisect_left, insort
+from typing import Optional, Dict, List, Tuple
+from .config import settings
+from .database import prisma
+
+# Prefixes up to this length match large key ranges, so their rankings are cached
+CACHED_PREFIX_LENGTH = 2
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over normalized values, ranked by frequency"""
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._counts: Dict[str, int] = {}
+        self._display: Dict[str, str] = {}
+        self._top_cache: Dict[str, List[Tuple[str, int]]] = {}
+
+    @staticmethod
+    def normalize(value: str) -> str:
+        return " ".join(value.lower().split())
+
+    def add(self, value: Optional[str], count: int = 1):
+        if not value or not value.strip():
+            return
+        key = self.normalize(value)
+        if key not in self._counts:
+            insort(self._keys, key)
+            self._counts[key] = 0
+            self._display[key] = value.strip()
+        self._counts[key] += count
+        self._top_cache.clear()
+
+    def remove(self, value: Optional[str], count: int = 1):
+        if not value or not value.strip():
+            return
+        key = self.normalize(value)
+        if key not in self._counts:
+            return
+        self._counts[key] -= count
+        if self._counts[key] <= 0:
+            del self._counts[key]
+            del self._display[key]
+            self._keys.pop(bisect_left(self._keys, key))
+        self._top_cache.clear()
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Most frequent values starting with prefix, as (value, count) pairs"""
+        prefix = self.normalize(prefix)
+        if not prefix:
+            return []
+        cacheable = len(prefix) <= CACHED_PREFIX_LENGTH
+        if cacheable and prefix in self._top_cache and len(self._top_cache[prefix]) >= limit:
+            return self._top_cache[prefix][:limit]
+
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + "\uffff", lo)
+        top = heapq.nlargest(limit, self._keys[lo:hi], key=self._counts.__getitem__)
+        results = [(self._display[key], self._counts[key]) for key in top]
+        if cacheable:
+            self._top_cache[prefix] = results
+        return results
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class JobSuggestService:
+    """City and title typeahead over active job postings, kept in memory.
+
+    The indexes are rebuilt from the database every
+    job_suggest_refresh_seconds, so postings created, edited or expired
+    through other workers (including by the expiry scheduler) show up.
+    """
+
+    FIELDS = ("city", "title")
+
+    def __init__(self):
+        self.indexes = {field: PrefixIndex() for field in self.FIELDS}
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    async def _load() -> Dict[str, PrefixIndex]:
+        indexes = {}
+        for field, column in (("city", "locationCity"), ("title", "title")):
+            groups = await prisma.jobposting.group_by(
+                by=[column],
+                where={"isActive": True},
+                count=True,
+            )
+            index = indexes[field] = PrefixIndex()
+            for group in groups:
+                index.add(group.get(column), group["_count"]["_all"])
+        return indexes
+
+    async def _refresh(self):
+        try:
+            # Counts are popularity hints, so a change racing the rebuild is left to the next one
+            self.indexes = await self._load()
+            self._loaded_at = time.monotonic()
+        except Exception as e:
+            print(f"Suggest index refresh failed: {e}")
+        finally:
+            self._refreshing = False
+
+    async def ensure_loaded(self):
+        """Build the indexes from distinct values on first use and refresh them in the background once they're old"""
+        if self._loaded_at is not None:
+            if not self._refreshing and time.monotonic() - self._loaded_at > settings.job_suggest_refresh_seconds:
+                self._refreshing = True
+                asyncio.create_task(self._refresh())
+            return
+        async with self._lock:
+            if self._loaded_at is None:
+                self.indexes = await self._load()
+                self._loaded_at = time.monotonic()
+
+    def add_job(self, job_posting):
+        if self._loaded_at is None or not job_posting.isActive:
+            return
+        self.indexes["city"].add(job_posting.locationCity)
+        self.indexes["title"].add(job_posting.title)
+
+    def remove_job(self, job_posting):
+        if self._loaded_at is None or not job_posting.isActive:
+            return
+        self.indexes["city"].remove(job_posting.locationCity)
+        self.indexes["title"].remove(job_posting.title)
+
+    async def suggest(self, field: str, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        await self.ensure_loaded()
+        return self.indexes[field].suggest(prefix, limit)
+
+# Global suggest service
+job_suggest = JobSuggestService()
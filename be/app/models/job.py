@@ -22,6 +22,7 @@ class JobPostingBase(BaseModel):
     salary_max: Optional[int] = Field(None, alias="salaryMax")
     category_id: Optional[str] = Field(None, alias="categoryId")
     application_steps: List[str] = Field(default=["personal_info", "review_submit"], alias="applicationSteps")
+    expires_at: Optional[datetime] = Field(None, alias="expiresAt")
 
     class Config:
         populate_by_name = True
@@ -40,6 +41,7 @@ class JobPostingUpdate(BaseModel):
     category_id: Optional[str] = Field(None, alias="categoryId")
     application_steps: Optional[List[str]] = Field(None, alias="applicationSteps")
     is_active: Optional[bool] = Field(None, alias="isActive")
+    expires_at: Optional[datetime] = Field(None, alias="expiresAt")
 
     class Config:
         populate_by_name = True
@@ -54,6 +56,12 @@ class JobPosting(JobPostingBase):
     employer: Optional[UserProfile] = None
     category: Optional['JobCategory'] = None
     locationStateRef: Optional['USState'] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    distanceMiles: Optional[float] = None
+    archivedAt: Optional[datetime] = None
+    # Id of the active posting this one is a near-duplicate of
+    duplicateOf: Optional[str] = None
     _count: Optional[dict] = None
     applicationCount: Optional[int] = None
 
@@ -73,6 +81,30 @@ class JobApplicationUpdate(BaseModel):
     status: Optional[ApplicationStatus] = None
     cover_letter: Optional[str] = None
 
+class ApplicationBulkFilter(BaseModel):
+    job_posting_id: Optional[str] = Field(None, alias="jobPostingId")
+    status: Optional[ApplicationStatus] = None
+
+    class Config:
+        populate_by_name = True
+
+class ApplicationBulkStatusUpdate(BaseModel):
+    status: ApplicationStatus
+    application_ids: Optional[List[str]] = Field(None, alias="applicationIds", max_length=1000)
+    filter: Optional[ApplicationBulkFilter] = None
+
+    class Config:
+        populate_by_name = True
+
+class SkippedApplication(BaseModel):
+    id: str
+    reason: str
+
+class ApplicationBulkStatusResult(BaseModel):
+    updated: int
+    updatedIds: List[str]
+    skipped: List[SkippedApplication]
+
 class JobApplication(BaseModel):
     id: str
     jobPostingId: str
@@ -84,6 +116,7 @@ class JobApplication(BaseModel):
     updatedAt: datetime
     jobPosting: Optional[Any] = None
     jobSeeker: Optional[Any] = None
+    archivedAt: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -105,3 +138,109 @@ class USState(BaseModel):
 
     class Config:
         from_attributes = True
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+class JobFacets(BaseModel):
+    total: int
+    categories: List[FacetCount]
+    states: List[FacetCount]
+    salaryBands: List[FacetCount]
+
+class Suggestion(BaseModel):
+    value: str
+    count: int
+
+class JobRecommendation(BaseModel):
+    score: float
+    jobPosting: JobPosting
+
+class CandidateSummary(BaseModel):
+    """Public part of a seeker profile; contact details are only shared through applications"""
+    id: str
+    name: str
+    locationState: Optional[str] = None
+    locationCity: Optional[str] = None
+    skills: List[str] = []
+
+    class Config:
+        from_attributes = True
+
+class CandidateMatch(BaseModel):
+    score: float
+    candidate: CandidateSummary
+
+class CandidateSearchHit(BaseModel):
+    matchedSkills: List[str]
+    candidate: CandidateSummary
+
+class CandidateSearchPage(BaseModel):
+    total: int
+    items: List[CandidateSearchHit]
+
+class SavedSearchFilters(BaseModel):
+    category_id: Optional[str] = None
+    state_id: Optional[str] = None
+    city: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    search: Optional[str] = None
+    near: Optional[str] = None
+    radius: Optional[float] = None
+
+class SavedSearchCreate(BaseModel):
+    name: str
+    filters: SavedSearchFilters
+
+class SavedSearch(BaseModel):
+    id: str
+    jobSeekerId: str
+    name: str
+    filters: SavedSearchFilters
+    createdAt: datetime
+
+    class Config:
+        from_attributes = True
+
+class JobAlert(BaseModel):
+    id: str
+    savedSearchId: str
+    jobPostingId: str
+    readAt: Optional[datetime] = None
+    createdAt: datetime
+    jobPosting: Optional[JobPosting] = None
+    savedSearch: Optional[SavedSearch] = None
+
+    class Config:
+        from_attributes = True
+
+class NamedRef(BaseModel):
+    name: Optional[str] = None
+
+class CompanyRef(BaseModel):
+    companyName: Optional[str] = None
+
+class ApplicationHistoryJob(BaseModel):
+    id: str
+    title: str
+    locationCity: Optional[str] = None
+    salaryMin: Optional[int] = None
+    salaryMax: Optional[int] = None
+    isActive: bool
+    employer: CompanyRef
+    category: Optional[NamedRef] = None
+    locationStateRef: Optional[NamedRef] = None
+
+class ApplicationHistoryItem(BaseModel):
+    id: str
+    jobPostingId: str
+    status: ApplicationStatus
+    appliedAt: datetime
+    updatedAt: datetime
+    jobPosting: ApplicationHistoryJob
+
+class ApplicationHistoryPage(BaseModel):
+    items: List[ApplicationHistoryItem]
+    nextCursor: Optional[str] = None
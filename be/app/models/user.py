@@ -44,9 +44,13 @@ class UserProfile(UserProfileBase):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
     location_state_name: Optional[str] = Field(None, alias="locationStateName")
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     job_postings: Optional[List[Any]] = Field(None, alias="jobPostings")
     applications: Optional[List[Any]] = Field(None, alias="applications")
     location_state_ref: Optional[Any] = Field(None, alias="locationStateRef")
+    resume_name: Optional[str] = Field(None, alias="resumeName")
+    resume_size: Optional[int] = Field(None, alias="resumeSize")
 
     class Config:
         from_attributes = True
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Flag near-duplicate job postings already in the database.
+
+Active postings are visited oldest first through the same MinHash LSH
+index the API uses, so the earliest copy of an employer's job stays the
+original and its later reposts get duplicateOf pointing at it. Only rows
+whose flag changes are written, so the script can be re-run. Running API
+workers pick up the new flags at their next duplicate index refresh.
+
+    uv run python backfill_dedupe.py [--dry-run]
+"""
+import argparse
+import asyncio
+from app.core.database import prisma
+from app.core.dedupe import DuplicateIndex, minhash, posting_text
+
+PAGE_SIZE = 1000
+
+async def backfill_duplicates(dry_run: bool = False):
+    """Recompute duplicateOf for every active posting"""
+    await prisma.connect()
+    index = DuplicateIndex()
+    scanned = flagged = changed = 0
+    cursor = None
+
+    try:
+        while True:
+            where = {"isActive": True}
+            if cursor:
+                # Keyset on (createdAt, id) keeps each page query cheap on a large table
+                created_at, job_id = cursor
+                where["OR"] = [
+                    {"createdAt": {"gt": created_at}},
+                    {"createdAt": created_at, "id": {"gt": job_id}},
+                ]
+            page = await prisma.jobposting.find_many(
+                where=where,
+                order=[{"createdAt": "asc"}, {"id": "asc"}],
+                take=PAGE_SIZE,
+            )
+            if not page:
+                break
+
+            for job_posting in page:
+                signature = minhash(posting_text(job_posting.title, job_posting.description, job_posting.requirements))
+                duplicate_of = index.find(signature, job_posting.employerId)
+                index.add(job_posting.id, signature, job_posting.employerId, duplicate_of)
+                scanned += 1
+                if duplicate_of:
+                    flagged += 1
+                if duplicate_of != job_posting.duplicateOf:
+                    changed += 1
+                    if not dry_run:
+                        await prisma.jobposting.update(
+                            where={"id": job_posting.id},
+                            data={"duplicateOf": duplicate_of},
+                        )
+
+            cursor = (page[-1].createdAt, page[-1].id)
+            print(f"Scanned {scanned} postings, {flagged} duplicates, {changed} changed")
+
+        print(f"Done{' (dry run, nothing written)' if dry_run else ''}: "
+              f"{scanned} active postings, {flagged} near-duplicates, {changed} flags changed")
+    except Exception as e:
+        print(f"Error backfilling duplicates: {e}")
+    finally:
+        await prisma.disconnect()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+    asyncio.run(backfill_duplicates(args.dry_run))
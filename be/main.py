@@ -1,44 +1,128 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
-from app.core.database import prisma
-from app.api.main import api_router
+from app.core.config import get_settings
+from app.core.startup import StartupTimer
 import uvicorn
 
-app = FastAPI(
-    title="Job Portal API",
-    description="Backend API for Blue-Collar & White-Collar Job Board Platform",
-    version="0.1.0"
-)
-
-# Configure CORS  
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["accept", "accept-encoding", "authorization", "content-type", "dnt", "origin", "user-agent", "x-csrftoken", "x-requested-with", "x-csrf-token"],
-    expose_headers=["*"],
-)
-
-# Include API routes
-app.include_router(api_router, prefix="/api/v1")
-
-@app.on_event("startup")
-async def startup():
-    await prisma.connect()
-
-@app.on_event("shutdown")
-async def shutdown():
-    await prisma.disconnect()
-
-@app.get("/")
-async def root():
-    return {"message": "Job Portal API is running!"}
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+
+def create_app() -> FastAPI:
+    """Build the API app, timing each startup phase.
+
+    The routers and the services behind them are imported here rather than
+    at module level, so the timings (app.state.startup_timer, also served
+    under /metrics) show where a cold start spends its time.
+    """
+    timer = StartupTimer()
+
+    with timer.phase("settings"):
+        settings = get_settings()
+
+    with timer.phase("imports"):
+        from app.core.database import prisma, prisma_read, has_replica, connect_with_retry
+        from app.core.health import RequestTracker, lifecycle, readiness
+        from app.core.replica import ReadYourWritesMiddleware
+        from app.core.admission import AdmissionControlMiddleware, admission_controller
+        from app.core.cache import job_detail_cache, job_listing_cache
+        from app.core.compression import CompressionMiddleware
+        from app.core.events import event_hub
+        from app.core.scheduler import scheduler
+        from app.core.archive import expire_job_postings, archive_job_postings
+        from app.core.partitions import create_application_partitions
+        from app.core.storage import remove_orphaned_resumes
+        from app.api.main import api_router
+
+    with timer.phase("routes"):
+        app = FastAPI(
+            title="Job Portal API",
+            description="Backend API for Blue-Collar & White-Collar Job Board Platform",
+            version="0.1.0"
+        )
+        app.state.startup_timer = timer
+
+        # Count in-flight requests for readiness and the shutdown drain
+        app.add_middleware(RequestTracker)
+
+        # Send a client's reads to the primary for a moment after its own writes
+        app.add_middleware(ReadYourWritesMiddleware)
+
+        # Rate limit and shed load before requests reach the routers; CORS stays
+        # outermost so rejections still carry CORS headers
+        app.add_middleware(AdmissionControlMiddleware)
+
+        # gzip/brotli for JSON, NDJSON and CSV bodies, negotiated via Accept-Encoding
+        app.add_middleware(CompressionMiddleware)
+
+        # Configure CORS
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["http://localhost:3000"],
+            allow_credentials=True,
+            allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+            allow_headers=["accept", "accept-encoding", "authorization", "content-type", "dnt", "origin", "user-agent", "x-csrftoken", "x-requested-with", "x-csrf-token"],
+            expose_headers=["*"],
+        )
+
+        # Background maintenance keeps job_postings down to the working set
+        scheduler.add_task("expire_job_postings", settings.maintenance_interval_seconds, expire_job_postings)
+        scheduler.add_task("archive_job_postings", settings.maintenance_interval_seconds, archive_job_postings)
+        scheduler.add_task("create_application_partitions", 24 * 3600, create_application_partitions)
+        scheduler.add_task("remove_orphaned_resumes", settings.maintenance_interval_seconds, remove_orphaned_resumes)
+
+        # Include API routes
+        app.include_router(api_router, prefix="/api/v1")
+
+        @app.get("/")
+        async def root():
+            return {"message": "Job Portal API is running!"}
+
+        @app.get("/health")
+        async def health_check():
+            return {"status": "healthy"}
+
+        @app.get("/ready")
+        async def readiness_check():
+            """Database ping and pool pressure; 503 while draining or when a database is unreachable"""
+            report = await readiness()
+            return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+        @app.get("/metrics")
+        async def metrics():
+            """Admission counters per route class, cache statistics and startup timings"""
+            return {
+                "admission": admission_controller.stats(),
+                "jobDetailCache": job_detail_cache.stats(),
+                "jobListingCache": job_listing_cache.stats(),
+                "startup": timer.report(),
+            }
+
+    @app.on_event("startup")
+    async def startup():
+        with timer.phase("db_connect"):
+            await connect_with_retry(prisma)
+            if has_replica():
+                await connect_with_retry(prisma_read)
+        await event_hub.start()
+        # Report draining and close event streams on SIGTERM, before the server stops listening
+        lifecycle.on_drain(event_hub.close_subscriptions)
+        lifecycle.install_signal_handler()
+        if settings.maintenance_enabled:
+            await scheduler.start()
+        print(timer.summary())
+
+    @app.on_event("shutdown")
+    async def shutdown():
+        await lifecycle.drain()
+        await scheduler.stop()
+        await event_hub.stop()
+        await prisma.disconnect()
+        if has_replica():
+            await prisma_read.disconnect()
+
+    return app
+
+
+app = create_app()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
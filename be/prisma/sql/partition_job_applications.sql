@@ -0,0 +1,127 @@
+-- Convert job_applications into a table range-partitioned by applied_at month.
+--
+-- Run once against a database created by `prisma db push`:
+--   psql "$DATABASE_URL" -f prisma/sql/partition_job_applications.sql
+--
+-- The existing table is renamed, its rows copied into the new partitioned
+-- table and then dropped, all in one transaction.
+--
+-- A partitioned table can only enforce uniqueness on keys that include the
+-- partition column, so the primary key is (id, applied_at) and the
+-- (job_posting_id, job_seeker_id) rule lives in job_application_keys, kept
+-- in step by the triggers below. schema.prisma declares the same keys,
+-- indexes and job_application_keys table, so later `prisma db push` runs
+-- leave the partitioned table alone; to double-check before pushing, review
+--   prisma migrate diff --from-url "$DATABASE_URL" --to-schema-datamodel prisma/schema.prisma --script
+--
+-- New monthly partitions are created ahead of time by the app's scheduler
+-- through create_job_application_partitions(); the default partition
+-- catches anything that arrives before its month exists.
+
+BEGIN;
+
+ALTER TABLE job_applications RENAME TO job_applications_unpartitioned;
+ALTER INDEX job_applications_pkey RENAME TO job_applications_unpartitioned_pkey;
+ALTER INDEX IF EXISTS job_applications_job_seeker_id_applied_at_id_idx
+    RENAME TO job_applications_unpartitioned_job_seeker_id_applied_at_id_idx;
+ALTER INDEX IF EXISTS job_applications_job_posting_id_job_seeker_id_idx
+    RENAME TO job_applications_unpartitioned_job_posting_id_job_seeker_id_idx;
+-- Left by schemas from before the composite primary key
+ALTER INDEX IF EXISTS job_applications_job_posting_id_job_seeker_id_key
+    RENAME TO job_applications_unpartitioned_job_posting_id_job_seeker_id_key;
+
+CREATE TABLE job_applications (
+    id               TEXT NOT NULL,
+    job_posting_id   TEXT NOT NULL,
+    job_seeker_id    TEXT NOT NULL,
+    status           "ApplicationStatus" NOT NULL DEFAULT 'applied',
+    cover_letter     TEXT,
+    application_data JSONB,
+    applied_at       TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at       TIMESTAMP(3) NOT NULL,
+    CONSTRAINT job_applications_pkey PRIMARY KEY (id, applied_at),
+    CONSTRAINT job_applications_job_posting_id_fkey FOREIGN KEY (job_posting_id)
+        REFERENCES job_postings (id) ON DELETE CASCADE ON UPDATE CASCADE,
+    CONSTRAINT job_applications_job_seeker_id_fkey FOREIGN KEY (job_seeker_id)
+        REFERENCES user_profiles (id) ON DELETE CASCADE ON UPDATE CASCADE
+) PARTITION BY RANGE (applied_at);
+
+-- Created on the parent, so every partition gets a local copy
+CREATE INDEX job_applications_job_posting_id_job_seeker_id_idx
+    ON job_applications (job_posting_id, job_seeker_id);
+CREATE INDEX job_applications_job_seeker_id_applied_at_id_idx
+    ON job_applications (job_seeker_id, applied_at DESC, id DESC);
+
+CREATE TABLE job_applications_default PARTITION OF job_applications DEFAULT;
+
+-- Creates the monthly partitions from `from_month` through `months_ahead`
+-- months past the current one; existing partitions are left alone
+CREATE OR REPLACE FUNCTION create_job_application_partitions(
+    months_ahead INTEGER,
+    from_month DATE DEFAULT date_trunc('month', CURRENT_DATE)::date
+) RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::date;
+    last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => months_ahead))::date;
+    partition_name TEXT;
+    created INTEGER := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        partition_name := 'job_applications_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF job_applications FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + INTERVAL '1 month')::date
+            );
+            created := created + 1;
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT create_job_application_partitions(
+    2,
+    COALESCE((SELECT min(applied_at)::date FROM job_applications_unpartitioned), CURRENT_DATE)
+);
+
+-- One row per (posting, seeker) pair enforces the unique rule; `prisma db push`
+-- has usually created it already, empty, from the JobApplicationKey model
+CREATE TABLE IF NOT EXISTS job_application_keys (
+    job_posting_id TEXT NOT NULL,
+    job_seeker_id  TEXT NOT NULL,
+    CONSTRAINT job_application_keys_pkey PRIMARY KEY (job_posting_id, job_seeker_id)
+);
+TRUNCATE job_application_keys;
+
+CREATE OR REPLACE FUNCTION job_application_keys_sync() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO job_application_keys (job_posting_id, job_seeker_id)
+        VALUES (NEW.job_posting_id, NEW.job_seeker_id);
+        RETURN NEW;
+    END IF;
+    DELETE FROM job_application_keys
+    WHERE job_posting_id = OLD.job_posting_id AND job_seeker_id = OLD.job_seeker_id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER job_application_keys_insert
+    BEFORE INSERT ON job_applications
+    FOR EACH ROW EXECUTE FUNCTION job_application_keys_sync();
+
+CREATE TRIGGER job_application_keys_delete
+    AFTER DELETE ON job_applications
+    FOR EACH ROW EXECUTE FUNCTION job_application_keys_sync();
+
+-- Goes through the insert trigger, which fills job_application_keys
+INSERT INTO job_applications
+    (id, job_posting_id, job_seeker_id, status, cover_letter, application_data, applied_at, updated_at)
+SELECT id, job_posting_id, job_seeker_id, status, cover_letter, application_data, applied_at, updated_at
+FROM job_applications_unpartitioned;
+
+DROP TABLE job_applications_unpartitioned;
+
+COMMIT;
@@ -0,0 +1,20 @@
+from app.core.geo import geocode, load_gazetteer, parse_near
+
+
+def test_gazetteer_cities_resolve_to_their_own_coordinates():
+    assert parse_near("Austin, TX") == load_gazetteer()[("austin", "TX")]
+    assert parse_near("saint paul, mn") == parse_near("St. Paul, MN")
+
+
+def test_unlisted_or_misspelled_cities_are_not_geocoded():
+    # A made-up point would put the posting inside radius searches it doesn't belong to
+    assert ("marfa", "TX") not in load_gazetteer()
+    assert geocode("Marfa", "TX") is None
+    assert parse_near("Austn, TX") is None
+    assert parse_near("asdfgh, CA") is None
+
+
+def test_unknown_state_or_malformed_value_is_rejected():
+    assert parse_near("Springfield, XX") is None
+    assert parse_near("Springfield") is None
+    assert geocode("", "TX") is None
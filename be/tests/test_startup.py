@@ -0,0 +1,64 @@
+"""Cold-start checks for the app factory.
+
+Each check runs in a fresh interpreter, since modules imported by an
+earlier test would otherwise hide import-time work.
+"""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Generous ceiling for building the app; a cold import of fastapi alone takes a few hundred ms
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 5000))
+
+
+def run_fresh(code: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_importing_app_modules_does_not_read_settings():
+    report = run_fresh("""
+        import importlib, json, pkgutil
+        import app.api, app.core
+        from app.core.config import get_settings
+
+        for package in (app.core, app.api):
+            for module in pkgutil.iter_modules(package.__path__):
+                importlib.import_module(f"{package.__name__}.{module.name}")
+        print(json.dumps({"settingsLoaded": get_settings.cache_info().currsize}))
+    """)
+    assert report["settingsLoaded"] == 0
+
+
+def test_create_app_times_each_startup_phase():
+    report = run_fresh("""
+        import json
+        from main import app
+        print(json.dumps(app.state.startup_timer.report()))
+    """)
+    assert list(report["phasesMs"]) == ["settings", "imports", "routes"]
+    assert report["totalMs"] < STARTUP_BUDGET_MS, report
+
+
+def test_create_app_defers_heavy_imports():
+    # The generated Prisma client and numpy are loaded by the first query or index build instead
+    report = run_fresh("""
+        import json, sys
+        from main import app
+        print(json.dumps({"loaded": sorted(
+            name for name in ("prisma", "prisma.client", "numpy", "scipy") if name in sys.modules
+        )}))
+    """)
+    assert report["loaded"] == []
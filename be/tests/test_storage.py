@@ -0,0 +1,131 @@
+import hashlib
+import os
+import time
+
+import pytest
+
+from app.core.storage import (
+    LocalStorageBackend, StorageError, StorageLimitError,
+    receive_multipart_file, remove_orphaned_files,
+)
+
+BOUNDARY = "test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart_body(content: bytes, filename: str = "resume.pdf", content_type: str = "application/pdf") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="note"\r\n\r\n'
+        "ignored\r\n"
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + content + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+async def chunked(body: bytes, size: int = 7):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return LocalStorageBackend(str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_commit_stores_content_under_its_hash(backend):
+    writer = backend.writer(max_bytes=1024)
+    await writer.write(b"hello ")
+    await writer.write(b"world")
+    stored = await writer.commit()
+
+    assert stored.key == hashlib.sha256(b"hello world").hexdigest()
+    assert stored.size == 11 and stored.created
+    assert backend.path(stored.key).read_bytes() == b"hello world"
+    assert await backend.exists(stored.key)
+    assert list(backend.temp_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_identical_content_is_stored_once(backend):
+    first = backend.writer(max_bytes=1024)
+    await first.write(b"same")
+    second = backend.writer(max_bytes=1024)
+    await second.write(b"same")
+
+    assert (await first.commit()).created
+    stored = await second.commit()
+    assert not stored.created
+    assert [path.name for path in backend.root.glob("??/??/*")] == [stored.key]
+
+
+@pytest.mark.asyncio
+async def test_empty_upload_is_stored(backend):
+    stored = await backend.writer(max_bytes=1024).commit()
+    assert stored.key == hashlib.sha256(b"").hexdigest()
+    assert backend.path(stored.key).read_bytes() == b""
+
+
+@pytest.mark.asyncio
+async def test_size_limit_aborts_and_removes_temp_file(backend):
+    writer = backend.writer(max_bytes=4)
+    await writer.write(b"1234")
+    with pytest.raises(StorageLimitError):
+        await writer.write(b"5")
+    assert not backend.temp_dir.exists() or list(backend.temp_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_receive_multipart_file_streams_the_file_field(backend):
+    content = os.urandom(3000)
+    stored, filename, content_type = await receive_multipart_file(
+        chunked(multipart_body(content, filename="C:\\Users\\me\\cv.pdf")),
+        CONTENT_TYPE,
+        backend.writer(max_bytes=10_000),
+        allowed_types={"application/pdf"},
+    )
+    assert filename == "cv.pdf"
+    assert content_type == "application/pdf"
+    assert backend.path(stored.key).read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_receive_multipart_file_refuses_disallowed_types(backend):
+    with pytest.raises(StorageError, match="Unsupported file type"):
+        await receive_multipart_file(
+            chunked(multipart_body(b"MZ...", content_type="application/x-msdownload")),
+            CONTENT_TYPE,
+            backend.writer(max_bytes=10_000),
+            allowed_types={"application/pdf"},
+        )
+    assert list(backend.root.glob("??/??/*")) == []
+
+
+@pytest.mark.asyncio
+async def test_receive_multipart_file_requires_the_field(backend):
+    body = f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="note"\r\n\r\nx\r\n--{BOUNDARY}--\r\n'.encode()
+    with pytest.raises(StorageError, match="Missing 'file'"):
+        await receive_multipart_file(chunked(body), CONTENT_TYPE, backend.writer(max_bytes=10_000))
+
+
+@pytest.mark.asyncio
+async def test_remove_orphaned_files_keeps_referenced_and_recent_blobs(backend):
+    keys = []
+    for content in (b"kept", b"orphan", b"recent"):
+        writer = backend.writer(max_bytes=1024)
+        await writer.write(content)
+        keys.append((await writer.commit()).key)
+    kept, orphan, recent = keys
+    old = time.time() - 3600
+    for key in (kept, orphan):
+        os.utime(backend.path(key), (old, old))
+
+    async def is_referenced(batch):
+        return {kept} & set(batch)
+
+    assert await remove_orphaned_files(backend, is_referenced, grace_seconds=60) == 1
+    assert await backend.exists(kept)
+    assert not await backend.exists(orphan)
+    assert await backend.exists(recent)
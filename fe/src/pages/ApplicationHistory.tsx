@@ -5,6 +5,7 @@ import { useAuth } from '../hooks/useAuth';
 
 interface AppliedJob {
   jobId: string;
+  status: string;
   appliedAt: string;
 }
 
@@ -25,35 +26,59 @@ interface JobPosting {
   salaryMax?: number | null;
 }
 
+// Applications fetched per page; "Load more" follows nextCursor for the rest
+const PAGE_SIZE = 20;
+
+const STATUS_OPTIONS = [
+  { value: '', label: 'All Statuses' },
+  { value: 'applied', label: 'Applied' },
+  { value: 'reviewed', label: 'Reviewed' },
+  { value: 'interview', label: 'Interview' },
+  { value: 'hired', label: 'Hired' },
+  { value: 'rejected', label: 'Rejected' },
+];
+
 const ApplicationHistory: React.FC = () => {
   const { isSignedIn, isLoaded } = useAuth();
   const navigate = useNavigate();
   const [appliedJobs, setAppliedJobs] = useState<AppliedJob[]>([]);
   const [jobDetails, setJobDetails] = useState<{ [key: string]: JobPosting }>({});
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [statusFilter, setStatusFilter] = useState<string>('');
 
   useEffect(() => {
     if (isLoaded && isSignedIn) {
+      setLoading(true);
       loadApplications();
     }
-  }, [isLoaded, isSignedIn]);
+  }, [isLoaded, isSignedIn, statusFilter]);
 
-  const loadApplications = async () => {
+  const loadApplications = async (cursor?: string) => {
     try {
-      console.log('🔍 ApplicationHistory: Loading applications from API');
+      console.log('🔍 ApplicationHistory: Loading applications from API', { cursor, statusFilter });
 
-      // Get applications from the API
-      const applications = await api.get('/jobs/applications');
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+      if (statusFilter) params.append('status', statusFilter);
+      if (cursor) params.append('cursor', cursor);
+
+      // Get one page of applications from the API
+      const page = await api.get(`/jobs/applications?${params.toString()}`);
+      const applications = page.items;
       console.log('✅ ApplicationHistory: Found applications:', applications);
 
       // Transform the API response to our expected format
-      const appliedJobsArray = applications.map((app: any) => ({
+      const appliedJobsArray: AppliedJob[] = applications.map((app: any) => ({
         jobId: app.jobPostingId,
+        status: app.status,
         appliedAt: app.appliedAt
       }));
 
-      setAppliedJobs(appliedJobsArray);
+      // A cursor means this page continues the list already shown
+      setAppliedJobs(previous => cursor ? [...previous, ...appliedJobsArray] : appliedJobsArray);
+      setNextCursor(page.nextCursor || null);
 
       // Create job details map from the API response
       const jobDetailsMap: { [key: string]: JobPosting } = {};
@@ -71,7 +96,7 @@ const ApplicationHistory: React.FC = () => {
         }
       }
 
-      setJobDetails(jobDetailsMap);
+      setJobDetails(previous => cursor ? { ...previous, ...jobDetailsMap } : jobDetailsMap);
       setError(null);
 
       console.log('✅ ApplicationHistory: Successfully loaded application history');
@@ -80,9 +105,52 @@ const ApplicationHistory: React.FC = () => {
       setError('Unable to load application history. Please try again later.');
     } finally {
       setLoading(false);
+      setLoadingMore(false);
+    }
+  };
+
+  const handleLoadMore = () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    loadApplications(nextCursor);
+  };
+
+  const getStatusColor = (status: string) => {
+    switch (status.toLowerCase()) {
+      case 'applied':
+        return '#f59e0b';
+      case 'reviewed':
+        return '#3b82f6';
+      case 'interview':
+        return '#8b5cf6';
+      case 'hired':
+        return '#10b981';
+      case 'rejected':
+        return '#ef4444';
+      default:
+        return '#6b7280';
     }
   };
 
+  const getStatusIcon = (status: string) => {
+    switch (status.toLowerCase()) {
+      case 'applied':
+        return '📝';
+      case 'reviewed':
+        return '👀';
+      case 'interview':
+        return '📅';
+      case 'hired':
+        return '✅';
+      case 'rejected':
+        return '❌';
+      default:
+        return '📄';
+    }
+  };
+
+  const formatStatus = (status: string) => status.charAt(0).toUpperCase() + status.slice(1);
+
   const handleViewJobDetails = (jobId: string) => {
     console.log('🔍 ApplicationHistory: Navigating to job details:', jobId);
     navigate(`/jobs/${jobId}`);
@@ -151,10 +219,37 @@ const ApplicationHistory: React.FC = () => {
         </h2>
         <p style={{
           color: '#6b7280',
-          margin: '0'
+          margin: '0 0 16px 0'
         }}>
           Track the status of your job applications
         </p>
+        <label style={{
+          display: 'block',
+          marginBottom: '8px',
+          fontSize: '14px',
+          fontWeight: '500',
+          color: '#374151'
+        }}>
+          Filter by Status
+        </label>
+        <select
+          value={statusFilter}
+          onChange={(e) => setStatusFilter(e.target.value)}
+          style={{
+            width: '100%',
+            maxWidth: '240px',
+            padding: '8px 12px',
+            border: '1px solid #d1d5db',
+            borderRadius: '6px',
+            fontSize: '14px'
+          }}
+        >
+          {STATUS_OPTIONS.map(option => (
+            <option key={option.value} value={option.value}>
+              {option.label}
+            </option>
+          ))}
+        </select>
       </div>
 
       {/* Applications List */}
@@ -177,13 +272,15 @@ const ApplicationHistory: React.FC = () => {
             marginBottom: '8px',
             fontSize: '20px'
           }}>
-            No applications yet
+            {statusFilter ? `No ${formatStatus(statusFilter).toLowerCase()} applications` : 'No applications yet'}
           </h3>
           <p style={{
             color: '#9ca3af',
             marginBottom: '24px'
           }}>
-            Start browsing jobs and apply to positions that interest you
+            {statusFilter
+              ? 'Try another status filter'
+              : 'Start browsing jobs and apply to positions that interest you'}
           </p>
         </div>
       ) : (
@@ -293,14 +390,14 @@ const ApplicationHistory: React.FC = () => {
                       alignItems: 'center',
                       gap: '8px',
                       padding: '6px 12px',
-                      backgroundColor: '#f59e0b20',
-                      color: '#f59e0b',
+                      backgroundColor: `${getStatusColor(appliedJob.status)}20`,
+                      color: getStatusColor(appliedJob.status),
                       borderRadius: '20px',
                       fontSize: '14px',
                       fontWeight: '500'
                     }}>
-                      <span>📝</span>
-                      <span>Applied</span>
+                      <span>{getStatusIcon(appliedJob.status)}</span>
+                      <span>{formatStatus(appliedJob.status)}</span>
                     </div>
                     <span style={{
                       color: '#9ca3af',
@@ -345,6 +442,28 @@ const ApplicationHistory: React.FC = () => {
         </div>
       )}
 
+      {/* Next page */}
+      {nextCursor && (
+        <div style={{ textAlign: 'center', marginTop: '24px' }}>
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            style={{
+              padding: '10px 20px',
+              backgroundColor: loadingMore ? '#9ca3af' : '#3b82f6',
+              color: 'white',
+              border: 'none',
+              borderRadius: '6px',
+              fontSize: '14px',
+              fontWeight: '500',
+              cursor: loadingMore ? 'default' : 'pointer'
+            }}
+          >
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
+
       {/* Summary Stats */}
       {appliedJobs.length > 0 && (
         <div style={{
@@ -379,13 +498,13 @@ const ApplicationHistory: React.FC = () => {
                 color: '#f59e0b',
                 marginBottom: '4px'
               }}>
-                {appliedJobs.length}
+                {appliedJobs.length}{nextCursor ? '+' : ''}
               </div>
               <div style={{
                 fontSize: '14px',
                 color: '#6b7280'
               }}>
-                Total Applications
+                {statusFilter ? `${formatStatus(statusFilter)} Applications` : 'Total Applications'}
               </div>
             </div>
             <div style={{